@@ -3,13 +3,53 @@ from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
+
 class EmailBackend(ModelBackend):
-    def authenticate(self, request, username=None, password=None, **kwargs):
+    """
+    The credential backend (after axes): one user query per attempt.
+
+    • Login page: authenticate(request, email=..., password=...)
+    • Admin login: authenticate(request, username=..., password=...)
+    • Unknown accounts still run the password hasher, so a miss takes
+      as long as a wrong password
+    Permissions come from ModelBackend; get_user() joins the LGA so the
+    user snapshot needs no second query.
+    """
+
+    def authenticate(self, request, username=None, password=None, email=None, **kwargs):
+        if password is None:
+            return None
+
+        if email is not None:
+            lookup = {"email": email}
+        elif username is not None:
+            lookup = {User.USERNAME_FIELD: username}
+        else:
+            return None
+
         try:
-            user = User.objects.get(email=username)
+            user = User._default_manager.get(**lookup)
         except User.DoesNotExist:
+            # Dummy hash: same cost as checking a real password
+            User().set_password(password)
             return None
 
         if user.check_password(password) and self.user_can_authenticate(user):
             return user
         return None
+
+    def get_user(self, user_id):
+        try:
+            user = User._default_manager.select_related("lga").get(pk=user_id)
+        except User.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
+
+
+def axes_username(request, credentials=None):
+    """
+    AXES_USERNAME_CALLABLE: the login page sends `email`, the admin
+    sends `username`.
+    """
+    source = credentials or getattr(request, "POST", None) or {}
+    return source.get("email") or source.get("username")
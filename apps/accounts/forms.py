@@ -3,7 +3,7 @@ from django.contrib.auth.forms import UserCreationForm
 from django.core.exceptions import ValidationError
 
 from .models import User
-from apps.lgas.models import LGA
+from apps.lgas.forms import ActiveLGAChoiceField, ActiveLGAFormMixin
 
 import uuid
 import re
@@ -142,12 +142,15 @@ class SignupForm(UserCreationForm):
 # ======================================================
 # LGA OFFICER ASSIGNMENT FORM (DASHBOARD USE)
 # ======================================================
-class LGAOfficerAssignmentForm(forms.ModelForm):
+class LGAOfficerAssignmentForm(ActiveLGAFormMixin, forms.ModelForm):
     """
     Allows LGA Officers to select an active LGA.
     Must be instantiated with `user=request.user`.
     """
 
+    # Active LGAs only, served from the process-local cache
+    lga = ActiveLGAChoiceField(required=False)
+
     class Meta:
         model = User
         fields = ("lga",)
@@ -156,9 +159,6 @@ class LGAOfficerAssignmentForm(forms.ModelForm):
         user = kwargs.pop("user", None)
         super().__init__(*args, **kwargs)
 
-        # Restrict to active LGAs only
-        self.fields["lga"].queryset = LGA.objects.filter(is_active=True)
-
         # Only LGA officers may interact
         if not user or user.role != User.ROLE_LGA_OFFICER:
             self.fields["lga"].disabled = True
@@ -0,0 +1,86 @@
+import random
+import time
+import uuid
+
+from axes.models import AccessAttempt, AccessFailureLog, AccessLog
+from django.conf import settings
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+
+class Command(BaseCommand):
+    help = "Benchmark the login pipeline: requests/s and user queries per attempt"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=20, help="Attempts per case")
+
+    def _host(self):
+        host = next((h for h in settings.ALLOWED_HOSTS if h != "*"), "localhost")
+        return "bench" + host if host.startswith(".") else host
+
+    def _user_queries(self, email, password):
+        request = RequestFactory().post("/accounts/login/", REMOTE_ADDR="192.0.2.1")
+        with CaptureQueriesContext(connection) as queries:
+            authenticate(request, email=email, password=password)
+        table = get_user_model()._meta.db_table
+        return sum(f'"{table}"' in query["sql"] for query in queries.captured_queries)
+
+    def _bench(self, email, password, count):
+        client = Client(HTTP_HOST=self._host())
+        started = time.monotonic()
+        for n in range(count):
+            # Own address per attempt so axes does not lock the run out
+            client.post(
+                "/accounts/login/",
+                {"username": email, "password": password},
+                secure=True,
+                REMOTE_ADDR=f"198.51.100.{n % 250 + 1}",
+            )
+            client.cookies.clear()
+        elapsed = time.monotonic() - started
+        return count / elapsed, elapsed / count
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG:
+            raise CommandError("Refusing to run with DEBUG off: this creates and deletes a test user.")
+
+        tag = uuid.uuid4().hex[:8]
+        email = f"bench-{tag}@example.com"
+        password = uuid.uuid4().hex
+        user = get_user_model().objects.create_user(
+            f"bench-{tag}",
+            email,
+            password,
+            full_name="Login Benchmark",
+            phone="08000000000",
+            nin="".join(random.choices("0123456789", k=11)),
+        )
+
+        cases = [
+            ("valid login", email, password),
+            ("wrong password", email, "not-the-password"),
+            ("unknown email", f"nobody-{tag}@example.com", password),
+        ]
+        count = options["requests"]
+
+        try:
+            self.stdout.write(f"{count} attempt(s) per case, hasher {get_hasher().algorithm}")
+            for label, case_email, case_password in cases:
+                queries = self._user_queries(case_email, case_password)
+                rps, latency = self._bench(case_email, case_password, count)
+                self.stdout.write(
+                    f"{label:>15}: {rps:6.1f} req/s, {latency * 1000:6.1f} ms/attempt, "
+                    f"{queries} user quer{'y' if queries == 1 else 'ies'}"
+                )
+        finally:
+            usernames = [email, f"nobody-{tag}@example.com"]
+            for model in (AccessAttempt, AccessFailureLog, AccessLog):
+                model.objects.filter(username__in=usernames).delete()
+            user.delete()
+
+        self.stdout.write(self.style.SUCCESS("Done."))
@@ -0,0 +1,130 @@
+import random
+import statistics
+import time
+import types
+import uuid
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from apps.accounts import middleware
+
+ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "cache": "django.contrib.sessions.backends.cache",
+    "file": "django.contrib.sessions.backends.file",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Browse as one signed-in user on a simulated clock and compare "
+        "request latency and session-table load across session engines"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Simulated seconds between requests",
+        )
+        parser.add_argument("--path", default="/accounts/profile/")
+        parser.add_argument(
+            "--engines",
+            default=None,
+            help=f"Comma-separated, from {', '.join(ENGINES)} (default: the configured engine)",
+        )
+
+    def _host(self):
+        host = next((h for h in settings.ALLOWED_HOSTS if h != "*"), "localhost")
+        return "bench" + host if host.startswith(".") else host
+
+    def _engines(self, names):
+        if not names:
+            return [settings.SESSION_ENGINE]
+        try:
+            return [ENGINES[name.strip()] for name in names.split(",")]
+        except KeyError as error:
+            raise CommandError(f"Unknown engine {error}; choose from {', '.join(ENGINES)}.")
+
+    def _browse(self, user, options):
+        """
+        (latencies, session reads, session writes, redirects)
+        """
+        clock = types.SimpleNamespace(now=1_000_000.0)
+        fake_time = types.SimpleNamespace(time=lambda: clock.now)
+        table = f'"{Session._meta.db_table}"'
+
+        client = Client(HTTP_HOST=self._host())
+        client.force_login(user)
+        latencies = []
+        reads = writes = redirected = 0
+        try:
+            with mock.patch.object(middleware, "time", fake_time):
+                for _ in range(options["requests"]):
+                    with CaptureQueriesContext(connection) as queries:
+                        started = time.perf_counter()
+                        response = client.get(options["path"], secure=True)
+                        latencies.append(time.perf_counter() - started)
+
+                    for query in queries.captured_queries:
+                        if table in query["sql"]:
+                            reads += query["sql"].startswith("SELECT")
+                            writes += query["sql"].startswith(("UPDATE", "INSERT"))
+                    redirected += response.status_code == 302
+                    clock.now += options["interval"]
+        finally:
+            client.logout()
+
+        return latencies, reads, writes, redirected
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG:
+            raise CommandError("Refusing to run with DEBUG off: this creates and deletes a test user.")
+
+        engines = self._engines(options["engines"])
+        count = options["requests"]
+
+        tag = uuid.uuid4().hex[:8]
+        user = get_user_model().objects.create_user(
+            f"bench-{tag}",
+            f"bench-{tag}@example.com",
+            None,
+            full_name="Session Benchmark",
+            phone="08000000000",
+            nin="".join(random.choices("0123456789", k=11)),
+        )
+
+        self.stdout.write(
+            f"{count} request(s) to {options['path']}, {options['interval']:g} simulated s apart, "
+            f"idle granularity {settings.IDLE_ACTIVITY_GRANULARITY} s"
+        )
+        redirected = 0
+        try:
+            for engine in engines:
+                with override_settings(SESSION_ENGINE=engine):
+                    latencies, reads, writes, engine_redirected = self._browse(user, options)
+                redirected += engine_redirected
+                p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+                self.stdout.write(
+                    f"{engine.rsplit('.', 1)[-1]:>15}: "
+                    f"mean {statistics.mean(latencies) * 1000:6.2f} ms, p95 {p95 * 1000:6.2f} ms, "
+                    f"session table {reads / count:.2f} read(s) + {writes / count:.2f} write(s) per request"
+                )
+        finally:
+            user.delete()
+
+        if redirected:
+            self.stdout.write(self.style.WARNING(f"{redirected} request(s) were redirected."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Done."))
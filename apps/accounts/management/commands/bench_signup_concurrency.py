@@ -0,0 +1,145 @@
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from requests.adapters import HTTPAdapter
+
+from apps.core.fake_gateways import running_fake_gateways
+
+SERVERS = {
+    "wsgi": ["lgac_project.wsgi:application"],
+    "asgi": ["lgac_project.asgi:application", "-k", "uvicorn_worker.UvicornWorker"],
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark concurrent NIN verifications against one gunicorn worker, "
+        "sync WSGI vs uvicorn ASGI, with VerifyMe faked at a fixed latency"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument(
+            "--latency",
+            default="fixed:300",
+            help="Fake VerifyMe latency spec (see fake_gateways)",
+        )
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument(
+            "--servers",
+            default="wsgi,asgi",
+            help="Comma-separated subset of: wsgi, asgi",
+        )
+
+    # =========================
+    # SERVER UNDER TEST
+    # =========================
+    def _start(self, name, port, fake):
+        env = {
+            **os.environ,
+            **{key: str(value) for key, value in fake.settings_overrides().items()},
+            "ENVIRONMENT": "production",  # staging mode skips VerifyMe
+        }
+        process = subprocess.Popen(
+            [
+                sys.executable, "-m", "gunicorn",
+                *SERVERS[name],
+                "--workers", "1",
+                "--bind", f"127.0.0.1:{port}",
+                "--log-level", "warning",
+            ],
+            cwd=settings.BASE_DIR,
+            env=env,
+        )
+
+        deadline = time.monotonic() + 20
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise CommandError(f"{name} server exited with {process.returncode}")
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                return process
+            except OSError:
+                time.sleep(0.1)
+
+        process.terminate()
+        raise CommandError(f"{name} server did not start on port {port}")
+
+    # =========================
+    # LOAD
+    # =========================
+    def _run(self, port, total, concurrency, first_nin):
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_maxsize=concurrency))
+        url = f"http://127.0.0.1:{port}/accounts/verify-nin/"
+        headers = {"Host": "bench.railway.app", "X-Forwarded-Proto": "https"}
+
+        def one(n):
+            started = time.monotonic()
+            try:
+                # Distinct NINs: measure VerifyMe waits, not cache hits
+                response = session.post(url, data={"nin": f"{first_nin + n:011d}"}, headers=headers, timeout=60)
+                ok = response.status_code == 200
+            except requests.RequestException:
+                ok = False
+            return ok, time.monotonic() - started
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(one, range(total)))
+        elapsed = time.monotonic() - started
+
+        latencies = sorted(seconds for _, seconds in results)
+        return {
+            "ok": sum(ok for ok, _ in results),
+            "elapsed": elapsed,
+            "rps": total / elapsed,
+            "p50": statistics.median(latencies),
+            "p95": latencies[int(len(latencies) * 0.95) - 1],
+        }
+
+    def handle(self, *args, **options):
+        names = [name.strip() for name in options["servers"].split(",") if name.strip()]
+        unknown = set(names) - set(SERVERS)
+        if unknown:
+            raise CommandError(f"Unknown server(s): {', '.join(sorted(unknown))}")
+
+        total, concurrency = options["requests"], options["concurrency"]
+        results = {}
+
+        with running_fake_gateways(latency=options["latency"]) as fake:
+            for offset, name in enumerate(names):
+                process = self._start(name, options["port"], fake)
+                try:
+                    results[name] = self._run(
+                        options["port"],
+                        total,
+                        concurrency,
+                        first_nin=10_000_000_000 + offset * total,
+                    )
+                finally:
+                    process.terminate()
+                    process.wait(timeout=10)
+
+        self.stdout.write(
+            f"{total} requests, concurrency {concurrency}, VerifyMe latency {options['latency']}, 1 worker"
+        )
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name}: {result['rps']:.1f} req/s, "
+                f"p50 {result['p50'] * 1000:.0f} ms, p95 {result['p95'] * 1000:.0f} ms, "
+                f"{result['ok']}/{total} ok in {result['elapsed']:.1f}s"
+            )
+
+        if "wsgi" in results and "asgi" in results:
+            speedup = results["asgi"]["rps"] / results["wsgi"]["rps"]
+            self.stdout.write(self.style.SUCCESS(f"ASGI throughput: {speedup:.1f}x WSGI"))
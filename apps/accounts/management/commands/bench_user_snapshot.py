@@ -0,0 +1,109 @@
+import random
+import statistics
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounts import snapshot
+from apps.lgas.models import LGA
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare cold and warm user snapshots: latency and user / LGA "
+        "queries per request for a citizen and an LGA officer page"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=50, help="Requests per case")
+
+    def _host(self):
+        host = next((h for h in settings.ALLOWED_HOSTS if h != "*"), "localhost")
+        return "bench" + host if host.startswith(".") else host
+
+    def _create_user(self, tag, **extra):
+        return get_user_model().objects.create_user(
+            f"bench-{tag}",
+            f"bench-{tag}@example.com",
+            None,
+            full_name="Snapshot Benchmark",
+            phone="0" + "".join(random.choices("0123456789", k=10)),
+            nin="".join(random.choices("0123456789", k=11)),
+            **extra,
+        )
+
+    def _bench(self, user, path, count, warm):
+        client = Client(HTTP_HOST=self._host())
+        client.force_login(user)
+        tables = {
+            "user": f'FROM "{get_user_model()._meta.db_table}"',
+            "LGA": f'FROM "{LGA._meta.db_table}"',
+        }
+
+        latencies = []
+        queries = {name: 0 for name in tables}
+        try:
+            # Untimed first request caches the snapshot for the warm case
+            client.get(path, secure=True)
+            for _ in range(count):
+                if not warm:
+                    cache.delete(snapshot.cache_key(user.pk))
+                with CaptureQueriesContext(connection) as captured:
+                    started = time.perf_counter()
+                    response = client.get(path, secure=True)
+                    latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    raise CommandError(f"{path} answered {response.status_code}.")
+                for name, table in tables.items():
+                    queries[name] += sum(table in query["sql"] for query in captured.captured_queries)
+        finally:
+            client.logout()
+
+        return latencies, {name: total / count for name, total in queries.items()}
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG:
+            raise CommandError("Refusing to run with DEBUG off: this creates and deletes test users.")
+        if not snapshot.enabled():
+            raise CommandError(
+                "The user snapshot is off with a per-process cache; set CACHE_BACKEND to a shared backend."
+            )
+
+        lga = LGA.objects.filter(is_active=True).order_by("pk").first()
+        if lga is None:
+            raise CommandError("Needs at least one active LGA.")
+
+        tag = uuid.uuid4().hex[:8]
+        users = [
+            self._create_user(f"citizen-{tag}"),
+            self._create_user(f"officer-{tag}", role=get_user_model().ROLE_LGA_OFFICER, lga=lga),
+        ]
+        cases = [
+            ("citizen", users[0], "/applications/"),
+            ("LGA officer", users[1], "/applications/lga/dashboard/"),
+        ]
+        count = options["requests"]
+
+        try:
+            self.stdout.write(f"{count} request(s) per case")
+            for label, user, path in cases:
+                for warm in (False, True):
+                    latencies, queries = self._bench(user, path, count, warm)
+                    self.stdout.write(
+                        f"{label:>12} {'warm' if warm else 'cold':>4}: "
+                        f"mean {statistics.mean(latencies) * 1000:6.2f} ms, "
+                        + ", ".join(f"{per:.2f} {name} quer(ies)" for name, per in queries.items())
+                        + " per request"
+                    )
+        finally:
+            for user in users:
+                user.delete()
+
+        self.stdout.write(self.style.SUCCESS("Done."))
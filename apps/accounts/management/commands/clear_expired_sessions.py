@@ -0,0 +1,74 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.accounts.sessions import (
+    CLEAR_BATCH_SIZE,
+    clear_expired_batch,
+    session_store,
+    uses_session_table,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired sessions in small batches; a lock-friendly "
+        "replacement for clearsessions"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=CLEAR_BATCH_SIZE,
+            help="Sessions deleted per statement",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="Seconds to pause between batches to limit load",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Stop after deleting this many sessions",
+        )
+
+    def handle(self, *args, **options):
+        store = session_store()
+        if not uses_session_table(store):
+            # cache / file / signed_cookies: no table to batch over
+            try:
+                store.clear_expired()
+            except NotImplementedError:
+                raise CommandError(
+                    f"Session engine '{settings.SESSION_ENGINE}' doesn't support clearing expired sessions."
+                )
+            self.stdout.write(self.style.SUCCESS(f"Cleared expired sessions ({settings.SESSION_ENGINE})."))
+            return
+
+        # Fixed cutoff: sessions expiring mid-run wait for the next one
+        now = timezone.now()
+        limit = options["limit"]
+        deleted = 0
+
+        while limit is None or deleted < limit:
+            batch_size = options["batch_size"]
+            if limit is not None:
+                batch_size = min(batch_size, limit - deleted)
+
+            count = clear_expired_batch(batch_size, now=now)
+            if not count:
+                break
+
+            deleted += count
+            self.stdout.write(f"Deleted {deleted} session(s)…")
+
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired session(s)."))
@@ -1,28 +1,82 @@
 import time
+from functools import partial
+
 from django.conf import settings
 from django.contrib.auth import logout
+from django.contrib.auth.middleware import AuthenticationMiddleware
 from django.shortcuts import redirect
+from django.utils.functional import SimpleLazyObject
+
+from . import snapshot
+
+LAST_ACTIVITY_KEY = "last_activity"
+
+
+def touch_activity(session, now=None):
+    """
+    Record activity now. Marks the session modified, so it is saved.
+    """
+    session[LAST_ACTIVITY_KEY] = time.time() if now is None else now
+
+
+def _get_user(request):
+    if not hasattr(request, "_cached_user"):
+        request._cached_user = snapshot.get_user(request)
+    return request._cached_user
+
+
+async def _auser(request):
+    if not hasattr(request, "_acached_user"):
+        request._acached_user = await snapshot.aget_user(request)
+    return request._acached_user
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    AuthenticationMiddleware that resolves request.user from the cached
+    user snapshot (accounts.snapshot), skipping the user query on warm
+    requests. Plain AuthenticationMiddleware unless the default cache is
+    shared between workers.
+    """
+
+    def process_request(self, request):
+        super().process_request(request)
+        if not snapshot.enabled():
+            return
+        request.user = SimpleLazyObject(lambda: _get_user(request))
+        request.auser = partial(_auser, request)
+
 
 class IdleTimeoutMiddleware:
     """
     Logs out ALL authenticated users after a period of inactivity.
+
+    • The timestamp is only rewritten once it is IDLE_ACTIVITY_GRANULARITY
+      seconds old, so most requests leave the session unmodified and
+      skip the django_session UPDATE
+    • The limit is strict: more than IDLE_TIMEOUT after the stored
+      timestamp means logout. The stored time trails the last request
+      by less than the granularity, so nobody stays in past
+      IDLE_TIMEOUT; the throttling can only log out that much early
     """
 
     def __init__(self, get_response):
         self.get_response = get_response
         self.idle_timeout = getattr(settings, "IDLE_TIMEOUT", 300)
+        self.granularity = getattr(settings, "IDLE_ACTIVITY_GRANULARITY", 60)
 
     def __call__(self, request):
         if request.user.is_authenticated:
             now = time.time()
-            last_activity = request.session.get("last_activity", now)
+            last_activity = request.session.get(LAST_ACTIVITY_KEY)
 
-            if now - last_activity > self.idle_timeout:
+            if last_activity is None:
+                touch_activity(request.session, now)
+            elif now - last_activity > self.idle_timeout:
                 logout(request)
                 request.session.flush()
                 return redirect("accounts:login")
-
-            request.session["last_activity"] = now
+            elif now - last_activity >= self.granularity:
+                touch_activity(request.session, now)
 
         return self.get_response(request)
-
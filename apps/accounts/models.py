@@ -1,9 +1,13 @@
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.core.exceptions import ValidationError
 from django.utils.text import slugify
 import uuid
 
+from . import snapshot
+
 
 # =================================================
 # CUSTOM USER MANAGER
@@ -197,3 +201,22 @@ class User(AbstractUser):
             self.is_active = True
 
         super().save(*args, **kwargs)
+        snapshot.invalidate(self.pk)
+
+    # =================================================
+    # SNAPSHOT USERS (request.user)
+    # =================================================
+    def refresh_from_db(self, using=None, fields=None):
+        """
+        request.user built from the cached snapshot only carries a few
+        fields: the first deferred one touched loads the rest together.
+        """
+        if fields is not None and getattr(self, "from_snapshot", False):
+            fields = [*{*fields, *self.get_deferred_fields()}]
+        super().refresh_from_db(using=using, fields=fields)
+
+
+@receiver(post_delete, sender=User)
+def _forget_deleted_user(sender, instance, **kwargs):
+    # Covers queryset deletes (admin bulk action) as well as delete()
+    snapshot.invalidate(instance.pk)
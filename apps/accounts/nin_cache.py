@@ -0,0 +1,218 @@
+import asyncio
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.crypto import salted_hmac
+
+from .services.verifyme import VerifyMeError, VerifyMeUnavailable, get_client
+
+
+# =====================================================
+# NIN VERIFICATION OUTCOMES (CACHED, COALESCED)
+# =====================================================
+VERIFIED = "verified"
+NOT_VERIFIED = "not_verified"   # VerifyMe answered: no match
+UNAVAILABLE = "unavailable"     # VerifyMe unreachable or erroring
+
+# Seconds each outcome is remembered; failures only briefly
+OUTCOME_TTLS = {
+    VERIFIED: settings.NIN_CACHE_TTL,
+    NOT_VERIFIED: settings.NIN_NEGATIVE_CACHE_TTL,
+    UNAVAILABLE: settings.NIN_FAILURE_CACHE_TTL,
+}
+
+CACHE_PREFIX = "nin:v1:"
+LEASE_POLL_INTERVAL = 0.05  # seconds
+
+
+def cache_key(nin):
+    """
+    Keyed hash of the NIN: raw NINs never reach the cache backend.
+    """
+    return CACHE_PREFIX + salted_hmac("apps.accounts.nin_cache", nin).hexdigest()
+
+
+# =====================================================
+# METRICS (PER PROCESS)
+# =====================================================
+_metrics = {
+    "hits": 0,
+    "negative_hits": 0,
+    "misses": 0,
+    "coalesced": 0,
+}
+_metrics_lock = threading.Lock()
+
+
+def _count(name):
+    with _metrics_lock:
+        _metrics[name] += 1
+
+
+def metrics_snapshot():
+    """
+    Cache counters and hit rate for this process. VerifyMe latency is
+    in `services.verifyme.metrics_snapshot()`.
+    """
+    with _metrics_lock:
+        stats = dict(_metrics)
+
+    lookups = stats["hits"] + stats["negative_hits"] + stats["misses"] + stats["coalesced"]
+    stats["hit_rate"] = (lookups - stats["misses"]) / lookups if lookups else None
+    return stats
+
+
+# =====================================================
+# SINGLEFLIGHT
+# =====================================================
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.outcome = UNAVAILABLE
+
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+def _lease_timeout():
+    return int(settings.VERIFYME_TIMEOUT) + 1
+
+
+def _fetch(key, nin):
+    """
+    One VerifyMe call per key across the deployment.
+
+    A cache lease elects the caller; other processes poll the cache for
+    its result, and fall back to calling VerifyMe if the lease lapses.
+    """
+    lease_key = f"{key}:lease"
+    deadline = time.monotonic() + _lease_timeout()
+
+    while not cache.add(lease_key, 1, _lease_timeout()):
+        outcome = cache.get(key)
+        if outcome is not None:
+            return outcome
+        if time.monotonic() > deadline:
+            break
+        time.sleep(LEASE_POLL_INTERVAL)
+
+    try:
+        verified, _ = get_client().verify_nin(nin)
+    except VerifyMeUnavailable:
+        # Circuit open: already failing fast, nothing worth caching
+        return UNAVAILABLE
+    except VerifyMeError:
+        outcome = UNAVAILABLE
+    else:
+        outcome = VERIFIED if verified else NOT_VERIFIED
+    finally:
+        cache.delete(lease_key)
+
+    cache.set(key, outcome, OUTCOME_TTLS[outcome])
+    return outcome
+
+
+def verify_nin(nin):
+    """
+    VERIFIED, NOT_VERIFIED or UNAVAILABLE for an 11-digit NIN.
+
+    • Served from the cache while the outcome's TTL lasts
+    • Concurrent callers for the same NIN share one VerifyMe call:
+      threads in this process wait on the leader, other processes on
+      the cache lease
+    """
+    key = cache_key(nin)
+
+    outcome = cache.get(key)
+    if outcome is not None:
+        _count("hits" if outcome == VERIFIED else "negative_hits")
+        return outcome
+
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        _count("coalesced")
+        flight.done.wait(_lease_timeout())
+        return flight.outcome
+
+    _count("misses")
+    try:
+        flight.outcome = _fetch(key, nin)
+    finally:
+        with _flights_lock:
+            _flights.pop(key, None)
+        flight.done.set()
+    return flight.outcome
+
+
+# =====================================================
+# ASYNC VARIANT (ASGI VIEWS)
+# =====================================================
+_aflights = {}
+
+
+async def _afetch(key, nin):
+    """
+    Coroutine twin of _fetch(): same lease, awaited instead of slept.
+    """
+    lease_key = f"{key}:lease"
+    deadline = time.monotonic() + _lease_timeout()
+
+    while not await cache.aadd(lease_key, 1, _lease_timeout()):
+        outcome = await cache.aget(key)
+        if outcome is not None:
+            return outcome
+        if time.monotonic() > deadline:
+            break
+        await asyncio.sleep(LEASE_POLL_INTERVAL)
+
+    try:
+        verified, _ = await get_client().averify_nin(nin)
+    except VerifyMeUnavailable:
+        return UNAVAILABLE
+    except VerifyMeError:
+        outcome = UNAVAILABLE
+    else:
+        outcome = VERIFIED if verified else NOT_VERIFIED
+    finally:
+        await cache.adelete(lease_key)
+
+    await cache.aset(key, outcome, OUTCOME_TTLS[outcome])
+    return outcome
+
+
+async def averify_nin(nin):
+    """
+    verify_nin() for async views. Callers on the same event loop share
+    the leader's future instead of a thread event.
+    """
+    key = cache_key(nin)
+
+    outcome = await cache.aget(key)
+    if outcome is not None:
+        _count("hits" if outcome == VERIFIED else "negative_hits")
+        return outcome
+
+    flight_key = (asyncio.get_running_loop(), key)
+    flight = _aflights.get(flight_key)
+    if flight is not None:
+        _count("coalesced")
+        return await asyncio.shield(flight)
+
+    _count("misses")
+    flight = _aflights[flight_key] = asyncio.get_running_loop().create_future()
+    outcome = UNAVAILABLE
+    try:
+        outcome = await _afetch(key, nin)
+    finally:
+        _aflights.pop(flight_key, None)
+        if not flight.done():
+            flight.set_result(outcome)
+    return outcome
@@ -1,4 +1,10 @@
-from django.contrib.auth.decorators import user_passes_test
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.contrib.auth import REDIRECT_FIELD_NAME
+from django.contrib.auth.decorators import user_passes_test as sync_user_passes_test
+from django.contrib.auth.views import redirect_to_login
 
 
 # =====================================================
@@ -34,6 +40,40 @@ def is_lga_staff(user):
 # =====================================================
 # DECORATORS (SAFE & REUSABLE)
 # =====================================================
+def user_passes_test(test_func, login_url=None, redirect_field_name=REDIRECT_FIELD_NAME):
+    """
+    Django's user_passes_test, extended to `async def` views (which
+    Django 5.0's version does not support).
+    """
+    sync_decorator = sync_user_passes_test(
+        test_func,
+        login_url=login_url,
+        redirect_field_name=redirect_field_name,
+    )
+
+    def decorator(view_func):
+        if not iscoroutinefunction(view_func):
+            return sync_decorator(view_func)
+
+        @wraps(view_func)
+        async def _wrapped_view(request, *args, **kwargs):
+            if test_func(await request.auser()):
+                return await view_func(request, *args, **kwargs)
+            return redirect_to_login(
+                request.get_full_path(),
+                login_url or settings.LOGIN_URL,
+                redirect_field_name,
+            )
+
+        return _wrapped_view
+
+    return decorator
+
+
+def login_required(view_func):
+    return user_passes_test(is_authenticated)(view_func)
+
+
 citizen_required = user_passes_test(
     is_citizen,
     login_url="/login/",
@@ -1,52 +1,330 @@
-import requests
-from django.conf import settings
-
-
-class VerifyMeService:
-    """
-    Handles all VerifyMe NIN verification logic.
-    """
-
-    @staticmethod
-    def verify_nin(nin: str) -> dict:
-        """
-        Verifies a Nigerian NIN via VerifyMe.
-        Returns: { "verified": bool, "data": dict | None }
-        """
-
-        url = f"{settings.VERIFYME_BASE_URL}/v1/verifications/nin"
-
-        headers = {
-            "Authorization": f"Bearer {settings.VERIFYME_API_KEY}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {
-            "nin": nin
-        }
-
-        try:
-            response = requests.post(
-                url,
-                json=payload,
-                headers=headers,
-                timeout=int(settings.VERIFYME_TIMEOUT),
-            )
-
-            if response.status_code != 200:
-                return {"verified": False, "data": None}
-
-            result = response.json()
-
-            # VerifyMe convention (safe assumption)
-            if result.get("status") is True:
-                return {
-                    "verified": True,
-                    "data": result.get("data"),
-                }
-
-            return {"verified": False, "data": None}
-
-        except requests.RequestException:
-            return {"verified": False, "data": None}
-
+import asyncio
+import logging
+import threading
+import time
+import weakref
+
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+# =====================================================
+# TRANSPORT SETTINGS
+# =====================================================
+CONNECT_TIMEOUT = 3.05  # seconds; read timeout is VERIFYME_TIMEOUT
+POOL_MAXSIZE = 10
+
+# Responses that mean VerifyMe itself is degraded
+DEGRADED_STATUSES = {429, 500, 502, 503, 504}
+
+# Circuit breaker: open after this many consecutive failures,
+# then fail fast for RESET_TIMEOUT before letting one trial call through
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30  # seconds
+
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class VerifyMeError(Exception):
+    """
+    VerifyMe could not be reached or returned an unusable response.
+    """
+
+
+class VerifyMeUnavailable(VerifyMeError):
+    """
+    The circuit is open: VerifyMe was not called.
+    """
+
+
+# =====================================================
+# SHARED SESSION (ONE POOL PER PROCESS)
+# =====================================================
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Process-wide requests.Session so TLS connections to VerifyMe are
+    kept alive and reused across requests.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=0)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_client():
+    """
+    httpx.AsyncClient for the running event loop, so async views share
+    one keep-alive pool per ASGI worker.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=POOL_MAXSIZE,
+                max_keepalive_connections=POOL_MAXSIZE,
+            ),
+        )
+    return client
+
+
+# =====================================================
+# CIRCUIT BREAKER
+# =====================================================
+class CircuitBreaker:
+    """
+    closed → open after `threshold` consecutive failures;
+    open → half-open once `reset_timeout` has passed, admitting a single
+    trial call whose outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+            if self._trial_running:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_running = False
+
+    def abandon(self):
+        """
+        An admitted call was cancelled before VerifyMe answered.
+        """
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                if self.state != self.OPEN:
+                    logger.warning("VerifyMe circuit opened after %s failure(s)", self.failures)
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+breaker = CircuitBreaker()
+
+
+# =====================================================
+# CALL METRICS
+# =====================================================
+_metrics = {}
+_metrics_lock = threading.Lock()
+
+
+def _bucket(elapsed_ms):
+    for bound in LATENCY_BUCKETS_MS:
+        if elapsed_ms <= bound:
+            return f"le_{bound}ms"
+    return "gt_5000ms"
+
+
+def _record(operation, elapsed=None, error=None, rejected=False):
+    with _metrics_lock:
+        stats = _metrics.setdefault(operation, {
+            "calls": 0,
+            "errors": 0,
+            "rejected": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "latency": {},
+        })
+        if rejected:
+            stats["rejected"] += 1
+            return
+
+        elapsed_ms = elapsed * 1000
+        stats["calls"] += 1
+        stats["errors"] += error is not None
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+        bucket = _bucket(elapsed_ms)
+        stats["latency"][bucket] = stats["latency"].get(bucket, 0) + 1
+
+    if error is not None:
+        logger.warning("VerifyMe %s failed after %.0f ms: %s", operation, elapsed_ms, error)
+
+
+def metrics_snapshot():
+    """
+    {operation: {calls, errors, rejected, total_ms, max_ms, latency}}
+    for this process, plus the circuit state.
+    """
+    with _metrics_lock:
+        snapshot = {
+            operation: {**stats, "latency": dict(stats["latency"])}
+            for operation, stats in _metrics.items()
+        }
+    snapshot["circuit"] = {"state": breaker.state, "failures": breaker.failures}
+    return snapshot
+
+
+# =====================================================
+# CLIENT
+# =====================================================
+class VerifyMeClient:
+    """
+    The one VerifyMe integration used by signup and the helpers.
+
+    • Pooled keep-alive connections (one session per process)
+    • `a`-prefixed coroutine variants for async views (httpx)
+    • Strict connect / read timeouts, no retries
+    • Circuit breaker: fails fast while VerifyMe is degraded
+    • Per-call latency / error metrics
+    """
+
+    def __init__(self, api_key=None, nin_url=None, session=None):
+        self.api_key = api_key or settings.VERIFYME_API_KEY
+        self.nin_url = nin_url or settings.VERIFYME_NIN_URL
+        self.session = session or get_session()
+        self.timeout = (CONNECT_TIMEOUT, int(settings.VERIFYME_TIMEOUT))
+
+    def verify_nin(self, nin):
+        """
+        Returns (verified, data) as answered by VerifyMe.
+        Raises VerifyMeError when it gave no usable answer.
+        """
+        body = self._request("nin", "POST", self.nin_url, json={"nin": nin})
+        return self._nin_result(body)
+
+    async def averify_nin(self, nin):
+        body = await self._arequest("nin", "POST", self.nin_url, json={"nin": nin})
+        return self._nin_result(body)
+
+    def _nin_result(self, body):
+        if body.get("status") is True:
+            return True, body.get("data")
+        return False, None
+
+    # =========================
+    # TRANSPORT
+    # =========================
+    def _admit(self, operation):
+        if not breaker.allow():
+            _record(operation, rejected=True)
+            raise VerifyMeUnavailable("VerifyMe circuit is open")
+        return time.monotonic()
+
+    def _transport_failed(self, operation, started, error):
+        breaker.record_failure()
+        _record(operation, time.monotonic() - started, error=error)
+        return VerifyMeError(f"VerifyMe {operation} failed: {error}")
+
+    def _request(self, operation, method, url, **kwargs):
+        started = self._admit(operation)
+        try:
+            response = self.session.request(
+                method,
+                url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=self.timeout,
+                **kwargs,
+            )
+            if response.status_code in DEGRADED_STATUSES:
+                raise VerifyMeError(f"HTTP {response.status_code}")
+        except (requests.RequestException, VerifyMeError) as error:
+            raise self._transport_failed(operation, started, error) from error
+
+        return self._decode(operation, started, response)
+
+    async def _arequest(self, operation, method, url, **kwargs):
+        started = self._admit(operation)
+        try:
+            response = await get_async_client().request(
+                method,
+                url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=httpx.Timeout(self.timeout[1], connect=self.timeout[0]),
+                **kwargs,
+            )
+            if response.status_code in DEGRADED_STATUSES:
+                raise VerifyMeError(f"HTTP {response.status_code}")
+        except (httpx.HTTPError, VerifyMeError) as error:
+            raise self._transport_failed(operation, started, error) from error
+        except asyncio.CancelledError:
+            breaker.abandon()
+            raise
+
+        return self._decode(operation, started, response)
+
+    def _decode(self, operation, started, response):
+        # VerifyMe answered; whatever it said, it is healthy
+        breaker.record_success()
+        try:
+            if response.status_code != 200:
+                raise VerifyMeError(f"HTTP {response.status_code}")
+            body = response.json()
+            if not isinstance(body, dict):
+                raise VerifyMeError("unexpected response body")
+        except (ValueError, VerifyMeError) as error:
+            _record(operation, time.monotonic() - started, error=error)
+            raise VerifyMeError(f"VerifyMe {operation} failed: {error}") from error
+
+        _record(operation, time.monotonic() - started)
+        return body
+
+
+def get_client():
+    return VerifyMeClient()
+
+
+class VerifyMeService:
+    """
+    Handles all VerifyMe NIN verification logic.
+    """
+
+    @staticmethod
+    def verify_nin(nin: str) -> dict:
+        """
+        Verifies a Nigerian NIN via VerifyMe.
+        Returns: { "verified": bool, "data": dict | None }
+        """
+        try:
+            verified, data = get_client().verify_nin(nin)
+        except VerifyMeError:
+            return {"verified": False, "data": None}
+
+        return {"verified": verified, "data": data}
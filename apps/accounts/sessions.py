@@ -0,0 +1,46 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.utils import timezone
+
+
+# =====================================================
+# EXPIRED SESSION CLEANUP (BATCHED)
+# =====================================================
+CLEAR_BATCH_SIZE = 1000
+
+
+def session_store():
+    return import_module(settings.SESSION_ENGINE).SessionStore
+
+
+def uses_session_table(store=None):
+    """
+    True for the db and cached_db engines, which keep a session table.
+    """
+    return hasattr(store or session_store(), "get_model_class")
+
+
+def clear_expired_batch(batch_size=CLEAR_BATCH_SIZE, now=None):
+    """
+    Delete up to `batch_size` expired sessions and return how many went.
+
+    • Selects keys through the expire_date index, then deletes by
+      primary key, so each statement is short and locks few rows
+    • Only for engines with a session table; cache entries expire on
+      their own and signed cookies are never stored
+    """
+    model = session_store().get_model_class()
+    now = now or timezone.now()
+
+    keys = list(
+        model.objects
+        .filter(expire_date__lt=now)
+        .order_by("expire_date")
+        .values_list("session_key", flat=True)[:batch_size]
+    )
+    if not keys:
+        return 0
+
+    deleted, _ = model.objects.filter(session_key__in=keys, expire_date__lt=now).delete()
+    return deleted
@@ -0,0 +1,177 @@
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.core.cache import cache
+from django.db import router, transaction
+from django.utils.crypto import constant_time_compare
+
+
+# =====================================================
+# PER-USER SNAPSHOT (SHARED CACHE)
+# =====================================================
+CACHE_PREFIX = "accounts:user:v1:"
+
+# Enough of the user for the auth middleware, the role decorators and
+# the officer views; everything else stays deferred on the instance
+USER_FIELDS = ("id", "role", "lga_id", "is_active", "is_staff", "is_superuser")
+
+# Per-process backends: a save in one worker cannot invalidate the
+# snapshot another worker holds
+PROCESS_LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def enabled():
+    """
+    True when CACHES["default"] is shared between workers; otherwise
+    request.user comes from Django's stock lookup.
+    """
+    return settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_BACKENDS
+
+
+def cache_key(user_id):
+    return f"{CACHE_PREFIX}{user_id}"
+
+
+def _snapshot(user):
+    return {
+        **{field: getattr(user, field) for field in USER_FIELDS},
+        "lga_name": user.lga.name if user.lga_id else None,
+        "auth_hash": user.get_session_auth_hash(),
+    }
+
+
+def _drop(keys):
+    cache.delete_many(keys)
+
+
+def invalidate(*user_ids):
+    """
+    Forget the users' snapshots now and again once the surrounding
+    transaction commits, so a concurrent request cannot re-cache the
+    old row.
+    """
+    keys = [cache_key(user_id) for user_id in user_ids]
+    if keys:
+        _drop(keys)
+        transaction.on_commit(lambda: _drop(keys))
+
+
+# =====================================================
+# METRICS (PER PROCESS)
+# =====================================================
+_metrics = {"hits": 0, "misses": 0}
+_metrics_lock = threading.Lock()
+
+
+def _count(name):
+    with _metrics_lock:
+        _metrics[name] += 1
+
+
+def metrics_snapshot():
+    with _metrics_lock:
+        stats = dict(_metrics)
+
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else None
+    return stats
+
+
+# =====================================================
+# REQUEST USER
+# =====================================================
+def _session_user(request):
+    """
+    (user_id, auth_hash) from a session whose backend is still enabled,
+    or None when nobody is logged in.
+    """
+    session = request.session
+    try:
+        user_id = auth.get_user_model()._meta.pk.to_python(session[SESSION_KEY])
+        backend_path = session[BACKEND_SESSION_KEY]
+    except (KeyError, ValueError):
+        return None
+    if backend_path not in settings.AUTHENTICATION_BACKENDS:
+        return None
+    return user_id, session.get(HASH_SESSION_KEY)
+
+
+def _from_snapshot(snapshot, session_hash):
+    """
+    A User built from the snapshot without a query, or None if the
+    snapshot does not vouch for this session.
+    """
+    if not session_hash or not constant_time_compare(session_hash, snapshot["auth_hash"]):
+        return None
+
+    from apps.lgas.models import LGA
+
+    User = auth.get_user_model()
+    db = router.db_for_read(User)
+    # from_db() wants the values in model field order
+    fields = [f.attname for f in User._meta.concrete_fields if f.attname in USER_FIELDS]
+    user = User.from_db(db, fields, [snapshot[field] for field in fields])
+    user.from_snapshot = True
+
+    if user.lga_id:
+        lga = LGA.from_db(db, ("id", "name"), (user.lga_id, snapshot["lga_name"]))
+        User._meta.get_field("lga").set_cached_value(user, lga)
+    return user
+
+
+def get_user(request):
+    """
+    auth.get_user() served from the snapshot cache.
+
+    • Warm: session hash matches the cached snapshot → deferred User,
+      no database query (other fields load together on first use)
+    • Cold, or the hash differs: Django's full check (one query with
+      the LGA joined), then the snapshot is cached for the next request
+    """
+    session_user = _session_user(request)
+    if session_user is None:
+        return auth.get_user(request)
+
+    user_id, session_hash = session_user
+    snapshot = cache.get(cache_key(user_id))
+    if snapshot is not None:
+        user = _from_snapshot(snapshot, session_hash)
+        if user is not None:
+            _count("hits")
+            return user
+
+    _count("misses")
+    user = auth.get_user(request)
+    if user.is_authenticated:
+        cache.set(cache_key(user.pk), _snapshot(user), settings.USER_SNAPSHOT_TTL)
+    return user
+
+
+async def aget_user(request):
+    """
+    get_user() for async views.
+    """
+    session_user = _session_user(request)
+    if session_user is None:
+        return await auth.aget_user(request)
+
+    user_id, session_hash = session_user
+    snapshot = await cache.aget(cache_key(user_id))
+    if snapshot is not None:
+        user = _from_snapshot(snapshot, session_hash)
+        if user is not None:
+            _count("hits")
+            return user
+
+    _count("misses")
+    user = await auth.aget_user(request)
+    if user.is_authenticated:
+        snapshot = await sync_to_async(_snapshot)(user)
+        await cache.aset(cache_key(user.pk), snapshot, settings.USER_SNAPSHOT_TTL)
+    return user
@@ -0,0 +1,164 @@
+import shutil
+import tempfile
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.accounts import snapshot
+from apps.accounts.middleware import LAST_ACTIVITY_KEY
+from apps.applications.tests import create_citizen
+from apps.lgas.models import LGA
+
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "sessions": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+def shared_caches(location):
+    # File-based: visible to every process, like Redis or memcached
+    return {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": location,
+        },
+        "sessions": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+
+
+# =====================================================
+# CACHED USER SNAPSHOT (request.user)
+# =====================================================
+class UserSnapshotTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.lga = LGA.objects.create(name="Akure South", code="AKS")
+
+    def setUp(self):
+        self.officer = create_citizen("officer", role=get_user_model().ROLE_LGA_OFFICER, lga=self.lga)
+        self.client.force_login(self.officer)
+
+    def officer_dashboard(self):
+        return self.client.get(reverse("applications:lga_dashboard"), secure=True)
+
+    def use_shared_cache(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        settings_override = override_settings(CACHES=shared_caches(location))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_disabled_with_per_process_cache(self):
+        self.assertFalse(snapshot.enabled())
+
+        response = self.officer_dashboard()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(getattr(response.wsgi_request.user, "from_snapshot", False))
+        self.assertIsNone(snapshot.cache.get(snapshot.cache_key(self.officer.pk)))
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_role_change_seen_next_request_with_per_process_cache(self):
+        self.assertEqual(self.officer_dashboard().status_code, 200)
+
+        # As another worker would: no invalidation reaches this process
+        get_user_model().objects.filter(pk=self.officer.pk).update(role=get_user_model().ROLE_CITIZEN)
+
+        self.assertEqual(self.officer_dashboard().status_code, 302)
+
+    def test_enabled_with_shared_cache(self):
+        self.use_shared_cache()
+        self.assertTrue(snapshot.enabled())
+
+        self.assertEqual(self.officer_dashboard().status_code, 200)
+
+        cached = snapshot.cache.get(snapshot.cache_key(self.officer.pk))
+        self.assertEqual(cached["role"], get_user_model().ROLE_LGA_OFFICER)
+        response = self.officer_dashboard()
+        self.assertTrue(getattr(response.wsgi_request.user, "from_snapshot", False))
+
+    def test_role_change_seen_next_request_with_shared_cache(self):
+        self.use_shared_cache()
+        self.assertEqual(self.officer_dashboard().status_code, 200)
+
+        self.officer.role = get_user_model().ROLE_CITIZEN
+        self.officer.lga = None
+        self.officer.save()
+
+        self.assertEqual(self.officer_dashboard().status_code, 302)
+
+
+# =====================================================
+# AUTHENTICATION BACKENDS
+# =====================================================
+class LegacySessionTests(TestCase):
+
+    def test_model_backend_session_stays_logged_in(self):
+        citizen = create_citizen()
+        self.client.force_login(citizen, backend="django.contrib.auth.backends.ModelBackend")
+
+        response = self.client.get(reverse("applications:dashboard"), secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.wsgi_request.user.pk, citizen.pk)
+
+
+# =====================================================
+# IDLE TIMEOUT
+# =====================================================
+@override_settings(IDLE_TIMEOUT=300, IDLE_ACTIVITY_GRANULARITY=60)
+class IdleTimeoutTests(TestCase):
+
+    def setUp(self):
+        self.citizen = create_citizen()
+        self.client.force_login(self.citizen)
+        self.started = time.time()
+
+    def get_at(self, offset):
+        with mock.patch("apps.accounts.middleware.time.time", return_value=self.started + offset):
+            return self.client.get(reverse("applications:dashboard"), secure=True)
+
+    def last_activity(self):
+        return self.client.session.get(LAST_ACTIVITY_KEY)
+
+    def test_requests_within_granularity_skip_the_write(self):
+        self.get_at(0)
+
+        self.get_at(30)
+
+        self.assertEqual(self.last_activity(), self.started)
+
+    def test_activity_refreshed_after_granularity(self):
+        self.get_at(0)
+
+        self.get_at(61)
+
+        self.assertEqual(self.last_activity(), self.started + 61)
+
+    def test_logged_out_just_past_timeout(self):
+        self.get_at(0)
+
+        response = self.get_at(301)
+
+        self.assertRedirects(response, reverse("accounts:login"), fetch_redirect_response=False)
+        self.assertNotIn("_auth_user_id", self.client.session)
+
+    def test_not_logged_out_at_timeout(self):
+        self.get_at(0)
+
+        self.assertEqual(self.get_at(300).status_code, 200)
+
+    def test_limit_counts_from_stored_activity(self):
+        self.get_at(0)
+        self.get_at(59)  # not written
+
+        # 242 s after the last request, 301 s after the stored timestamp
+        response = self.get_at(301)
+
+        self.assertEqual(response.status_code, 302)
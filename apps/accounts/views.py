@@ -1,4 +1,4 @@
-import time
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect
 from django.contrib.auth import login, logout, authenticate
 from django.contrib import messages
@@ -11,13 +11,13 @@ from django.views.decorators.csrf import csrf_exempt
 
 from django.conf import settings
 
+from . import nin_cache
 from .forms import SignupForm, LGAOfficerAssignmentForm
-from .models import User
+from .middleware import touch_activity
 from apps.accounts.permissions import lga_officer_required
 
 import json
 import re
-import requests
 
 
 # =====================================================
@@ -55,15 +55,24 @@ def signup_view(request):
 
 
 # =====================================================
-# NIN VERIFICATION (AJAX ENDPOINT)
+# NIN VERIFICATION (AJAX ENDPOINT, ASYNC)
 # =====================================================
+@sync_to_async
+def _mark_nin_verified(session, nin):
+    # Loading the session hits the database: keep it off the event loop
+    session["nin_verified"] = True
+    session["verified_nin"] = nin
+
+
 @csrf_exempt
 @require_POST
-def verify_nin(request):
+async def verify_nin(request):
     """
     Verify National Identification Number (NIN)
     Accepts JSON or form-encoded POST.
     Sets session flags on success.
+
+    Async: waiting on VerifyMe does not hold a worker thread.
     """
 
     # ----------------------------------
@@ -104,8 +113,7 @@ def verify_nin(request):
     # STAGING MODE (MOCK SUCCESS)
     # ----------------------------------
     if settings.ENVIRONMENT == "staging":
-        request.session["nin_verified"] = True
-        request.session["verified_nin"] = nin
+        await _mark_nin_verified(request.session, nin)
 
         return JsonResponse({
             "verified": True,
@@ -113,50 +121,29 @@ def verify_nin(request):
         })
 
     # ----------------------------------
-    # PRODUCTION MODE (VerifyMe)
+    # PRODUCTION MODE (VerifyMe, cached)
     # ----------------------------------
-    try:
-        response = requests.post(
-            settings.VERIFYME_NIN_URL,
-            headers={
-                "Authorization": f"Bearer {settings.VERIFYME_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            json={"nin": nin},
-            timeout=15,
-        )
-
-        if response.status_code != 200:
-            return JsonResponse(
-                {
-                    "verified": False,
-                    "message": "Verification service unavailable",
-                },
-                status=503,
-            )
-
-        data = response.json()
+    outcome = await nin_cache.averify_nin(nin)
 
-        if data.get("status") is True:
-            request.session["nin_verified"] = True
-            request.session["verified_nin"] = nin
+    if outcome == nin_cache.VERIFIED:
+        await _mark_nin_verified(request.session, nin)
 
-            return JsonResponse({
-                "verified": True,
-                "message": "NIN verified successfully",
-            })
-
-        return JsonResponse(
-            {"verified": False, "message": "NIN verification failed"},
-            status=400,
-        )
+        return JsonResponse({
+            "verified": True,
+            "message": "NIN verified successfully",
+        })
 
-    except requests.RequestException:
+    if outcome == nin_cache.UNAVAILABLE:
         return JsonResponse(
             {"verified": False, "message": "Verification service unavailable"},
             status=503,
         )
 
+    return JsonResponse(
+        {"verified": False, "message": "NIN verification failed"},
+        status=400,
+    )
+
 
 # =====================================================
 # LOGIN
@@ -166,17 +153,10 @@ def login_view(request):
         email = request.POST.get("username", "").strip().lower()
         password = request.POST.get("password")
 
-        try:
-            user_obj = User.objects.get(email=email)
-            user = authenticate(
-                request,
-                username=user_obj.username,
-                password=password,
-            )
-        except User.DoesNotExist:
-            user = None
+        # One query; unknown emails cost the same as wrong passwords
+        user = authenticate(request, email=email, password=password)
 
-        if user and user.is_active:
+        if user is not None:
             login(request, user)
             messages.success(request, "Login successful.")
 
@@ -253,7 +233,7 @@ def profile_view(request):
 @login_required
 @csrf_exempt
 def keep_alive(request):
-    request.session["last_activity"] = time.time()
+    touch_activity(request.session)
     return JsonResponse({"status": "ok"})
 
 
@@ -0,0 +1,183 @@
+from django.contrib import admin
+from django.http import JsonResponse
+from django.template.response import TemplateResponse
+from django.urls import path
+from django.utils import timezone
+
+from apps.core.streaming import csv_response
+
+from .analytics import chart_data
+from .exports import stream_csv
+from .models import Application, ArchivedApplication, LGAMonthlyRollup
+
+
+@admin.register(Application)
+class ApplicationAdmin(admin.ModelAdmin):
+    # =========================
+    # LIST VIEW
+    # =========================
+    list_display = (
+        "id",
+        "full_name",
+        "lga",
+        "status",
+        "created_at",
+        "approved_at",
+    )
+
+    list_filter = ("status", "lga")
+    search_fields = ("full_name", "email", "phone", "certificate_number")
+    ordering = ("-created_at",)
+    list_select_related = ("lga",)
+
+    readonly_fields = (
+        "status",
+        "status_changed_at",
+        "created_at",
+        "certificate_number",
+        "certificate_hash",
+        "approved_at",
+    )
+
+    # =========================
+    # BULK ACTIONS
+    # =========================
+    actions = ("export_csv",)
+
+    @admin.action(description="Export selected applications (CSV)")
+    def export_csv(self, request, queryset):
+        filename = f"lgac_applications_{timezone.localdate():%Y%m%d}.csv"
+
+        return csv_response(request, stream_csv(queryset), filename)
+
+
+@admin.register(ArchivedApplication)
+class ArchivedApplicationAdmin(admin.ModelAdmin):
+    """
+    Read-only view of the cold tier. Rows are moved here by
+    `manage.py archive_applications`.
+    """
+
+    list_display = (
+        "id",
+        "full_name",
+        "lga",
+        "status",
+        "certificate_number",
+        "created_at",
+        "archived_at",
+    )
+    list_filter = ("status", "lga")
+    search_fields = ("full_name", "certificate_number", "certificate_hash", "payment_reference")
+    ordering = ("-created_at",)
+    list_select_related = ("lga",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(LGAMonthlyRollup)
+class LGAMonthlyRollupAdmin(admin.ModelAdmin):
+    """
+    Read-only monthly analytics. Rows are written by
+    `manage.py refresh_monthly_rollups`, never edited here.
+    """
+
+    list_display = (
+        "month",
+        "lga",
+        "applications",
+        "approvals",
+        "revenue_naira",
+        "median_approval_hours",
+        "refreshed_at",
+    )
+    list_filter = ("lga",)
+    ordering = ("-month", "lga__name")
+    list_select_related = ("lga",)
+    date_hierarchy = "month"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    @admin.display(description="Revenue (₦)", ordering="revenue")
+    def revenue_naira(self, obj):
+        return f"{obj.revenue / 100:,.2f}"
+
+    @admin.display(description="Median Time to Approval (h)", ordering="median_approval_seconds")
+    def median_approval_hours(self, obj):
+        if obj.median_approval_seconds is None:
+            return "—"
+        return f"{obj.median_approval_seconds / 3600:.1f}"
+
+    # =========================
+    # REPORT VIEWS
+    # =========================
+    def get_urls(self):
+        return [
+            path(
+                "report/",
+                self.admin_site.admin_view(self.report_view),
+                name="applications_lgamonthlyrollup_report",
+            ),
+            path(
+                "report/data/",
+                self.admin_site.admin_view(self.report_data_view),
+                name="applications_lgamonthlyrollup_report_data",
+            ),
+        ] + super().get_urls()
+
+    def _report_params(self, request):
+        try:
+            months = min(max(int(request.GET.get("months", 12)), 1), 60)
+        except ValueError:
+            months = 12
+        return months, request.GET.get("lga") or None
+
+    def report_view(self, request):
+        months, lga_code = self._report_params(request)
+        data = chart_data(months=months, lga_code=lga_code)
+
+        tables = [
+            {
+                "lga": entry["lga"],
+                "code": entry["code"],
+                "rows": list(zip(
+                    data["months"],
+                    entry["applications"],
+                    entry["approvals"],
+                    entry["revenue"],
+                    entry["median_approval_hours"],
+                )),
+            }
+            for entry in data["series"]
+        ]
+
+        return TemplateResponse(
+            request,
+            "admin/applications/monthly_report.html",
+            {
+                **self.admin_site.each_context(request),
+                "title": "Monthly LGA Report",
+                "opts": self.model._meta,
+                "tables": tables,
+                "selected_months": months,
+                "lga_code": lga_code or "",
+            },
+        )
+
+    def report_data_view(self, request):
+        months, lga_code = self._report_params(request)
+        return JsonResponse(chart_data(months=months, lga_code=lga_code))
@@ -0,0 +1,201 @@
+import statistics
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import BigIntegerField, DateField, Sum
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast, Coalesce, TruncMonth
+from django.utils import timezone
+
+from apps.payments.models import Payment
+from .models import Application, ArchivedApplication, LGAMonthlyRollup, Watermark
+
+
+# =====================================================
+# MONTHLY ROLLUPS
+# =====================================================
+ROLLUP_WATERMARK = "monthly_rollups"
+
+# Re-scan a little before the watermark so rows committed late by
+# long-running transactions are not skipped.
+ROLLUP_LOOKBACK = timedelta(minutes=5)
+
+
+def _month_bounds(month):
+    """
+    Aware [start, end) datetimes for the month starting on `month`.
+    """
+    next_month = (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+    tz = timezone.get_current_timezone()
+    return (
+        timezone.make_aware(datetime.combine(month, time.min), tz),
+        timezone.make_aware(datetime.combine(next_month, time.min), tz),
+    )
+
+
+def _months_touched(queryset, lga_field, date_field):
+    return set(
+        queryset
+        .annotate(month=TruncMonth(date_field, output_field=DateField()))
+        .values_list(lga_field, "month")
+        .distinct()
+        .order_by()
+    )
+
+
+def changed_months(since=None):
+    """
+    (lga_id, month) pairs with activity on or after `since`.
+    With no `since`, every month that has any activity, archive included
+    (archived rows never change, so incremental runs can skip them).
+    """
+    applications = Application.objects.all()
+    approvals = Application.objects.filter(approved_at__isnull=False)
+    payments = Payment.objects.filter(
+        status=Payment.STATUS_SUCCESS,
+        paid_at__isnull=False,
+    )
+
+    if since is not None:
+        applications = applications.filter(created_at__gte=since)
+        approvals = approvals.filter(approved_at__gte=since)
+        payments = payments.filter(paid_at__gte=since)
+
+    months = (
+        _months_touched(applications, "lga_id", "created_at")
+        | _months_touched(approvals, "lga_id", "approved_at")
+        | _months_touched(payments, "application__lga_id", "paid_at")
+    )
+
+    if since is None:
+        archived = ArchivedApplication.objects.all()
+        months |= (
+            _months_touched(archived, "lga_id", "created_at")
+            | _months_touched(archived.filter(approved_at__isnull=False), "lga_id", "approved_at")
+            | _months_touched(archived.filter(paid_at__isnull=False), "lga_id", "paid_at")
+        )
+
+    return months
+
+
+def compute_month(lga_id, month):
+    start, end = _month_bounds(month)
+
+    created = {"lga_id": lga_id, "created_at__gte": start, "created_at__lt": end}
+    approved = {"lga_id": lga_id, "approved_at__gte": start, "approved_at__lt": end}
+
+    # Both tiers: older months are partly (or wholly) archived
+    applications = (
+        Application.objects.filter(**created).count()
+        + ArchivedApplication.objects.filter(**created).count()
+    )
+
+    durations = [
+        (approved_at - created_at).total_seconds()
+        for model in (Application, ArchivedApplication)
+        for created_at, approved_at in model.objects.filter(
+            **approved
+        ).values_list("created_at", "approved_at")
+    ]
+
+    # What Paystack settled (paid_amount), as the revenue ledger counts it
+    revenue = Payment.objects.filter(
+        application__lga_id=lga_id,
+        status=Payment.STATUS_SUCCESS,
+        paid_at__gte=start,
+        paid_at__lt=end,
+    ).aggregate(total=Sum(Coalesce("paid_amount", "amount")))["total"]
+
+    archived_revenue = ArchivedApplication.objects.filter(
+        lga_id=lga_id,
+        paid_at__gte=start,
+        paid_at__lt=end,
+    ).aggregate(total=Sum(Coalesce(
+        Cast(KeyTextTransform("paid_amount", "snapshot__payment"), BigIntegerField()),
+        "payment_amount",
+        output_field=BigIntegerField(),
+    )))["total"]
+
+    return {
+        "applications": applications,
+        "approvals": len(durations),
+        "revenue": (revenue or 0) + (archived_revenue or 0),
+        "median_approval_seconds": (
+            int(statistics.median(durations)) if durations else None
+        ),
+    }
+
+
+def refresh_monthly_rollups(full=False):
+    """
+    Recompute only the LGA-months touched since the last run.
+    Returns the number of rollup rows refreshed.
+    """
+    started_at = timezone.now()
+    watermark = None if full else Watermark.get(ROLLUP_WATERMARK)
+    since = watermark - ROLLUP_LOOKBACK if watermark else None
+
+    months = changed_months(since)
+
+    with transaction.atomic():
+        for lga_id, month in sorted(months):
+            LGAMonthlyRollup.objects.update_or_create(
+                lga_id=lga_id,
+                month=month,
+                defaults=compute_month(lga_id, month),
+            )
+        Watermark.advance(ROLLUP_WATERMARK, started_at)
+
+    return len(months)
+
+
+# =====================================================
+# REPORT DATA (ROLLUP ONLY)
+# =====================================================
+def chart_data(months=12, lga_code=None):
+    """
+    Chart-ready series built from LGAMonthlyRollup alone.
+    """
+    first_month = timezone.localdate().replace(day=1)
+    for _ in range(months - 1):
+        first_month = (first_month - timedelta(days=1)).replace(day=1)
+
+    rollups = (
+        LGAMonthlyRollup.objects
+        .filter(month__gte=first_month)
+        .select_related("lga")
+        .order_by("lga__name", "month")
+    )
+    if lga_code:
+        rollups = rollups.filter(lga__code__iexact=lga_code)
+
+    labels = []
+    month = first_month
+    for _ in range(months):
+        labels.append(month)
+        month = (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+    index = {month: i for i, month in enumerate(labels)}
+
+    series = {}
+    for rollup in rollups:
+        entry = series.setdefault(rollup.lga_id, {
+            "lga": rollup.lga.name,
+            "code": rollup.lga.code,
+            "applications": [0] * months,
+            "approvals": [0] * months,
+            "revenue": [0] * months,
+            "median_approval_hours": [None] * months,
+        })
+        i = index[rollup.month]
+        entry["applications"][i] = rollup.applications
+        entry["approvals"][i] = rollup.approvals
+        entry["revenue"][i] = rollup.revenue / 100
+        if rollup.median_approval_seconds is not None:
+            entry["median_approval_hours"][i] = round(
+                rollup.median_approval_seconds / 3600, 1
+            )
+
+    return {
+        "months": [f"{month:%Y-%m}" for month in labels],
+        "series": list(series.values()),
+    }
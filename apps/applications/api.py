@@ -0,0 +1,171 @@
+import hashlib
+from functools import wraps
+
+from django.http import JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.views.decorators.http import require_GET
+
+from apps.accounts.permissions import is_citizen
+from .archive import application_values
+
+
+# =====================================================
+# JSON READ API (v1)
+# =====================================================
+API_VERSION = "v1"
+
+# Public field name → values() lookups it needs
+API_FIELDS = {
+    "id": ("id",),
+    "status": ("status",),
+    "lga": ("lga__code", "lga__name"),
+    "created_at": ("created_at",),
+    "updated_at": ("updated_at",),
+    "approved_at": ("approved_at",),
+    "certificate_number": ("certificate_number",),
+    "payment": (
+        "payment__reference",
+        "payment__amount",
+        "payment__status",
+        "payment__paid_at",
+    ),
+}
+
+# Always fetched: row identity and versions for the ETag
+VERSION_LOOKUPS = ("id", "updated_at", "payment__updated_at")
+
+
+def api_citizen_required(view):
+    """
+    JSON flavour of @citizen_required: 401/403 instead of a login redirect.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return JsonResponse({"error": "Authentication required."}, status=401)
+        if not is_citizen(request.user):
+            return JsonResponse({"error": "Citizen account required."}, status=403)
+        return view(request, *args, **kwargs)
+
+    return wrapper
+
+
+def _requested_fields(request):
+    """
+    Sparse fieldsets: ?fields=id,status,payment
+    Returns the field names (in declaration order) or raises ValueError.
+    """
+    raw = request.GET.get("fields")
+    if not raw:
+        return tuple(API_FIELDS)
+
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested - set(API_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+
+    return tuple(name for name in API_FIELDS if name in requested)
+
+
+def _lookups(fields):
+    lookups = dict.fromkeys(VERSION_LOOKUPS + ("created_at",))
+    for name in fields:
+        lookups.update(dict.fromkeys(API_FIELDS[name]))
+    return tuple(lookups)
+
+
+def _serialize(row, fields):
+    data = {}
+    for name in fields:
+        if name == "lga":
+            data["lga"] = {"code": row["lga__code"], "name": row["lga__name"]}
+        elif name == "payment":
+            data["payment"] = None if row["payment__reference"] is None else {
+                "reference": row["payment__reference"],
+                "amount": row["payment__amount"],  # kobo
+                "status": row["payment__status"],
+                "paid_at": row["payment__paid_at"],
+            }
+        else:
+            data[name] = row[name]
+    return data
+
+
+def _etag(rows, fields):
+    """
+    Weak ETag over the row versions and the selected fieldset.
+    """
+    digest = hashlib.sha1(API_VERSION.encode())
+    digest.update(",".join(fields).encode())
+    for row in rows:
+        digest.update(
+            f"|{row['id']}:{row['updated_at']}:{row['payment__updated_at']}".encode()
+        )
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _respond(request, rows, fields, payload):
+    """
+    304 when If-None-Match still matches, otherwise the JSON body.
+    """
+    etag = _etag(rows, fields)
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = JsonResponse(payload)
+
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ("Cookie",))
+    return response
+
+
+def _bad_fields(error):
+    return JsonResponse({"error": str(error)}, status=400)
+
+
+# =====================================================
+# ENDPOINTS
+# =====================================================
+@require_GET
+@api_citizen_required
+def application_list(request):
+    """
+    The applicant's applications, newest first.
+
+    • One query per tier on the applicant index; no template rendering
+    • Sparse fieldsets via ?fields=
+    • Weak ETag / If-None-Match → 304
+    """
+    try:
+        fields = _requested_fields(request)
+    except ValueError as error:
+        return _bad_fields(error)
+
+    rows = application_values(_lookups(fields), applicant=request.user)
+
+    return _respond(
+        request,
+        rows,
+        fields,
+        {"results": [_serialize(row, fields) for row in rows]},
+    )
+
+
+@require_GET
+@api_citizen_required
+def application_detail(request, pk):
+    """
+    A single application of the applicant, by primary key.
+    """
+    try:
+        fields = _requested_fields(request)
+    except ValueError as error:
+        return _bad_fields(error)
+
+    rows = application_values(_lookups(fields), pk=pk, applicant=request.user)
+    row = rows[0] if rows else None
+    if row is None:
+        return JsonResponse({"error": "Application not found."}, status=404)
+
+    return _respond(request, [row], fields, _serialize(row, fields))
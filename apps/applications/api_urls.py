@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import api
+
+app_name = "api_v1"
+
+urlpatterns = [
+    path("applications/", api.application_list, name="application_list"),
+    path("applications/<int:pk>/", api.application_detail, name="application_detail"),
+]
@@ -0,0 +1,260 @@
+from datetime import timedelta
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.utils import timezone
+
+from apps.payments.models import Payment
+from .models import Application, ArchivedApplication
+
+
+# =====================================================
+# HOT / COLD TIERS
+# =====================================================
+ARCHIVE_STATUSES = (
+    Application.STATUS_APPROVED,
+    Application.STATUS_REJECTED,
+    Application.STATUS_WITHDRAWN,
+)
+
+# Finished applications stay in the hot table this long
+ARCHIVE_AFTER = timedelta(days=365)
+
+ARCHIVE_BATCH_SIZE = 500
+
+SNAPSHOT_FIELDS = (
+    "email",
+    "phone",
+    "nin",
+    "date_of_birth",
+    "place_of_birth",
+    "home_town",
+    "family_compound",
+    "father_name",
+    "mother_name",
+    "passport_verified",
+)
+
+
+def archive_cutoff(now=None):
+    return (now or timezone.now()) - ARCHIVE_AFTER
+
+
+def archivable(cutoff):
+    """
+    Finished applications that left the workflow before `cutoff`.
+    """
+    return Application.objects.filter(
+        status__in=ARCHIVE_STATUSES,
+        status_changed_at__lt=cutoff,
+    )
+
+
+def _payment_of(application):
+    try:
+        return application.payment
+    except ObjectDoesNotExist:
+        return None
+
+
+def to_archive(application):
+    """
+    Build the cold-tier row for a hot Application (not saved).
+    Expects `payment` selected and `transitions` prefetched.
+    """
+    payment = _payment_of(application)
+    paid = payment is not None and payment.status == Payment.STATUS_SUCCESS
+
+    snapshot = {field: getattr(application, field) for field in SNAPSHOT_FIELDS}
+    snapshot["passport_photo"] = application.passport_photo.name or ""
+    snapshot["transitions"] = [
+        {
+            "from_status": t.from_status,
+            "to_status": t.to_status,
+            "actor_id": t.actor_id,
+            "note": t.note,
+            "created_at": t.created_at,
+        }
+        for t in application.transitions.all()
+    ]
+    snapshot["payment"] = None if payment is None else {
+        "id": payment.pk,
+        "reference": payment.reference,
+        "amount": payment.amount,
+        "status": payment.status,
+        "channel": payment.channel,
+        "gateway_transaction_id": payment.gateway_transaction_id,
+        "paid_amount": payment.paid_amount,
+        "fees": payment.fees,
+        "authorization_code": payment.authorization_code,
+        "customer_email": payment.customer_email,
+        "paid_at": payment.paid_at,
+        "created_at": payment.created_at,
+    }
+
+    return ArchivedApplication(
+        id=application.pk,
+        applicant_id=application.applicant_id,
+        lga_id=application.lga_id,
+        full_name=application.full_name,
+        purpose=application.purpose,
+        status=application.status,
+        created_at=application.created_at,
+        status_changed_at=application.status_changed_at,
+        approved_at=application.approved_at,
+        certificate_number=application.certificate_number,
+        certificate_hash=application.certificate_hash,
+        payment_reference=payment.reference if payment else None,
+        payment_amount=payment.amount if payment else None,
+        paid_at=payment.paid_at if paid else None,
+        snapshot=snapshot,
+    )
+
+
+def archive_batch(cutoff, batch_size=ARCHIVE_BATCH_SIZE):
+    """
+    Move one batch from the hot table to the archive in a single short
+    transaction. Rows locked by live requests are skipped and picked up
+    on a later batch. Returns the number of applications moved.
+    """
+    with transaction.atomic():
+        ids = list(
+            archivable(cutoff)
+            .select_for_update(skip_locked=True)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+
+        applications = list(
+            Application.objects
+            .filter(pk__in=ids)
+            .select_related("payment")
+            .prefetch_related("transitions")
+        )
+        ArchivedApplication.objects.bulk_create(
+            [to_archive(application) for application in applications]
+        )
+
+        # Cascades to the payment and transition rows now in the snapshot;
+        # post_delete takes each application off the dashboard counters
+        Application.objects.filter(pk__in=ids).delete()
+
+    return len(ids)
+
+
+# =====================================================
+# READ PATH (BOTH TIERS)
+# =====================================================
+# Citizen pages, the receipt, the JSON API and exports read through
+# these: an archived row stands in for the hot one it replaced
+# (ArchivedApplication mirrors the attributes templates use).
+def applications_of(applicant):
+    """
+    All of the applicant's applications, hot and archived, newest first.
+    """
+    hot = Application.objects.filter(applicant=applicant).select_related("lga")
+    archived = ArchivedApplication.objects.filter(applicant=applicant).select_related("lga")
+    return sorted(
+        [*hot, *archived],
+        key=lambda application: (application.created_at, application.pk),
+        reverse=True,
+    )
+
+
+def find_application(pk, **filters):
+    """
+    The application with this pk, hot or archived, or None.
+    `filters` (e.g. applicant=, status=) apply to either tier.
+    """
+    return (
+        Application.objects
+        .select_related("lga")
+        .filter(pk=pk, **filters)
+        .first()
+    ) or (
+        ArchivedApplication.objects
+        .select_related("lga")
+        .filter(pk=pk, **filters)
+        .first()
+    )
+
+
+# Application values() lookups → their archive-tier column; unlisted
+# ones are the same on both. Archived rows never change again, so
+# archived_at stands in for both versions.
+ARCHIVED_LOOKUPS = {
+    "updated_at": "archived_at",
+    "payment__updated_at": "archived_at",
+    "payment__reference": "payment_reference",
+    "payment__amount": "payment_amount",
+    "payment__status": "snapshot__payment__status",
+    "payment__paid_at": "paid_at",
+}
+
+
+def application_values(lookups, **filters):
+    """
+    values(*lookups) rows from both tiers, archived ones keyed by the
+    hot lookups, newest first. `lookups` must include id and created_at.
+    """
+    hot = list(Application.objects.filter(**filters).values(*lookups))
+
+    renamed = {lookup: ARCHIVED_LOOKUPS.get(lookup, lookup) for lookup in lookups}
+    archived = [
+        {lookup: row[column] for lookup, column in renamed.items()}
+        for row in ArchivedApplication.objects.filter(**filters).values(*set(renamed.values()))
+    ]
+
+    return sorted(
+        hot + archived,
+        key=lambda row: (row["created_at"], row["id"]),
+        reverse=True,
+    )
+
+
+def find_payment(payment_id, applicant, status=None):
+    """
+    The applicant's payment with this id – a Payment, or the
+    ArchivedPayment of an archived application – or None.
+    """
+    payments = Payment.objects.select_related("application__lga").filter(
+        pk=payment_id,
+        application__applicant=applicant,
+    )
+    if status is not None:
+        payments = payments.filter(status=status)
+
+    payment = payments.first()
+    if payment is not None:
+        return payment
+
+    archived = (
+        ArchivedApplication.objects
+        .select_related("lga")
+        .filter(applicant=applicant, snapshot__payment__id=payment_id)
+        .first()
+    )
+    payment = archived.payment if archived is not None else None
+    if payment is None or (status is not None and payment.status != status):
+        return None
+    return payment
+
+
+def find_certificate(hash_value):
+    """
+    The approved application for a certificate hash, hot or archived.
+    Returns None when no valid certificate matches.
+    """
+    return (
+        Application.objects
+        .select_related("lga")
+        .filter(certificate_hash=hash_value, status=Application.STATUS_APPROVED)
+        .first()
+    ) or (
+        ArchivedApplication.objects
+        .select_related("lga")
+        .filter(certificate_hash=hash_value, status=Application.STATUS_APPROVED)
+        .first()
+    )
@@ -0,0 +1,115 @@
+from apps.core.streaming import csv_line_writer, spreadsheet_safe
+
+from .models import Application, ArchivedApplication
+
+
+# =====================================================
+# APPLICATION EXPORT (MINISTRY EXTRACTS)
+# =====================================================
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_HEADER = [
+    "Application ID",
+    "LGA",
+    "LGA Code",
+    "Status",
+    "Full Name",
+    "Email",
+    "Phone",
+    "NIN",
+    "Purpose",
+    "Created At",
+    "Status Changed At",
+    "Approved At",
+    "Certificate Number",
+    "Payment Reference",
+    "Payment Status",
+    "Amount (NGN)",
+    "Paid At",
+]
+
+
+def _isoformat(value):
+    return value.isoformat() if value else ""
+
+
+def export_queryset(queryset=None):
+    """
+    Applications with LGA and payment joined in, read through a
+    server-side cursor.
+    """
+    if queryset is None:
+        queryset = Application.objects.all()
+
+    return (
+        queryset
+        .select_related("lga", "payment")
+        .order_by("pk")
+    )
+
+
+def archived_export_queryset(queryset=None):
+    """
+    export_queryset() for the archive tier; the payment comes from the
+    snapshot.
+    """
+    if queryset is None:
+        queryset = ArchivedApplication.objects.all()
+
+    return queryset.select_related("lga").order_by("pk")
+
+
+def export_row(application):
+    """
+    One CSV row; citizen-entered text is passed through spreadsheet_safe().
+    """
+    payment = getattr(application, "payment", None)
+
+    return [
+        application.id,
+        application.lga.name,
+        application.lga.code or "",
+        application.get_status_display(),
+        spreadsheet_safe(application.full_name),
+        spreadsheet_safe(application.email),
+        spreadsheet_safe(application.phone),
+        spreadsheet_safe(application.nin),
+        spreadsheet_safe(application.purpose),
+        _isoformat(application.created_at),
+        _isoformat(application.status_changed_at),
+        _isoformat(application.approved_at),
+        application.certificate_number or "",
+        payment.reference if payment else "",
+        payment.get_status_display() if payment else "",
+        f"{payment.amount / 100:.2f}" if payment else "",
+        _isoformat(payment.paid_at) if payment else "",
+    ]
+
+
+def iter_export_rows(queryset=None, chunk_size=EXPORT_CHUNK_SIZE, archived_queryset=None):
+    """
+    Header, then hot rows, then archived rows.
+
+    • No querysets at all → every application in both tiers
+    • Otherwise only the tiers given (the admin action passes hot rows)
+    """
+    if queryset is None and archived_queryset is None:
+        queryset = Application.objects.all()
+        archived_queryset = ArchivedApplication.objects.all()
+
+    yield EXPORT_HEADER
+    if queryset is not None:
+        for application in export_queryset(queryset).iterator(chunk_size=chunk_size):
+            yield export_row(application)
+    if archived_queryset is not None:
+        for application in archived_export_queryset(archived_queryset).iterator(chunk_size=chunk_size):
+            yield export_row(application)
+
+
+def stream_csv(queryset=None, chunk_size=EXPORT_CHUNK_SIZE, archived_queryset=None):
+    """
+    Yields CSV lines one at a time, for StreamingHttpResponse.
+    """
+    writer = csv_line_writer()
+    for row in iter_export_rows(queryset, chunk_size, archived_queryset):
+        yield writer.writerow(row)
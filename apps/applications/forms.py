@@ -1,9 +1,15 @@
 from django import forms
 from .models import Application
-from apps.lgas.models import LGA
+from .uploads import (
+    PASSPORT_CONTENT_TYPES,
+    PASSPORT_MAX_BYTES,
+    head_passport_upload,
+    passport_key_prefix,
+)
+from apps.lgas.forms import ActiveLGAChoiceField, ActiveLGAFormMixin
 
 
-class ApplicationForm(forms.ModelForm):
+class ApplicationForm(ActiveLGAFormMixin, forms.ModelForm):
     """
     LGAC Application Form
 
@@ -12,6 +18,9 @@ class ApplicationForm(forms.ModelForm):
     • Identity snapshot is persisted on save
     """
 
+    # Final submit needs a photo (file, bucket key, or one already on the draft)
+    require_passport = True
+
     # =========================
     # READ-ONLY DISPLAY FIELDS
     # =========================
@@ -43,6 +52,19 @@ class ApplicationForm(forms.ModelForm):
         widget=forms.TextInput(attrs={"class": "form-control"}),
     )
 
+    # Active LGAs come from the process-local cache – no query
+    lga = ActiveLGAChoiceField(
+        widget=forms.Select(attrs={"class": "form-select"}),
+    )
+
+    # =========================
+    # DIRECT UPLOAD (PRESIGNED POST)
+    # =========================
+    passport_key = forms.CharField(
+        required=False,
+        widget=forms.HiddenInput(attrs={"id": "id_passport_key"}),
+    )
+
     # =========================
     # META
     # =========================
@@ -65,7 +87,6 @@ class ApplicationForm(forms.ModelForm):
         ]
 
         widgets = {
-            "lga": forms.Select(attrs={"class": "form-select"}),
             "home_town": forms.TextInput(attrs={
                 "class": "form-control",
                 "placeholder": "e.g. Oke-Aro",
@@ -102,8 +123,8 @@ class ApplicationForm(forms.ModelForm):
     def __init__(self, *args, user=None, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Show ONLY active LGAs
-        self.fields["lga"].queryset = LGA.objects.filter(is_active=True)
+        # Photo may arrive as a file OR as a key already in the bucket
+        self.fields["passport_photo"].required = False
 
         # Populate read-only identity fields
         if user:
@@ -113,17 +134,61 @@ class ApplicationForm(forms.ModelForm):
             self.fields["phone"].initial = user.phone
             self.fields["nin"].initial = user.nin
 
+        # Resuming a draft whose photo is already stored
+        if self.instance.pk and self.instance.passport_photo:
+            self.initial["passport_key"] = self.instance.passport_photo.name
+
     # =========================
     # FIELD VALIDATION
     # =========================
     def clean_passport_photo(self):
         photo = self.cleaned_data.get("passport_photo")
-        if not photo:
-            raise forms.ValidationError("Passport photograph is required.")
-        if photo.size > 2 * 1024 * 1024:
+        # Only new uploads; a photo already on the draft was checked before
+        if photo and self.files.get("passport_photo") and photo.size > PASSPORT_MAX_BYTES:
             raise forms.ValidationError("Passport photo must not exceed 2MB.")
         return photo
 
+    def clean_passport_key(self):
+        """
+        Accept only keys issued to this user, and only once the object
+        exists in the bucket within the size / type limits.
+        Image content is checked later by `validate_passport_uploads`.
+        """
+        key = self.cleaned_data.get("passport_key", "").strip()
+        if not key:
+            return ""
+
+        # Already attached to this draft
+        if self.instance.pk and key == self.instance.passport_photo.name:
+            return key
+
+        user = getattr(self, "user", None)
+        if not user or not key.startswith(passport_key_prefix(user)):
+            raise forms.ValidationError("Invalid passport upload. Please upload again.")
+
+        head = head_passport_upload(key)
+        if head is None:
+            raise forms.ValidationError("Passport upload not found. Please upload again.")
+        if head["size"] > PASSPORT_MAX_BYTES:
+            raise forms.ValidationError("Passport photo must not exceed 2MB.")
+        if head["content_type"] not in PASSPORT_CONTENT_TYPES:
+            raise forms.ValidationError("Passport photo must be JPEG or PNG.")
+
+        return key
+
+    def clean(self):
+        cleaned_data = super().clean()
+
+        if (
+            self.require_passport
+            and not cleaned_data.get("passport_photo")
+            and not cleaned_data.get("passport_key")
+            and "passport_key" not in self.errors
+        ):
+            self.add_error("passport_photo", "Passport photograph is required.")
+
+        return cleaned_data
+
     # =========================
     # SAVE OVERRIDE (CRITICAL)
     # =========================
@@ -139,7 +204,64 @@ class ApplicationForm(forms.ModelForm):
             instance.phone = self.user.phone
             instance.nin = self.user.nin
 
+        passport_key = self.cleaned_data.get("passport_key")
+        if passport_key and passport_key == instance.passport_photo.name:
+            pass
+        elif passport_key and not self.files.get("passport_photo"):
+            # Already in the bucket – point at it, nothing to upload
+            instance.passport_photo.name = passport_key
+            instance.passport_verified = None
+        elif self.files.get("passport_photo"):
+            # ImageField has already run the file through Pillow
+            instance.passport_verified = True
+
         if commit:
             instance.save()
 
         return instance
+
+
+class ApplicationDraftForm(ApplicationForm):
+    """
+    Autosave form for DRAFT applications
+
+    • Only the fields present in the submitted data are bound
+    • Every field is optional; completeness is checked on submit()
+    • Photos arrive as a bucket key only (no file uploads)
+    """
+
+    DRAFT_FIELDS = (
+        "lga",
+        "place_of_birth",
+        "date_of_birth",
+        "home_town",
+        "family_compound",
+        "father_name",
+        "mother_name",
+        "purpose",
+        "passport_key",
+    )
+
+    require_passport = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # A new draft always binds `lga`: it is required to create one
+        bound = set(self.data) if self.instance.pk else {*self.data, "lga"}
+        for name in list(self.fields):
+            if name not in self.DRAFT_FIELDS or name not in bound:
+                del self.fields[name]
+
+        for field in self.fields.values():
+            field.required = False
+
+    def changed_model_fields(self):
+        """
+        Model columns touched by this autosave, for save(update_fields=...).
+        """
+        fields = set(self.changed_data)
+        if "passport_key" in fields:
+            fields.discard("passport_key")
+            fields.update({"passport_photo", "passport_verified"})
+        return sorted(fields)
@@ -0,0 +1,75 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.applications.archive import (
+    ARCHIVE_AFTER,
+    ARCHIVE_BATCH_SIZE,
+    archivable,
+    archive_batch,
+)
+
+
+class Command(BaseCommand):
+    help = "Move finished applications older than the cutoff into the archive tier"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=ARCHIVE_AFTER.days,
+            help="Archive applications that finished more than this many days ago",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ARCHIVE_BATCH_SIZE,
+            help="Applications moved per transaction",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="Seconds to pause between batches to limit load",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Stop after moving this many applications",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many applications would be archived",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+
+        if options["dry_run"]:
+            count = archivable(cutoff).count()
+            self.stdout.write(f"{count} application(s) finished before {cutoff:%Y-%m-%d}.")
+            return
+
+        limit = options["limit"]
+        moved = 0
+
+        while limit is None or moved < limit:
+            batch_size = options["batch_size"]
+            if limit is not None:
+                batch_size = min(batch_size, limit - moved)
+
+            count = archive_batch(cutoff, batch_size)
+            if not count:
+                break
+
+            moved += count
+            self.stdout.write(f"Archived {moved} application(s)…")
+
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {moved} application(s)."))
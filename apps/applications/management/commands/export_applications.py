@@ -0,0 +1,62 @@
+import csv
+import sys
+
+from django.core.management.base import BaseCommand
+
+from apps.applications.exports import EXPORT_CHUNK_SIZE, iter_export_rows
+from apps.applications.models import Application, ArchivedApplication
+
+
+class Command(BaseCommand):
+    help = "Stream every application, hot and archived, with its payment data as CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            help="File to write (defaults to stdout)",
+        )
+        parser.add_argument(
+            "--lga",
+            help="Only export applications for this LGA code",
+        )
+        parser.add_argument(
+            "--status",
+            choices=[choice for choice, _ in Application.STATUS_CHOICES],
+            help="Only export applications in this status",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help="Rows fetched per server-side cursor round trip",
+        )
+
+    def handle(self, *args, **options):
+        filters = {}
+        if options["lga"]:
+            filters["lga__code__iexact"] = options["lga"]
+        if options["status"]:
+            filters["status"] = options["status"]
+        queryset = Application.objects.filter(**filters)
+        archived_queryset = ArchivedApplication.objects.filter(**filters)
+
+        output = (
+            open(options["output"], "w", newline="", encoding="utf-8")
+            if options["output"]
+            else sys.stdout
+        )
+
+        try:
+            writer = csv.writer(output)
+            exported = -1  # header row
+            for row in iter_export_rows(queryset, options["chunk_size"], archived_queryset):
+                writer.writerow(row)
+                exported += 1
+        finally:
+            if output is not sys.stdout:
+                output.close()
+
+        if options["output"]:
+            self.stdout.write(
+                self.style.SUCCESS(f"Exported {exported} application(s) to {options['output']}")
+            )
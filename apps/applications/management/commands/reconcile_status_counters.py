@@ -0,0 +1,68 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import Coalesce, TruncDate
+
+from apps.applications.models import Application, LGAStatusCounter
+
+
+class Command(BaseCommand):
+    help = "Recompute LGA status counters from applications and report drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rewrite the counter table with the recomputed values",
+        )
+
+    def handle(self, *args, **options):
+        expected = Counter()
+        rows = (
+            Application.objects
+            .annotate(day=TruncDate(Coalesce("status_changed_at", "created_at")))
+            .values("lga_id", "status", "day")
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+        for row in rows:
+            expected[(row["lga_id"], row["status"], row["day"])] = row["total"]
+
+        actual = Counter()
+        for lga_id, status, day, count in LGAStatusCounter.objects.values_list(
+            "lga_id", "status", "day", "count"
+        ):
+            actual[(lga_id, status, day)] = count
+
+        drift = {
+            key: (actual[key], expected[key])
+            for key in set(expected) | set(actual)
+            if actual[key] != expected[key]
+        }
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Status counters are in sync."))
+            return
+
+        for (lga_id, status, day), (have, want) in sorted(
+            drift.items(), key=lambda item: (item[0][0], item[0][1], str(item[0][2]))
+        ):
+            self.stdout.write(
+                f"LGA {lga_id} {status} {day}: counter={have} actual={want}"
+            )
+        self.stdout.write(self.style.WARNING(f"{len(drift)} bucket(s) drifted."))
+
+        if not options["fix"]:
+            return
+
+        with transaction.atomic():
+            LGAStatusCounter.objects.all().delete()
+            LGAStatusCounter.objects.bulk_create(
+                LGAStatusCounter(lga_id=lga_id, status=status, day=day, count=count)
+                for (lga_id, status, day), count in expected.items()
+                if count
+            )
+
+        self.stdout.write(self.style.SUCCESS("Status counters rebuilt."))
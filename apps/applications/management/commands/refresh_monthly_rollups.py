@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from apps.applications.analytics import refresh_monthly_rollups
+
+
+class Command(BaseCommand):
+    help = "Refresh per-LGA monthly analytics for months changed since the last run"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ignore the watermark and rebuild every month",
+        )
+
+    def handle(self, *args, **options):
+        refreshed = refresh_monthly_rollups(full=options["full"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed {refreshed} LGA-month rollup(s).")
+        )
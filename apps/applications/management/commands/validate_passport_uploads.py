@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from apps.applications.models import Application
+from apps.applications.uploads import validate_passport_image
+
+
+class Command(BaseCommand):
+    help = "Run the deferred image check on passport photos uploaded straight to storage"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=500,
+            help="Maximum number of photos to check in this run",
+        )
+
+    def handle(self, *args, **options):
+        pending = (
+            Application.objects
+            .filter(passport_verified__isnull=True)
+            .exclude(passport_photo="")
+            .exclude(passport_photo__isnull=True)
+            .order_by("pk")
+            .values_list("pk", "passport_photo")[:options["limit"]]
+        )
+
+        valid = invalid = 0
+        for pk, name in pending:
+            ok = validate_passport_image(name)
+            Application.objects.filter(pk=pk).update(passport_verified=ok)
+
+            if ok:
+                valid += 1
+            else:
+                invalid += 1
+                self.stdout.write(
+                    self.style.WARNING(f"Application #{pk}: invalid passport image {name}")
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Checked {valid + invalid} photo(s): {valid} valid, {invalid} invalid.")
+        )
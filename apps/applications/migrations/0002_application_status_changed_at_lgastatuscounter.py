@@ -0,0 +1,70 @@
+# Generated by Django 5.0.9 on 2026-10-19 04:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Coalesce, TruncDate
+
+
+def backfill_status_changed_at(apps, schema_editor):
+    Application = apps.get_model("applications", "Application")
+    Application.objects.filter(status_changed_at__isnull=True).update(
+        status_changed_at=Coalesce("approved_at", "created_at")
+    )
+
+
+def seed_status_counters(apps, schema_editor):
+    """
+    Count existing applications into their (lga, status, day) buckets,
+    as `reconcile_status_counters --fix` would; without this, dashboards
+    read 0 and the first transitions drive buckets negative.
+    """
+    Application = apps.get_model("applications", "Application")
+    LGAStatusCounter = apps.get_model("applications", "LGAStatusCounter")
+
+    rows = (
+        Application.objects
+        .annotate(day=TruncDate(Coalesce("status_changed_at", "created_at")))
+        .values("lga_id", "status", "day")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    LGAStatusCounter.objects.bulk_create(
+        [
+            LGAStatusCounter(lga_id=row["lga_id"], status=row["status"], day=row["day"], count=row["total"])
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0001_initial'),
+        ('lgas', '0007_alter_lga_chairman_signature_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='status_changed_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When the application entered its current status', null=True),
+        ),
+        migrations.RunPython(backfill_status_changed_at, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='LGAStatusCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('DRAFT', 'Draft'), ('SUBMITTED', 'Submitted'), ('PAID', 'Paid'), ('IN_REVIEW', 'In Review'), ('APPROVED', 'Approved'), ('WITHDRAWN', 'Withdrawn')], max_length=20)),
+                ('day', models.DateField()),
+                ('count', models.IntegerField(default=0)),
+                ('lga', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_counters', to='lgas.lga')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='lgastatuscounter',
+            constraint=models.UniqueConstraint(fields=('lga', 'status', 'day'), name='unique_lga_status_day_counter'),
+        ),
+        migrations.RunPython(seed_status_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.9 on 2026-10-19 04:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_application_rejected_status_applicationtransition'),
+        ('lgas', '0007_alter_lga_chairman_signature_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Watermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('value', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LGAMonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the month')),
+                ('applications', models.PositiveIntegerField(default=0)),
+                ('approvals', models.PositiveIntegerField(default=0)),
+                ('revenue', models.PositiveBigIntegerField(default=0)),
+                ('median_approval_seconds', models.PositiveIntegerField(blank=True, null=True)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('lga', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to='lgas.lga')),
+            ],
+            options={
+                'ordering': ('-month', 'lga__name'),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='lgamonthlyrollup',
+            constraint=models.UniqueConstraint(fields=('lga', 'month'), name='unique_lga_monthly_rollup'),
+        ),
+    ]
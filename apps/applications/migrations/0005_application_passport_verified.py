@@ -0,0 +1,27 @@
+# Generated by Django 5.0.9 on 2026-10-19 04:34
+
+from django.db import migrations, models
+
+
+def mark_existing_photos_verified(apps, schema_editor):
+    # Photos uploaded through the form were already checked by ImageField
+    Application = apps.get_model("applications", "Application")
+    Application.objects.exclude(passport_photo="").exclude(
+        passport_photo__isnull=True
+    ).update(passport_verified=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_lgamonthlyrollup_watermark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='passport_verified',
+            field=models.BooleanField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_existing_photos_verified, migrations.RunPython.noop),
+    ]
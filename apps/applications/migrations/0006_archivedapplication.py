@@ -0,0 +1,42 @@
+# Generated by Django 5.0.9 on 2026-10-19 04:38
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_application_passport_verified'),
+        ('lgas', '0007_alter_lga_chairman_signature_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedApplication',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('full_name', models.CharField(max_length=255)),
+                ('purpose', models.TextField()),
+                ('status', models.CharField(choices=[('DRAFT', 'Draft'), ('SUBMITTED', 'Submitted'), ('PAID', 'Paid'), ('IN_REVIEW', 'In Review'), ('APPROVED', 'Approved'), ('REJECTED', 'Rejected'), ('WITHDRAWN', 'Withdrawn')], max_length=20)),
+                ('created_at', models.DateTimeField()),
+                ('status_changed_at', models.DateTimeField(blank=True, null=True)),
+                ('approved_at', models.DateTimeField(blank=True, null=True)),
+                ('certificate_number', models.CharField(blank=True, max_length=100, null=True, unique=True)),
+                ('certificate_hash', models.CharField(blank=True, max_length=64, null=True, unique=True)),
+                ('payment_reference', models.CharField(blank=True, max_length=100, null=True, unique=True)),
+                ('payment_amount', models.PositiveIntegerField(blank=True, null=True)),
+                ('paid_at', models.DateTimeField(blank=True, null=True)),
+                ('snapshot', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applications', to=settings.AUTH_USER_MODEL)),
+                ('lga', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='archived_applications', to='lgas.lga')),
+            ],
+            options={
+                'ordering': ('-created_at',),
+            },
+        ),
+    ]
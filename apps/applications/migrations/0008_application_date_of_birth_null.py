@@ -0,0 +1,18 @@
+# Generated by Django 5.0.9 on 2026-10-19 04:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0007_application_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='date_of_birth',
+            field=models.DateField(null=True),
+        ),
+    ]
@@ -1,6 +1,14 @@
-from django.db import models
+from collections import Counter
+
+from django.db import models, transaction
+from django.db.models import F, Sum
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from apps.lgas.models import LGA
 
 
@@ -14,6 +22,7 @@ class Application(models.Model):
     STATUS_PAID = "PAID"
     STATUS_IN_REVIEW = "IN_REVIEW"
     STATUS_APPROVED = "APPROVED"
+    STATUS_REJECTED = "REJECTED"
     STATUS_WITHDRAWN = "WITHDRAWN"
 
     STATUS_CHOICES = [
@@ -22,9 +31,23 @@ class Application(models.Model):
         (STATUS_PAID, "Paid"),
         (STATUS_IN_REVIEW, "In Review"),
         (STATUS_APPROVED, "Approved"),
+        (STATUS_REJECTED, "Rejected"),
         (STATUS_WITHDRAWN, "Withdrawn"),
     ]
 
+    # =========================
+    # ALLOWED TRANSITIONS
+    # =========================
+    TRANSITIONS = {
+        STATUS_DRAFT: (STATUS_SUBMITTED,),
+        STATUS_SUBMITTED: (STATUS_PAID,),
+        STATUS_PAID: (STATUS_IN_REVIEW, STATUS_WITHDRAWN),
+        STATUS_IN_REVIEW: (STATUS_APPROVED, STATUS_REJECTED, STATUS_WITHDRAWN),
+        STATUS_APPROVED: (),
+        STATUS_REJECTED: (),
+        STATUS_WITHDRAWN: (),
+    }
+
     # =========================
     # OWNERSHIP
     # =========================
@@ -51,7 +74,7 @@ class Application(models.Model):
     # =========================
     # PERSONAL DETAILS
     # =========================
-    date_of_birth = models.DateField()
+    date_of_birth = models.DateField(null=True)  # empty while DRAFT
     place_of_birth = models.CharField(
         max_length=100,
         default="Not Provided",
@@ -73,6 +96,9 @@ class Application(models.Model):
         blank=False
     )
 
+    # None until the deferred image check has run (direct uploads)
+    passport_verified = models.BooleanField(null=True, blank=True)
+
     # =========================
     # WORKFLOW
     # =========================
@@ -84,6 +110,16 @@ class Application(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    status_changed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="When the application entered its current status",
+    )
+
+    # Row version – bumped on every save, used for API ETags
+    updated_at = models.DateTimeField(auto_now=True)
+
     # =========================
     # CERTIFICATE METADATA (NEW)
     # =========================
@@ -108,6 +144,9 @@ class Application(models.Model):
         blank=True,
     )
 
+    # ArchivedApplication sets this True (see archive.py read path)
+    is_archived = False
+
     # =========================
     # MODEL GUARANTEES
     # =========================
@@ -145,6 +184,83 @@ class Application(models.Model):
                     "passport_photo": "Passport photograph is required before submission."
                 })
 
+    # =========================
+    # STATUS TRACKING
+    # =========================
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_status_state()
+        return instance
+
+    def _remember_status_state(self):
+        """
+        Remember (lga_id, status, status_changed_at) as last persisted,
+        so save() can tell whether the status actually moved.
+        """
+        loaded = self.__dict__
+        if all(f in loaded for f in ("lga_id", "status", "status_changed_at")):
+            self._persisted_status_state = (
+                loaded["lga_id"],
+                loaded["status"],
+                loaded["status_changed_at"],
+            )
+        else:
+            self._persisted_status_state = None
+
+    def _previous_status_state(self):
+        if self._state.adding:
+            return None
+
+        state = getattr(self, "_persisted_status_state", None)
+        if state is None:
+            # Deferred load – read the persisted values once
+            state = (
+                Application.objects
+                .filter(pk=self.pk)
+                .values_list("lga_id", "status", "status_changed_at")
+                .first()
+            )
+        return state
+
+    def save(self, *args, **kwargs):
+        """
+        Every status change stamps `status_changed_at`; a status or LGA
+        change moves the application between LGAStatusCounter buckets in
+        the same transaction. With `update_fields`, only the saved fields
+        count.
+        """
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "updated_at"}
+
+        saves_status = update_fields is None or "status" in update_fields
+        saves_lga = update_fields is None or bool({"lga", "lga_id"} & set(update_fields))
+        if not (saves_status or saves_lga):
+            return super().save(*args, **kwargs)
+
+        previous = self._previous_status_state()
+        current_lga = self.lga_id if saves_lga or previous is None else previous[0]
+        current_status = self.status if saves_status or previous is None else previous[1]
+        if previous and previous[:2] == (current_lga, current_status):
+            return super().save(*args, **kwargs)
+
+        if previous is None or previous[1] != current_status:
+            self.status_changed_at = timezone.now()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "status_changed_at"}
+            changed_at = self.status_changed_at
+        else:
+            # LGA moved, status did not: same day bucket, other LGA
+            changed_at = previous[2]
+
+        current = (current_lga, current_status, changed_at)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            LGAStatusCounter.record_transition(previous, current)
+
+        self._persisted_status_state = current
+
     # =========================
     # DOMAIN METHODS
     # =========================
@@ -158,20 +274,163 @@ class Application(models.Model):
         self.phone = user.phone
         self.nin = user.nin
 
-    def submit(self):
+    def submit(self, actor=None):
         """
         Single, authoritative submission action
         """
+        if self.status == self.STATUS_SUBMITTED:
+            return False
+
         self.snapshot_identity_from_user()
-        self.status = self.STATUS_SUBMITTED
-        self.full_clean()
-        self.save(update_fields=[
-            "full_name",
-            "email",
-            "phone",
-            "nin",
-            "status",
-        ])
+        return self.transition_to(
+            self.STATUS_SUBMITTED,
+            actor=actor,
+            update_fields=["full_name", "email", "phone", "nin"],
+            validate=True,
+        )
+
+    # =========================
+    # STATE MACHINE
+    # =========================
+    def can_transition_to(self, to_status):
+        return to_status in self.TRANSITIONS.get(self.status, ())
+
+    def transition_to(self, to_status, actor=None, note="", update_fields=(), validate=False):
+        """
+        Move to `to_status` along an allowed edge and log the transition.
+
+        • The row is locked and its status re-read first, so concurrent
+          callers serialize: the loser sees the new status
+        • Already in `to_status` → no-op, returns False
+        • Disallowed edge → ValidationError
+        • `update_fields` are saved together with the status
+        """
+        original = (self.lga_id, self.status, getattr(self, "_persisted_status_state", None))
+        try:
+            with transaction.atomic():
+                if not self._state.adding:
+                    self._lock_status_state(keep_lga="lga" in update_fields)
+
+                from_status = self.status
+                if from_status == to_status:
+                    return False
+
+                if not self.can_transition_to(to_status):
+                    raise ValidationError(
+                        f"Cannot move application from {self.get_status_display()} "
+                        f"to {dict(self.STATUS_CHOICES).get(to_status, to_status)}."
+                    )
+
+                if to_status == self.STATUS_APPROVED:
+                    self._check_passport_verified()
+
+                self.status = to_status
+                if validate:
+                    self.full_clean()
+
+                self.save(update_fields=["status", *update_fields])
+                ApplicationTransition.objects.create(
+                    application=self,
+                    from_status=from_status,
+                    to_status=to_status,
+                    actor=actor,
+                    note=note,
+                )
+        except Exception:
+            self.lga_id, self.status, self._persisted_status_state = original
+            raise
+
+        return True
+
+    def _lock_status_state(self, keep_lga=False):
+        """
+        SELECT ... FOR UPDATE the persisted (lga_id, status,
+        status_changed_at) and adopt it, so the transition starts from
+        the stored status and moves the right counter bucket.
+        """
+        state = (
+            Application.objects
+            .select_for_update()
+            .filter(pk=self.pk)
+            .values_list("lga_id", "status", "status_changed_at")
+            .first()
+        )
+        if state is None:
+            raise ValidationError("This application no longer exists.")
+
+        self._persisted_status_state = state
+        self.status = state[1]
+        if not keep_lga:
+            self.lga_id = state[0]
+
+    def _check_passport_verified(self):
+        """
+        Approval needs a passport photo that passed the image check
+        (`validate_passport_uploads` for photos uploaded by key).
+        The flag is re-read, since that check runs in the background.
+        """
+        if not self._state.adding:
+            self.passport_verified = (
+                Application.objects
+                .filter(pk=self.pk)
+                .values_list("passport_verified", flat=True)
+                .first()
+            )
+
+        if self.passport_verified is None:
+            raise ValidationError(
+                "The passport photograph has not been checked yet. Please try again shortly."
+            )
+        if not self.passport_verified:
+            raise ValidationError(
+                "The passport photograph is not a valid image. "
+                "Reject the application so the citizen can upload a new one."
+            )
+
+    @classmethod
+    def bulk_transition(cls, queryset, to_status, actor=None, note=""):
+        """
+        Set-based transition: one UPDATE plus one bulk_create for the log.
+        Rows whose current status has no edge to `to_status` are skipped.
+        Returns the number of applications moved.
+        """
+        sources = [
+            status for status, targets in cls.TRANSITIONS.items()
+            if to_status in targets
+        ]
+        now = timezone.now()
+
+        with transaction.atomic():
+            rows = list(
+                queryset
+                .filter(status__in=sources)
+                .select_for_update()
+                .order_by()
+                .values_list("id", "lga_id", "status", "status_changed_at")
+            )
+            if not rows:
+                return 0
+
+            cls.objects.filter(pk__in=[row[0] for row in rows]).update(
+                status=to_status,
+                status_changed_at=now,
+                updated_at=now,
+            )
+
+            ApplicationTransition.objects.bulk_create(
+                ApplicationTransition(
+                    application_id=pk,
+                    from_status=from_status,
+                    to_status=to_status,
+                    actor=actor,
+                    note=note,
+                )
+                for pk, _, from_status, _ in rows
+            )
+
+            LGAStatusCounter.record_bulk_transition(rows, to_status, now)
+
+        return len(rows)
 
     # Application model
     #ertificate_seal = models.ImageField(upload_to="certificates/seals/", null=True)
@@ -181,3 +440,342 @@ class Application(models.Model):
 
     def __str__(self):
         return f"{self.full_name} – {self.lga.name}"
+
+
+class ApplicationTransition(models.Model):
+    """
+    Append-only log of application status changes.
+    """
+
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name="transitions",
+    )
+    from_status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    to_status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    note = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("created_at",)
+
+    def __str__(self):
+        return f"#{self.application_id}: {self.from_status} → {self.to_status}"
+
+
+def _snapshot_field(name, parse=None):
+    """
+    Read-only attribute of an ArchivedApplication backed by its snapshot,
+    so archived rows render through the same templates as hot ones.
+    """
+    def getter(self):
+        value = self.snapshot.get(name)
+        return parse(value) if parse is not None and value else value
+
+    return property(getter)
+
+
+class ArchivedPayment:
+    """
+    The payment of an archived application, rebuilt from its snapshot.
+    Read-only: the Payment row itself was deleted when archiving.
+    """
+
+    def __init__(self, application, data):
+        self.application = application
+        self.id = data.get("id")
+        self.reference = data.get("reference")
+        self.amount = data.get("amount")
+        self.status = data.get("status")
+        self.channel = data.get("channel")
+        self.paid_at = parse_datetime(data["paid_at"]) if data.get("paid_at") else None
+        self.created_at = parse_datetime(data["created_at"]) if data.get("created_at") else None
+        self.updated_at = application.archived_at
+
+    @property
+    def pk(self):
+        return self.id
+
+    def get_status_display(self):
+        from apps.payments.models import Payment
+
+        return dict(Payment.STATUS_CHOICES).get(self.status, self.status)
+
+
+class ArchivedApplication(models.Model):
+    """
+    Cold tier for finished applications.
+
+    `archive_applications` moves approved / rejected / withdrawn applications
+    older than a year here in small batches. The row keeps the original
+    primary key, the columns certificate verification and analytics read,
+    and the rest of the record (identity details, payment, transition log)
+    as a JSON snapshot.
+    """
+
+    id = models.BigIntegerField(primary_key=True)  # original Application pk
+
+    applicant = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_applications",
+    )
+    lga = models.ForeignKey(
+        LGA,
+        on_delete=models.PROTECT,
+        related_name="archived_applications",
+    )
+
+    full_name = models.CharField(max_length=255)
+    purpose = models.TextField()
+    status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+
+    created_at = models.DateTimeField()
+    status_changed_at = models.DateTimeField(null=True, blank=True)
+    approved_at = models.DateTimeField(null=True, blank=True)
+
+    # =========================
+    # CERTIFICATE (VERIFICATION READ PATH)
+    # =========================
+    certificate_number = models.CharField(
+        max_length=100,
+        unique=True,
+        null=True,
+        blank=True,
+    )
+    certificate_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        null=True,
+        blank=True,
+    )
+
+    # =========================
+    # PAYMENT (ANALYTICS READ PATH)
+    # =========================
+    payment_reference = models.CharField(
+        max_length=100,
+        unique=True,
+        null=True,
+        blank=True,
+    )
+    payment_amount = models.PositiveIntegerField(null=True, blank=True)  # kobo
+    paid_at = models.DateTimeField(null=True, blank=True)
+
+    snapshot = models.JSONField(encoder=DjangoJSONEncoder, default=dict)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+
+    # =========================
+    # HOT-COMPATIBLE READ ATTRIBUTES
+    # =========================
+    is_archived = True
+
+    email = _snapshot_field("email")
+    phone = _snapshot_field("phone")
+    nin = _snapshot_field("nin")
+    date_of_birth = _snapshot_field("date_of_birth", parse_date)
+    place_of_birth = _snapshot_field("place_of_birth")
+    home_town = _snapshot_field("home_town")
+    family_compound = _snapshot_field("family_compound")
+    father_name = _snapshot_field("father_name")
+    mother_name = _snapshot_field("mother_name")
+    passport_verified = _snapshot_field("passport_verified")
+
+    @property
+    def updated_at(self):
+        return self.archived_at
+
+    @property
+    def payment(self):
+        data = self.snapshot.get("payment")
+        return None if data is None else ArchivedPayment(self, data)
+
+    def __str__(self):
+        return f"{self.full_name} – archived #{self.pk}"
+
+
+class LGAStatusCounter(models.Model):
+    """
+    Denormalized application counts for dashboards.
+
+    A row holds the number of applications of `lga` that are currently in
+    `status` and entered it on `day`. Application.save() moves applications
+    between rows; `reconcile_status_counters` rebuilds the table from scratch.
+    """
+
+    lga = models.ForeignKey(
+        LGA,
+        on_delete=models.CASCADE,
+        related_name="status_counters",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=Application.STATUS_CHOICES,
+    )
+    day = models.DateField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["lga", "status", "day"],
+                name="unique_lga_status_day_counter",
+            ),
+        ]
+
+    # =========================
+    # WRITES
+    # =========================
+    @classmethod
+    def adjust(cls, lga_id, status, day, delta):
+        """
+        Atomically add `delta` to a single bucket, creating it if needed.
+        """
+        bucket = {"lga_id": lga_id, "status": status, "day": day}
+
+        if cls.objects.filter(**bucket).update(count=F("count") + delta):
+            return
+
+        counter, created = cls.objects.get_or_create(
+            **bucket,
+            defaults={"count": delta},
+        )
+        if not created:
+            cls.objects.filter(pk=counter.pk).update(count=F("count") + delta)
+
+    @classmethod
+    def record_transition(cls, previous, current):
+        """
+        Move one application between buckets.
+        `previous` / `current` are (lga_id, status, status_changed_at) tuples;
+        `previous` is None for a new application.
+        """
+        if previous is not None:
+            lga_id, status, changed_at = previous
+            if changed_at is not None:
+                cls.adjust(lga_id, status, timezone.localdate(changed_at), -1)
+
+        lga_id, status, changed_at = current
+        if changed_at is not None:
+            cls.adjust(lga_id, status, timezone.localdate(changed_at), 1)
+
+    @classmethod
+    def record_bulk_transition(cls, rows, to_status, changed_at):
+        """
+        Apply a bulk transition with one update per touched bucket.
+        `rows` are (id, lga_id, status, status_changed_at) tuples.
+        """
+        deltas = Counter()
+        day = timezone.localdate(changed_at)
+
+        for _, lga_id, status, previous_changed_at in rows:
+            if previous_changed_at is not None:
+                deltas[(lga_id, status, timezone.localdate(previous_changed_at))] -= 1
+            deltas[(lga_id, to_status, day)] += 1
+
+        for (lga_id, status, bucket_day), delta in deltas.items():
+            if delta:
+                cls.adjust(lga_id, status, bucket_day, delta)
+
+    # =========================
+    # READS
+    # =========================
+    @classmethod
+    def totals(cls, lga=None, since=None):
+        """
+        Returns {status: count}, optionally limited to one LGA and/or to
+        applications that entered their status on or after `since`.
+        """
+        counters = cls.objects.all()
+        if lga is not None:
+            counters = counters.filter(lga=lga)
+        if since is not None:
+            counters = counters.filter(day__gte=since)
+
+        rows = counters.values("status").annotate(total=Sum("count"))
+        return {row["status"]: row["total"] for row in rows}
+
+    def __str__(self):
+        return f"{self.lga_id} {self.status} {self.day}: {self.count}"
+
+
+class LGAMonthlyRollup(models.Model):
+    """
+    Per-LGA monthly analytics, maintained by `refresh_monthly_rollups`.
+    Reports read from this table only.
+    """
+
+    lga = models.ForeignKey(
+        LGA,
+        on_delete=models.CASCADE,
+        related_name="monthly_rollups",
+    )
+    month = models.DateField(help_text="First day of the month")
+
+    applications = models.PositiveIntegerField(default=0)
+    approvals = models.PositiveIntegerField(default=0)
+    revenue = models.PositiveBigIntegerField(default=0)  # kobo
+    median_approval_seconds = models.PositiveIntegerField(null=True, blank=True)
+
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("-month", "lga__name")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["lga", "month"],
+                name="unique_lga_monthly_rollup",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.lga_id} {self.month:%Y-%m}"
+
+
+class Watermark(models.Model):
+    """
+    Named high-water mark for incremental background jobs.
+    """
+
+    name = models.CharField(max_length=50, unique=True)
+    value = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @classmethod
+    def get(cls, name, default=None):
+        return (
+            cls.objects.filter(name=name)
+            .values_list("value", flat=True)
+            .first()
+        ) or default
+
+    @classmethod
+    def advance(cls, name, value):
+        cls.objects.update_or_create(name=name, defaults={"value": value})
+
+    def __str__(self):
+        return f"{self.name} @ {self.value:%Y-%m-%d %H:%M}"
+
+
+@receiver(post_delete, sender=Application)
+def _uncount_deleted_application(sender, instance, **kwargs):
+    # Covers queryset deletes (archiving, admin bulk action, cascades)
+    state = getattr(instance, "_persisted_status_state", None) or (
+        instance.lga_id,
+        instance.status,
+        instance.status_changed_at,
+    )
+    lga_id, status, changed_at = state
+    if changed_at is not None:
+        LGAStatusCounter.adjust(lga_id, status, timezone.localdate(changed_at), -1)
@@ -0,0 +1,762 @@
+import csv
+import datetime
+import importlib
+import json
+import io
+import os
+import re
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.apps import apps as django_apps
+from django.contrib.auth import get_user_model
+from django.contrib.messages import get_messages
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.applications.forms import ApplicationDraftForm
+from apps.lgas.cache import invalidate_active_lgas
+from apps.lgas.models import LGA
+from apps.payments.models import Payment
+from apps.applications.analytics import compute_month
+from apps.applications.archive import archive_batch
+from apps.applications.exports import iter_export_rows
+from apps.applications.models import (
+    Application,
+    ApplicationTransition,
+    ArchivedApplication,
+    LGAStatusCounter,
+)
+
+
+# =====================================================
+# FIXTURES
+# =====================================================
+def create_citizen(username="citizen", nin="12345678901", phone="08012345678", **extra):
+    return get_user_model().objects.create_user(
+        username,
+        f"{username}@example.com",
+        "pass-1234",
+        full_name="Ada Citizen",
+        phone=phone,
+        nin=nin,
+        **extra,
+    )
+
+
+def create_application(applicant, lga, status=Application.STATUS_SUBMITTED, passport_verified=True, **extra):
+    application = Application(
+        applicant=applicant,
+        lga=lga,
+        full_name=applicant.full_name,
+        email=applicant.email,
+        phone=applicant.phone,
+        nin=applicant.nin,
+        date_of_birth=datetime.date(1990, 1, 1),
+        home_town="Akure",
+        family_compound="Odo",
+        father_name="Father",
+        mother_name="Mother",
+        purpose="School admission",
+        passport_photo="passports/test.jpg",
+        status=status,
+        passport_verified=passport_verified,
+        **extra,
+    )
+    application.save()
+    return application
+
+
+# =====================================================
+# ARCHIVED APPLICATIONS (TWO-TIER READ PATH)
+# =====================================================
+class ArchivedReadPathTests(TestCase):
+    """
+    Every citizen-facing reader still finds an application once
+    archive_batch has moved it out of the hot table.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.lga = LGA.objects.create(name="Akure South", code="AKS")
+        cls.citizen = create_citizen()
+
+        application = create_application(
+            cls.citizen,
+            cls.lga,
+            status=Application.STATUS_APPROVED,
+            certificate_number="LGAC/AKS/000001",
+            certificate_hash="a" * 64,
+            approved_at=timezone.now(),
+        )
+        payment = Payment.objects.create(
+            application=application,
+            reference="LGAC-ARCHIVED-1",
+            amount=500000,
+            status=Payment.STATUS_SUCCESS,
+            paid_at=timezone.now(),
+        )
+        cls.application_id = application.pk
+        cls.payment_id = payment.pk
+
+        cls.hot = create_application(cls.citizen, cls.lga)
+
+        archive_batch(timezone.now() + timedelta(days=1))
+
+    def setUp(self):
+        self.client.force_login(self.citizen)
+
+    def get(self, url):
+        return self.client.get(url, secure=True)
+
+    def test_application_is_archived(self):
+        self.assertFalse(Application.objects.filter(pk=self.application_id).exists())
+        self.assertTrue(ArchivedApplication.objects.filter(pk=self.application_id).exists())
+
+    def test_dashboard_lists_both_tiers(self):
+        response = self.get(reverse("applications:dashboard"))
+
+        self.assertEqual(response.status_code, 200)
+        ids = [application.pk for application in response.context["applications"]]
+        self.assertEqual(ids, [self.hot.pk, self.application_id])
+
+    def test_view_application(self):
+        response = self.get(reverse("applications:view", args=[self.application_id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["app"].is_archived)
+        self.assertContains(response, "LGAC/AKS/000001")
+
+    def test_download_certificate(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        filename = f"lgac_{self.application_id}_{'a' * 12}.pdf"
+        os.makedirs(os.path.join(media_root, "certificates"))
+        with open(os.path.join(media_root, "certificates", filename), "wb") as handle:
+            handle.write(b"%PDF-1.4")
+
+        with override_settings(MEDIA_ROOT=media_root):
+            response = self.get(reverse("applications:download_certificate", args=[self.application_id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"%PDF-1.4")
+
+    def test_receipt(self):
+        response = self.get(reverse("payments:receipt", args=[self.payment_id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "LGAC-ARCHIVED-1")
+
+    def test_receipt_of_another_citizen(self):
+        self.client.force_login(create_citizen("other", nin="10987654321", phone="08087654321"))
+
+        response = self.get(reverse("payments:receipt", args=[self.payment_id]))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_api_list(self):
+        response = self.get(reverse("api_v1:application_list"))
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([row["id"] for row in results], [self.hot.pk, self.application_id])
+        self.assertEqual(results[1]["status"], Application.STATUS_APPROVED)
+        self.assertEqual(results[1]["lga"], {"code": "AKS", "name": "Akure South"})
+        self.assertEqual(results[1]["payment"]["reference"], "LGAC-ARCHIVED-1")
+        self.assertEqual(results[1]["payment"]["amount"], 500000)
+        self.assertEqual(results[1]["payment"]["status"], Payment.STATUS_SUCCESS)
+
+    def test_api_detail(self):
+        url = reverse("api_v1:application_detail", args=[self.application_id])
+
+        response = self.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["certificate_number"], "LGAC/AKS/000001")
+
+        # Archived rows never change, so the ETag holds
+        cached = self.client.get(url, secure=True, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_export(self):
+        rows = list(iter_export_rows())
+
+        self.assertEqual(len(rows), 3)
+        archived = next(row for row in rows[1:] if row[0] == self.application_id)
+        self.assertEqual(archived[1], "Akure South")
+        self.assertEqual(archived[5], self.citizen.email)
+        self.assertEqual(archived[13], "LGAC-ARCHIVED-1")
+        self.assertEqual(archived[15], "5000.00")
+
+    def test_export_command_filters_both_tiers(self):
+        output = os.path.join(tempfile.mkdtemp(), "export.csv")
+        self.addCleanup(shutil.rmtree, os.path.dirname(output))
+
+        call_command(
+            "export_applications",
+            output=output,
+            status=Application.STATUS_APPROVED,
+            stdout=io.StringIO(),
+        )
+
+        with open(output, newline="", encoding="utf-8") as handle:
+            rows = list(csv.reader(handle))
+        self.assertEqual([row[0] for row in rows[1:]], [str(self.application_id)])
+
+
+# =====================================================
+# JSON READ API (ETAG / SPARSE FIELDSETS)
+# =====================================================
+class ApiTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.lga = LGA.objects.create(name="Akure South", code="AKS")
+        cls.citizen = create_citizen()
+        cls.application = create_application(cls.citizen, cls.lga)
+        cls.payment = Payment.objects.create(
+            application=cls.application,
+            reference="LGAC-API-1",
+            amount=500000,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.citizen)
+
+    def get(self, name, *args, **extra):
+        kwargs = {"args": args} if args else {}
+        return self.client.get(reverse(f"api_v1:{name}", **kwargs), secure=True, **extra)
+
+    def test_matching_etag_gets_304(self):
+        for name, args in (("application_list", ()), ("application_detail", (self.application.pk,))):
+            with self.subTest(name):
+                first = self.get(name, *args)
+                self.assertEqual(first.status_code, 200)
+
+                second = self.get(name, *args, HTTP_IF_NONE_MATCH=first["ETag"])
+
+                self.assertEqual(second.status_code, 304)
+                self.assertEqual(second.content, b"")
+                self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_payment_change_changes_etag(self):
+        etag = self.get("application_detail", self.application.pk)["ETag"]
+
+        Payment.objects.filter(pk=self.payment.pk).update(updated_at=timezone.now() + timedelta(seconds=1))
+
+        response = self.get("application_detail", self.application.pk, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_fieldset_is_part_of_etag(self):
+        full = self.get("application_detail", self.application.pk)
+
+        sparse = self.get(
+            "application_detail",
+            self.application.pk,
+            data={"fields": "id,status"},
+            HTTP_IF_NONE_MATCH=full["ETag"],
+        )
+
+        self.assertEqual(sparse.status_code, 200)
+        self.assertEqual(sparse.json(), {"id": self.application.pk, "status": Application.STATUS_SUBMITTED})
+
+    def test_unknown_field_is_400(self):
+        response = self.get("application_list", data={"fields": "id,secret"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "Unknown field(s): secret"})
+
+
+# =====================================================
+# MONTHLY ROLLUPS
+# =====================================================
+class RollupRevenueTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.lga = LGA.objects.create(name="Akure South", code="AKS")
+        cls.citizen = create_citizen()
+
+    def pay(self, reference, amount, paid_amount):
+        application = create_application(
+            self.citizen,
+            self.lga,
+            status=Application.STATUS_APPROVED,
+            approved_at=timezone.now(),
+        )
+        return Payment.objects.create(
+            application=application,
+            reference=reference,
+            amount=amount,
+            paid_amount=paid_amount,
+            status=Payment.STATUS_SUCCESS,
+            paid_at=timezone.now(),
+        )
+
+    def test_revenue_counts_settled_amount_like_the_ledger(self):
+        self.pay("LGAC-ROLLUP-ARCHIVED", 500000, 400000)
+        archive_batch(timezone.now() + timedelta(days=1))
+        self.pay("LGAC-ROLLUP-1", 500000, 450000)
+        self.pay("LGAC-ROLLUP-2", 500000, None)
+
+        totals = compute_month(self.lga.pk, timezone.localdate().replace(day=1))
+
+        self.assertEqual(totals["revenue"], 450000 + 500000 + 400000)
+
+
+# =====================================================
+# ADMIN CSV EXPORT
+# =====================================================
+class AdminExportTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.lga = LGA.objects.create(name="Akure South", code="AKS")
+        cls.citizen = create_citizen()
+        cls.admin = create_citizen(
+            "admin",
+            nin="10987654321",
+            phone="08087654321",
+            role=get_user_model().ROLE_ADMIN,
+        )
+        cls.application = create_application(cls.citizen, cls.lga)
+
+    def export_data(self):
+        return {"action": "export_csv", "_selected_action": [self.application.pk]}
+
+    def test_streams_sync_under_wsgi(self):
+        self.client.force_login(self.admin)
+
+        response = self.client.post(
+            reverse("admin:applications_application_changelist"),
+            self.export_data(),
+            secure=True,
+        )
+
+        self.assertFalse(response.is_async)
+        rows = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual([row[0] for row in rows[1:]], [str(self.application.pk)])
+
+    def test_formula_values_are_neutralized(self):
+        Application.objects.filter(pk=self.application.pk).update(
+            full_name="=HYPERLINK(\"http://evil\")",
+            purpose="@SUM(A1)",
+            phone="+2348012345678",
+        )
+
+        rows = list(iter_export_rows(Application.objects.all()))
+
+        self.assertEqual(rows[1][4], "'=HYPERLINK(\"http://evil\")")
+        self.assertEqual(rows[1][6], "'+2348012345678")
+        self.assertEqual(rows[1][8], "'@SUM(A1)")
+        self.assertEqual(rows[1][5], self.citizen.email)
+
+    async def test_streams_async_under_asgi(self):
+        await self.async_client.aforce_login(self.admin)
+
+        response = await self.async_client.post(
+            reverse("admin:applications_application_changelist"),
+            self.export_data(),
+            secure=True,
+        )
+
+        # An async iterator: Django would buffer a sync one into a list
+        self.assertTrue(response.is_async)
+        content = b"".join([chunk async for chunk in response.streaming_content])
+        rows = list(csv.reader(io.StringIO(content.decode())))
+        self.assertEqual([row[0] for row in rows[1:]], [str(self.application.pk)])
+
+
+# =====================================================
+# STATUS TRANSITIONS (OFFICER REVIEW / WITHDRAW)
+# =====================================================
+class TransitionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.lga = LGA.objects.create(name="Akure South", code="AKS")
+        cls.citizen = create_citizen()
+        cls.officer = create_citizen(
+            "officer",
+            nin="10987654321",
+            phone="08087654321",
+            role=get_user_model().ROLE_LGA_OFFICER,
+            lga=cls.lga,
+        )
+
+    def review(self, application, **data):
+        self.client.force_login(self.officer)
+        url = reverse("applications:lga_review", args=[application.pk])
+        if data:
+            return self.client.post(url, data, secure=True)
+        return self.client.get(url, secure=True)
+
+    def messages_of(self, response):
+        return [str(message) for message in get_messages(response.wsgi_request)]
+
+    def counts(self):
+        return {status: count for status, count in LGAStatusCounter.totals(lga=self.lga).items() if count}
+
+    def test_opening_review_starts_it(self):
+        application = create_application(self.citizen, self.lga, status=Application.STATUS_PAID)
+
+        self.assertEqual(self.review(application).status_code, 200)
+
+        application.refresh_from_db()
+        self.assertEqual(application.status, Application.STATUS_IN_REVIEW)
+        self.assertEqual(application.transitions.count(), 1)
+
+    def test_post_does_not_start_review(self):
+        application = create_application(self.citizen, self.lga, status=Application.STATUS_PAID)
+
+        response = self.review(application, action="reject")
+
+        self.assertRedirects(response, reverse("applications:lga_dashboard"), fetch_redirect_response=False)
+        self.assertIn("Cannot move application from Paid", self.messages_of(response)[0])
+        application.refresh_from_db()
+        self.assertEqual(application.status, Application.STATUS_PAID)
+        self.assertFalse(application.transitions.exists())
+
+    def test_approve_transitions_before_certificate(self):
+        application = create_application(self.citizen, self.lga, status=Application.STATUS_IN_REVIEW)
+        statuses = []
+
+        def generate(app):
+            statuses.append(Application.objects.get(pk=app.pk).status)
+
+        with mock.patch("apps.applications.views_lga.generate_certificate_pdf", generate):
+            response = self.review(application, action="approve")
+
+        self.assertEqual(statuses, [Application.STATUS_APPROVED])
+        self.assertEqual(self.messages_of(response), ["Application approved and certificate issued."])
+
+    def test_certificate_failure_keeps_approval(self):
+        application = create_application(self.citizen, self.lga, status=Application.STATUS_IN_REVIEW)
+
+        with mock.patch(
+            "apps.applications.views_lga.generate_certificate_pdf",
+            side_effect=OSError("disk full"),
+        ), self.assertLogs("apps.applications.views_lga", "ERROR"):
+            response = self.review(application, action="approve")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("certificate could not be generated", self.messages_of(response)[0])
+        application.refresh_from_db()
+        self.assertEqual(application.status, Application.STATUS_APPROVED)
+        self.assertIsNotNone(application.approved_at)
+
+    def test_approval_needs_checked_passport(self):
+        for verified, expected in ((None, "not been checked yet"), (False, "not a valid image")):
+            with self.subTest(passport_verified=verified):
+                application = create_application(self.citizen, self.lga, status=Application.STATUS_IN_REVIEW)
+                Application.objects.filter(pk=application.pk).update(passport_verified=verified)
+
+                with mock.patch("apps.applications.views_lga.generate_certificate_pdf") as generate:
+                    response = self.review(application, action="approve")
+
+                self.assertIn(expected, self.messages_of(response)[-1])
+                generate.assert_not_called()
+                application.refresh_from_db()
+                self.assertEqual(application.status, Application.STATUS_IN_REVIEW)
+                self.assertIsNone(application.approved_at)
+
+    def test_review_shows_passport_check(self):
+        application = create_application(
+            self.citizen,
+            self.lga,
+            status=Application.STATUS_IN_REVIEW,
+            passport_verified=False,
+        )
+
+        response = self.review(application)
+
+        self.assertContains(response, "Not a valid image")
+        self.assertContains(response, 'class="btn btn-success"\n                    disabled', html=False)
+
+    def test_stale_instance_cannot_double_transition(self):
+        application = create_application(self.citizen, self.lga, status=Application.STATUS_IN_REVIEW)
+        stale = Application.objects.get(pk=application.pk)
+
+        application.transition_to(Application.STATUS_APPROVED, actor=self.officer)
+
+        with self.assertRaises(ValidationError):
+            stale.transition_to(Application.STATUS_REJECTED, actor=self.officer)
+        self.assertEqual(stale.status, Application.STATUS_IN_REVIEW)
+        self.assertFalse(stale.transition_to(Application.STATUS_APPROVED, actor=self.officer))
+
+        self.assertEqual(ApplicationTransition.objects.filter(application=application).count(), 1)
+        self.assertEqual(self.counts(), {Application.STATUS_APPROVED: 1})
+
+    def test_stale_instance_moves_stored_counter_bucket(self):
+        application = create_application(self.citizen, self.lga, status=Application.STATUS_PAID)
+        stale = Application.objects.get(pk=application.pk)
+        Application.objects.get(pk=application.pk).transition_to(Application.STATUS_IN_REVIEW)
+
+        stale.transition_to(Application.STATUS_WITHDRAWN)
+
+        self.assertEqual(self.counts(), {Application.STATUS_WITHDRAWN: 1})
+
+    def test_withdraw_after_decision_shows_message(self):
+        application = create_application(self.citizen, self.lga, status=Application.STATUS_IN_REVIEW)
+        self.client.force_login(self.citizen)
+
+        # Loaded by the view, then approved by an officer
+        stale = Application.objects.get(pk=application.pk)
+        application.transition_to(Application.STATUS_APPROVED, actor=self.officer)
+
+        with mock.patch("apps.applications.views.get_object_or_404", return_value=stale):
+            response = self.client.post(reverse("applications:withdraw", args=[application.pk]), secure=True)
+
+        self.assertRedirects(response, reverse("applications:dashboard"), fetch_redirect_response=False)
+        self.assertEqual(self.messages_of(response), ["This application can no longer be withdrawn."])
+
+
+# =====================================================
+# DASHBOARD COUNTERS (LGAStatusCounter)
+# =====================================================
+class StatusCounterTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.lga = LGA.objects.create(name="Akure South", code="AKS")
+        cls.other_lga = LGA.objects.create(name="Akure North", code="AKN")
+        cls.citizen = create_citizen()
+
+    def counts(self):
+        return {
+            (lga_id, status): count
+            for lga_id, status, count in LGAStatusCounter.objects.values_list("lga_id", "status", "count")
+            if count
+        }
+
+    def test_lga_change_moves_bucket(self):
+        application = create_application(self.citizen, self.lga)
+        changed_at = application.status_changed_at
+
+        application.lga = self.other_lga
+        application.save()
+
+        self.assertEqual(self.counts(), {(self.other_lga.pk, Application.STATUS_SUBMITTED): 1})
+        application.refresh_from_db()
+        self.assertEqual(application.status_changed_at, changed_at)
+
+    def test_lga_change_with_update_fields(self):
+        application = create_application(self.citizen, self.lga)
+
+        application.lga = self.other_lga
+        application.save(update_fields=["lga"])
+
+        self.assertEqual(self.counts(), {(self.other_lga.pk, Application.STATUS_SUBMITTED): 1})
+
+    def test_update_fields_count_only_saved_fields(self):
+        application = create_application(self.citizen, self.lga)
+
+        # Status changed in memory but not saved: the stored one counts
+        application.status = Application.STATUS_PAID
+        application.lga = self.other_lga
+        application.save(update_fields=["lga"])
+
+        self.assertEqual(self.counts(), {(self.other_lga.pk, Application.STATUS_SUBMITTED): 1})
+        self.assertEqual(Application.objects.get().status, Application.STATUS_SUBMITTED)
+
+    def test_delete_uncounts(self):
+        application = create_application(self.citizen, self.lga)
+        create_application(self.citizen, self.lga)
+
+        application.delete()
+
+        self.assertEqual(self.counts(), {(self.lga.pk, Application.STATUS_SUBMITTED): 1})
+
+    def test_queryset_delete_uncounts(self):
+        create_application(self.citizen, self.lga)
+        create_application(self.citizen, self.other_lga, status=Application.STATUS_PAID)
+
+        Application.objects.all().delete()
+
+        self.assertEqual(self.counts(), {})
+
+    def test_archiving_uncounts_once(self):
+        create_application(self.citizen, self.lga, status=Application.STATUS_APPROVED)
+        create_application(self.citizen, self.lga)
+
+        archive_batch(timezone.now() + timedelta(days=1))
+
+        self.assertEqual(self.counts(), {(self.lga.pk, Application.STATUS_SUBMITTED): 1})
+
+    def test_migration_seeds_existing_applications(self):
+        create_application(self.citizen, self.lga)
+        create_application(self.citizen, self.lga)
+        create_application(self.citizen, self.other_lga, status=Application.STATUS_PAID)
+        expected = self.counts()
+        LGAStatusCounter.objects.all().delete()
+
+        migration = importlib.import_module(
+            "apps.applications.migrations.0002_application_status_changed_at_lgastatuscounter"
+        )
+        migration.seed_status_counters(django_apps, None)
+
+        self.assertEqual(self.counts(), expected)
+        self.assertEqual(expected, {
+            (self.lga.pk, Application.STATUS_SUBMITTED): 2,
+            (self.other_lga.pk, Application.STATUS_PAID): 1,
+        })
+
+
+# =====================================================
+# LGA SELECTION (CACHED CHOICES)
+# =====================================================
+class ActiveLGAFieldTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.lga = LGA.objects.create(name="Akure South", code="AKS")
+        cls.inactive = LGA.objects.create(name="Old LGA", code="OLD", is_active=False)
+        cls.citizen = create_citizen()
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_active_lgas()
+
+    def draft_form(self, lga, instance=None):
+        return ApplicationDraftForm(data={"lga": str(lga.pk)}, instance=instance, user=self.citizen)
+
+    def test_assigns_lga_id_and_leaves_lga_lazy(self):
+        form = self.draft_form(self.lga)
+
+        self.assertTrue(form.is_valid(), form.errors)
+        application = form.save(commit=False)
+
+        self.assertEqual(application.lga_id, self.lga.pk)
+        self.assertFalse(Application.lga.is_cached(application))
+        self.assertEqual(form.cleaned_data["lga"], self.lga.pk)
+        self.assertEqual(application.lga, self.lga)
+
+    def test_inactive_lga_rejected(self):
+        form = self.draft_form(self.inactive)
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("lga", form.errors)
+
+    def test_changing_lga_of_saved_draft(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            other = LGA.objects.create(name="Akure North", code="AKN")
+        draft = create_application(self.citizen, self.lga, status=Application.STATUS_DRAFT)
+        draft = Application.objects.get(pk=draft.pk)
+        draft.lga  # cached before the form runs
+
+        form = self.draft_form(other, instance=draft)
+
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.changed_model_fields(), ["lga"])
+        form.save(commit=False).save(update_fields=form.changed_model_fields())
+        self.assertEqual(Application.objects.get(pk=draft.pk).lga, other)
+        self.assertEqual(draft.lga, other)
+
+
+
+# =====================================================
+# DRAFT AUTOSAVE / SUBMIT
+# =====================================================
+class DraftTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.lga = LGA.objects.create(name="Akure South", code="AKS")
+        cls.citizen = create_citizen()
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_active_lgas()
+        self.client.force_login(self.citizen)
+
+    def autosave(self, data):
+        return self.client.patch(
+            reverse("applications:autosave_draft"),
+            json.dumps(data),
+            content_type="application/json",
+            secure=True,
+        )
+
+    def test_first_save_creates_draft(self):
+        response = self.autosave({"lga": self.lga.pk, "home_town": "Akure"})
+
+        self.assertEqual(response.status_code, 200)
+        draft = Application.objects.get(pk=response.json()["id"])
+        self.assertEqual((draft.status, draft.lga, draft.home_town), (Application.STATUS_DRAFT, self.lga, "Akure"))
+
+    def test_partial_save_writes_only_changed_fields(self):
+        draft = create_application(self.citizen, self.lga, status=Application.STATUS_DRAFT)
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.autosave({"home_town": "Ondo", "purpose": "School admission"})
+
+        self.assertEqual(response.status_code, 200)
+        updates = [q["sql"] for q in captured.captured_queries if q["sql"].startswith('UPDATE "applications_application"')]
+        self.assertEqual(len(updates), 1)
+        columns = set(re.findall(r'"(\w+)" = ', updates[0].split(" WHERE ")[0]))
+        self.assertEqual(columns, {"home_town", "updated_at"})
+        draft.refresh_from_db()
+        self.assertEqual((draft.home_town, draft.father_name), ("Ondo", "Father"))
+
+    def test_replayed_save_writes_nothing(self):
+        create_application(self.citizen, self.lga, status=Application.STATUS_DRAFT)
+
+        with CaptureQueriesContext(connection) as captured:
+            self.autosave({"home_town": "Akure"})
+
+        self.assertFalse([q for q in captured.captured_queries if q["sql"].startswith('UPDATE "applications_application"')])
+
+    def test_submitted_application_is_not_touched(self):
+        submitted = create_application(self.citizen, self.lga)
+
+        response = self.autosave({"home_town": "Ondo"})
+
+        # No draft open and no LGA given: nothing to save into
+        self.assertEqual(response.status_code, 400)
+        submitted.refresh_from_db()
+        self.assertEqual((submitted.status, submitted.home_town), (Application.STATUS_SUBMITTED, "Akure"))
+
+    def test_non_draft_fields_rejected(self):
+        response = self.autosave({"status": Application.STATUS_APPROVED})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Unknown field(s): status", response.json()["message"])
+
+    def test_submit_validation_error_rerenders_form(self):
+        draft = create_application(self.citizen, self.lga, status=Application.STATUS_DRAFT)
+        data = {
+            "lga": self.lga.pk,
+            "full_name": draft.full_name,
+            "date_of_birth": "1990-01-01",
+            "place_of_birth": "Akure",
+            "nin": draft.nin,
+            "phone": draft.phone,
+            "email": draft.email,
+            "home_town": "Akure",
+            "family_compound": "Odo",
+            "father_name": "Father",
+            "mother_name": "Mother",
+            "purpose": "School admission",
+            "passport_key": draft.passport_photo.name,
+        }
+
+        storage = Application.passport_photo.field.storage
+        with mock.patch.object(
+            Application,
+            "submit",
+            side_effect=ValidationError({"nin": ["NIN must be 11 digits."]}),
+        ), mock.patch.object(storage, "url", return_value="/media/passports/test.jpg"):
+            response = self.client.post(reverse("applications:new"), data, secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["form"].non_field_errors(), ["NIN must be 11 digits."])
+        draft.refresh_from_db()
+        self.assertEqual(draft.status, Application.STATUS_DRAFT)
@@ -0,0 +1,92 @@
+import logging
+import uuid
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.core.files.storage import default_storage
+from PIL import Image, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+
+# =====================================================
+# DIRECT-TO-BUCKET PASSPORT UPLOADS (PRESIGNED POST)
+# =====================================================
+PASSPORT_MAX_BYTES = 2 * 1024 * 1024
+PASSPORT_CONTENT_TYPES = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+}
+PASSPORT_UPLOAD_PREFIX = "passports/uploads"
+PASSPORT_UPLOAD_EXPIRY = 600  # seconds
+
+
+def direct_upload_supported():
+    """
+    Presigned POST needs the S3/R2 storage backend.
+    Local file storage falls back to uploads through the form.
+    """
+    return bool(getattr(default_storage, "bucket_name", None))
+
+
+def _client():
+    return default_storage.connection.meta.client
+
+
+def passport_key_prefix(user):
+    return f"{PASSPORT_UPLOAD_PREFIX}/{user.pk}/"
+
+
+def issue_passport_upload(user, content_type):
+    """
+    Returns {"url", "fields", "key"} for a browser form POST straight to
+    the bucket. The bucket itself enforces size and content type.
+    """
+    key = f"{passport_key_prefix(user)}{uuid.uuid4().hex}.{PASSPORT_CONTENT_TYPES[content_type]}"
+
+    presigned = _client().generate_presigned_post(
+        Bucket=default_storage.bucket_name,
+        Key=key,
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", 1, PASSPORT_MAX_BYTES],
+        ],
+        ExpiresIn=PASSPORT_UPLOAD_EXPIRY,
+    )
+
+    return {
+        "url": presigned["url"],
+        "fields": presigned["fields"],
+        "key": key,
+    }
+
+
+def head_passport_upload(key):
+    """
+    HEAD the uploaded object.
+    Returns {"size", "content_type"} or None if it does not exist.
+    """
+    try:
+        head = _client().head_object(Bucket=default_storage.bucket_name, Key=key)
+    except (ClientError, BotoCoreError) as exc:
+        logger.info("Passport upload %s not found: %s", key, exc)
+        return None
+
+    return {
+        "size": head.get("ContentLength", 0),
+        "content_type": head.get("ContentType", ""),
+    }
+
+
+def validate_passport_image(name):
+    """
+    Deferred content check: open the stored object and let Pillow verify it.
+    """
+    try:
+        with default_storage.open(name, "rb") as f:
+            with Image.open(f) as image:
+                image.verify()
+    except (OSError, UnidentifiedImageError, ClientError, BotoCoreError) as exc:
+        logger.warning("Passport image %s failed validation: %s", name, exc)
+        return False
+    return True
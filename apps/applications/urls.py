@@ -10,6 +10,8 @@ urlpatterns = [
     # =============================
     path("", views.dashboard, name="dashboard"),
     path("new/", views.new_application, name="new"),
+    path("draft/", views.autosave_draft, name="autosave_draft"),
+    path("passport-upload/", views.passport_upload, name="passport_upload"),
     path("<int:pk>/", views.view_application, name="view"),
 
     # =============================
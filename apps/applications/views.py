@@ -1,14 +1,25 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import FileResponse, Http404
+from django.http import FileResponse, Http404, JsonResponse
 from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.contrib.auth import get_user_model
+from django.views.decorators.http import require_http_methods, require_POST
 
 from apps.accounts.permissions import citizen_required
 
-from .forms import ApplicationForm
+from .archive import applications_of, find_application, find_certificate
+from .forms import ApplicationDraftForm, ApplicationForm
 from .models import Application
+from .uploads import (
+    PASSPORT_CONTENT_TYPES,
+    direct_upload_supported,
+    issue_passport_upload,
+)
 
+import json
 import os
 
 
@@ -19,13 +30,9 @@ import os
 @citizen_required
 def dashboard(request):
     """
-    Citizen dashboard – list ONLY own applications
+    Citizen dashboard – list ONLY own applications (archived included)
     """
-    applications = (
-        Application.objects
-        .filter(applicant=request.user)
-        .order_by("-created_at")
-    )
+    applications = applications_of(request.user)
 
     return render(
         request,
@@ -37,71 +44,166 @@ def dashboard(request):
 # =====================================================
 # NEW APPLICATION (CITIZEN ONLY)
 # =====================================================
+def _open_draft(user):
+    return (
+        Application.objects
+        .filter(applicant=user, status=Application.STATUS_DRAFT)
+        .order_by("-created_at")
+        .first()
+    )
+
+
 @login_required
 @citizen_required
 def new_application(request):
     """
     Create new LGAC application
+
+    • Resumes the applicant's autosaved draft, if any
+    • Submitting moves that draft to SUBMITTED
     """
+    draft = _open_draft(request.user)
+
     if request.method == "POST":
         form = ApplicationForm(
             data=request.POST,
             files=request.FILES,
+            instance=draft,
             user=request.user,
         )
 
         if form.is_valid():
             application = form.save(commit=False)
 
-            # OWNERSHIP & STATUS
+            # OWNERSHIP (DRAFT until submit() snapshots identity)
             application.applicant = request.user
-            application.status = Application.STATUS_SUBMITTED
+            application.status = Application.STATUS_DRAFT
 
-            # SNAPSHOT IDENTITY (IMMUTABLE)
-            application.full_name = request.user.full_name
-            application.email = request.user.email
-            application.phone = request.user.phone
-            application.nin = request.user.nin
-
-            if not application.lga:
+            if not application.lga_id:
                 messages.error(
                     request,
                     "Local Government selection is required."
                 )
                 return redirect("applications:new")
 
-            application.save()
-
-            messages.success(
-                request,
-                "Application submitted successfully. Proceed to payment."
-            )
+            try:
+                with transaction.atomic():
+                    application.save()
+                    application.submit(actor=request.user)
+            except ValidationError as error:
+                # Model checks the form does not run (e.g. the identity snapshot)
+                form.add_error(None, error.messages)
+            else:
+                messages.success(
+                    request,
+                    "Application submitted successfully. Proceed to payment."
+                )
 
-            return redirect(
-                "payments:initiate",
-                application_id=application.id,
-            )
+                return redirect(
+                    "payments:initiate",
+                    application_id=application.id,
+                )
     else:
-        form = ApplicationForm(user=request.user)
+        form = ApplicationForm(instance=draft, user=request.user)
 
     return render(
         request,
         "applications/new_application.html",
-        {"form": form},
+        {"form": form, "draft": draft},
     )
 
 
+# =====================================================
+# DRAFT AUTOSAVE (AJAX — CITIZEN ONLY)
+# =====================================================
+@login_required
+@citizen_required
+@require_http_methods(["PATCH"])
+def autosave_draft(request):
+    """
+    Save the changed fields of the applicant's open draft.
+
+    • JSON body: {field: value} for any of ApplicationDraftForm.DRAFT_FIELDS
+    • Creates the draft on first save (an LGA is required for that)
+    • Idempotent: replaying a PATCH writes nothing
+    """
+    try:
+        payload = json.loads(request.body or b"{}")
+    except ValueError:
+        payload = None
+
+    if not isinstance(payload, dict):
+        return JsonResponse({"saved": False, "message": "Invalid JSON body."}, status=400)
+
+    unknown = set(payload) - set(ApplicationDraftForm.DRAFT_FIELDS)
+    if unknown:
+        return JsonResponse(
+            {"saved": False, "message": f"Unknown field(s): {', '.join(sorted(unknown))}"},
+            status=400,
+        )
+
+    with transaction.atomic():
+        # Serialise per applicant so concurrent first saves can't fork drafts
+        get_user_model().objects.select_for_update().filter(pk=request.user.pk).exists()
+
+        draft = _open_draft(request.user)
+        form = ApplicationDraftForm(data=payload, instance=draft, user=request.user)
+
+        if not form.is_valid():
+            return JsonResponse({"saved": False, "errors": form.errors}, status=400)
+
+        application = form.save(commit=False)
+
+        if draft is None:
+            application.applicant = request.user
+            application.status = Application.STATUS_DRAFT
+            application.save()
+        elif form.changed_data:
+            application.save(update_fields=form.changed_model_fields())
+
+    return JsonResponse({
+        "saved": True,
+        "id": application.pk,
+        "updated_at": application.updated_at,
+    })
+
+
+# =====================================================
+# PASSPORT DIRECT UPLOAD (AJAX — CITIZEN ONLY)
+# =====================================================
+@login_required
+@citizen_required
+@require_POST
+def passport_upload(request):
+    """
+    Issue a presigned POST so the browser uploads the passport photo
+    straight to object storage instead of through this worker.
+    """
+    if not direct_upload_supported():
+        return JsonResponse(
+            {"message": "Direct upload unavailable"},
+            status=501,
+        )
+
+    content_type = request.POST.get("content_type", "")
+    if content_type not in PASSPORT_CONTENT_TYPES:
+        return JsonResponse(
+            {"message": "Passport photo must be JPEG or PNG."},
+            status=400,
+        )
+
+    return JsonResponse(issue_passport_upload(request.user, content_type))
+
+
 # =====================================================
 # VIEW APPLICATION (CITIZEN ONLY)
 # =====================================================
 @login_required
 @citizen_required
 def view_application(request, pk):
-    application = get_object_or_404(
-        Application,
-        pk=pk,
-        applicant=request.user,
-    )
+    application = find_application(pk, applicant=request.user)
+    if application is None:
+        raise Http404("Application not found")
 
     return render(
         request,
@@ -116,14 +218,13 @@ def view_application(request, pk):
 @login_required
 @citizen_required
 def download_certificate(request, pk):
-    application = get_object_or_404(
-        Application,
-        pk=pk,
+    application = find_application(
+        pk,
         applicant=request.user,
         status=Application.STATUS_APPROVED,
     )
 
-    if not application.certificate_hash:
+    if application is None or not application.certificate_hash:
         raise Http404("Certificate not available")
 
     filename = f"lgac_{application.id}_{application.certificate_hash[:12]}.pdf"
@@ -156,10 +257,7 @@ def withdraw_application(request, pk):
         applicant=request.user,
     )
 
-    if application.status not in (
-        Application.STATUS_PAID,
-        Application.STATUS_IN_REVIEW,
-    ):
+    if not application.can_transition_to(Application.STATUS_WITHDRAWN):
         messages.error(
             request,
             "This application can no longer be withdrawn."
@@ -167,8 +265,18 @@ def withdraw_application(request, pk):
         return redirect("applications:dashboard")
 
     if request.method == "POST":
-        application.status = Application.STATUS_WITHDRAWN
-        application.save(update_fields=["status"])
+        try:
+            application.transition_to(
+                Application.STATUS_WITHDRAWN,
+                actor=request.user,
+            )
+        except ValidationError:
+            # Moved on (e.g. approved) since the page was loaded
+            messages.error(
+                request,
+                "This application can no longer be withdrawn."
+            )
+            return redirect("applications:dashboard")
 
         messages.success(
             request,
@@ -187,11 +295,9 @@ def withdraw_application(request, pk):
 # PUBLIC CERTIFICATE VERIFICATION
 # =====================================================
 def verify_certificate(request, hash_value):
-    application = get_object_or_404(
-        Application,
-        certificate_hash=hash_value,
-        status=Application.STATUS_APPROVED,
-    )
+    application = find_certificate(hash_value)
+    if application is None:
+        raise Http404("Certificate not found.")
 
     return render(
         request,
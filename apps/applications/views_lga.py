@@ -1,15 +1,20 @@
+import logging
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 from apps.accounts.permissions import lga_staff_required
-from apps.applications.models import Application
+from apps.applications.models import Application, LGAStatusCounter
 from apps.core.utils import generate_certificate_pdf
 
+logger = logging.getLogger(__name__)
+
 
 # =====================================================
-# INTERNAL HELPER
+# INTERNAL HELPERS
 # =====================================================
 def _get_assigned_lga_or_redirect(request):
     """
@@ -25,6 +30,27 @@ def _get_assigned_lga_or_redirect(request):
     return request.user.lga
 
 
+def _issue_certificate(request, application):
+    """
+    Generate the certificate of a just-approved application.
+    Saves certificate_number / certificate_hash itself.
+    """
+    try:
+        generate_certificate_pdf(application)
+    except Exception:
+        logger.exception("Certificate generation failed for application %s", application.pk)
+        messages.error(
+            request,
+            "Application approved, but the certificate could not be generated. "
+            "Please contact the system administrator."
+        )
+    else:
+        messages.success(
+            request,
+            "Application approved and certificate issued."
+        )
+
+
 # =====================================================
 # LGA OFFICER DASHBOARD
 # =====================================================
@@ -56,12 +82,24 @@ def lga_dashboard(request):
         .order_by("-created_at")
     )
 
+    # Counts come from the denormalized counter table, not COUNT(*)
+    status_counts = LGAStatusCounter.totals(lga=officer_lga)
+    month_counts = LGAStatusCounter.totals(
+        lga=officer_lga,
+        since=timezone.localdate().replace(day=1),
+    )
+
     return render(
         request,
         "lga/dashboard.html",
         {
             "applications": applications,
             "lga": officer_lga,
+            "awaiting_review": (
+                status_counts.get(Application.STATUS_PAID, 0)
+                + status_counts.get(Application.STATUS_IN_REVIEW, 0)
+            ),
+            "approved_this_month": month_counts.get(Application.STATUS_APPROVED, 0),
         },
     )
 
@@ -93,40 +131,48 @@ def lga_review_application(request, pk):
         ],
     )
 
-    # AUTO-TRANSITION: PAID → IN_REVIEW
-    if request.method == "GET" and application.status == Application.STATUS_PAID:
-        application.status = Application.STATUS_IN_REVIEW
-        application.save(update_fields=["status"])
-
     if request.method == "POST":
         action = request.POST.get("action")
         notes = request.POST.get("notes", "").strip()
 
-        application.approver_notes = notes
-
-        if action == "approve":
-            application.status = Application.STATUS_APPROVED
-            application.approved_at = timezone.now()
+        try:
+            if action == "approve":
+                application.approved_at = timezone.now()
+                application.transition_to(
+                    Application.STATUS_APPROVED,
+                    actor=request.user,
+                    note=notes,
+                    update_fields=["approved_at"],
+                )
+                _issue_certificate(request, application)
+
+            elif action == "reject":
+                application.transition_to(
+                    Application.STATUS_REJECTED,
+                    actor=request.user,
+                    note=notes,
+                )
+                messages.warning(request, "Application rejected.")
+
+            else:
+                messages.info(request, "Application marked as in review.")
+
+        except ValidationError as error:
+            # e.g. another officer decided it first
+            messages.error(request, " ".join(error.messages))
 
-            pdf_path, cert_hash = generate_certificate_pdf(application)
-            application.certificate_pdf = pdf_path
-            application.certificate_hash = cert_hash
+        return redirect("applications:lga_dashboard")
 
-            messages.success(
-                request,
-                "Application approved and certificate issued."
+    # AUTO-TRANSITION on opening the review page: PAID → IN_REVIEW
+    if application.status == Application.STATUS_PAID:
+        try:
+            application.transition_to(
+                Application.STATUS_IN_REVIEW,
+                actor=request.user,
             )
-
-        elif action == "reject":
-            application.status = Application.STATUS_REJECTED
-            messages.warning(request, "Application rejected.")
-
-        else:
-            application.status = Application.STATUS_IN_REVIEW
-            messages.info(request, "Application marked as in review.")
-
-        application.save()
-        return redirect("applications:lga_dashboard")
+        except ValidationError as error:
+            messages.error(request, " ".join(error.messages))
+            return redirect("applications:lga_dashboard")
 
     return render(
         request,
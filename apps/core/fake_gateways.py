@@ -0,0 +1,376 @@
+import hashlib
+import hmac
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone as dt_timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from django.conf import settings
+
+
+# =====================================================
+# FAKE PAYSTACK + VERIFYME (LOAD TESTING ONLY)
+# =====================================================
+# Implements just the endpoints this project calls:
+#
+#   POST /transaction/initialize         Paystack
+#   GET  /transaction/verify/<reference> Paystack
+#   GET  /transaction                    Paystack (list, for reconciliation)
+#   GET  /checkout/<reference>           hosted checkout → callback + webhook
+#   POST /v1/verifications/nin           VerifyMe
+#   GET  /v1/verify/nin/<nin>            VerifyMe (legacy helper)
+
+
+def latency_sampler(spec):
+    """
+    Parse a latency spec into a function returning seconds.
+
+    • "0" / "fixed:50"         – constant milliseconds
+    • "uniform:20,200"         – uniform between bounds
+    • "normal:100,30"          – mean, stddev (clamped at 0)
+    • "lognormal:100,0.5"      – median, sigma (long tail)
+    • "exp:80"                 – exponential with this mean
+    """
+    kind, _, args = str(spec).partition(":")
+    if not args:
+        kind, args = "fixed", kind
+    values = [float(value) for value in args.split(",")]
+
+    samplers = {
+        "fixed": lambda: values[0],
+        "uniform": lambda: random.uniform(values[0], values[1]),
+        "normal": lambda: max(0.0, random.gauss(values[0], values[1])),
+        "lognormal": lambda: random.lognormvariate(0, values[1]) * values[0],
+        "exp": lambda: random.expovariate(1 / values[0]) if values[0] else 0.0,
+    }
+    if kind not in samplers:
+        raise ValueError(f"Unknown latency distribution: {kind}")
+
+    sample = samplers[kind]
+    return lambda: sample() / 1000
+
+
+class FakeGatewayConfig:
+    def __init__(
+        self,
+        latency="0",
+        error_rate=0.0,
+        max_rps=None,
+        decline_rate=0.0,
+        nin_fail_rate=0.0,
+        webhook_url=None,
+        webhook_delay=0.5,
+        webhook_repeat=1,
+        secret=None,
+        seed=None,
+    ):
+        self.latency = latency_sampler(latency)
+        self.error_rate = error_rate
+        self.max_rps = max_rps
+        self.decline_rate = decline_rate
+        self.nin_fail_rate = nin_fail_rate
+        self.webhook_url = webhook_url
+        self.webhook_delay = webhook_delay
+        self.webhook_repeat = webhook_repeat
+        self.secret = secret or settings.PAYSTACK_SECRET_KEY or "sk_test_fake"
+
+        if seed is not None:
+            random.seed(seed)
+
+
+class _TokenBucket:
+    """
+    Throughput cap shared by all handler threads.
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class FakeGatewayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, config=None):
+        self.config = config or FakeGatewayConfig()
+        self.bucket = _TokenBucket(self.config.max_rps) if self.config.max_rps else None
+        self.transactions = {}
+        self.lock = threading.Lock()
+        super().__init__(address, _Handler)
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def settings_overrides(self):
+        """
+        Settings that point this project at the fake, e.g. for
+        override_settings(**server.settings_overrides()).
+        """
+        return {
+            "PAYSTACK_BASE_URL": self.base_url,
+            "PAYSTACK_INIT_URL": f"{self.base_url}/transaction/initialize",
+            "PAYSTACK_VERIFY_URL": f"{self.base_url}/transaction/verify/",
+            "VERIFYME_BASE_URL": self.base_url,
+            "VERIFYME_NIN_URL": f"{self.base_url}/v1/verifications/nin",
+        }
+
+    # =========================
+    # WEBHOOK EMITTER
+    # =========================
+    def emit_webhook(self, event, data):
+        if not self.config.webhook_url:
+            return
+
+        body = json.dumps({"event": event, "data": data}).encode()
+        signature = hmac.new(self.config.secret.encode(), body, hashlib.sha512).hexdigest()
+
+        def send():
+            time.sleep(self.config.webhook_delay)
+            for _ in range(self.config.webhook_repeat):
+                try:
+                    requests.post(
+                        self.config.webhook_url,
+                        data=body,
+                        headers={
+                            "Content-Type": "application/json",
+                            "x-paystack-signature": signature,
+                        },
+                        timeout=10,
+                    )
+                except requests.RequestException:
+                    pass
+
+        threading.Thread(target=send, daemon=True).start()
+
+
+def _now():
+    return datetime.now(dt_timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _parse(value, default=None):
+    if not value:
+        return default
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=dt_timezone.utc)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeGateway/1.0"
+
+    ROUTES = (
+        ("POST", re.compile(r"^/transaction/initialize/?$"), "initialize"),
+        ("GET", re.compile(r"^/transaction/verify/(?P<reference>[^/]+)/?$"), "verify"),
+        ("GET", re.compile(r"^/transaction/?$"), "list"),
+        ("GET", re.compile(r"^/checkout/(?P<reference>[^/]+)/?$"), "checkout"),
+        ("POST", re.compile(r"^/v1/verifications/nin/?$"), "nin"),
+        ("GET", re.compile(r"^/v1/verify/nin/(?P<nin>\d+)/?$"), "nin"),
+    )
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    # =========================
+    # PLUMBING
+    # =========================
+    def _dispatch(self, method):
+        url = urlparse(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            self.body = json.loads(raw) if raw else {}
+        except ValueError:
+            self.body = {}
+
+        for route_method, pattern, name in self.ROUTES:
+            match = pattern.match(url.path)
+            if match and route_method == method:
+                break
+        else:
+            return self._json(404, {"status": False, "message": "Not found"})
+
+        config = self.server.config
+        if self.server.bucket and not self.server.bucket.take():
+            return self._json(429, {"status": False, "message": "Rate limit exceeded"}, {"Retry-After": "1"})
+
+        time.sleep(config.latency())
+
+        if name != "checkout" and random.random() < config.error_rate:
+            return self._json(503, {"status": False, "message": "Service unavailable"})
+
+        getattr(self, f"handle_{name}")(**match.groupdict())
+
+    def _json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _redirect(self, location):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    # =========================
+    # PAYSTACK
+    # =========================
+    def handle_initialize(self):
+        reference = self.body.get("reference") or f"FAKE-{uuid.uuid4().hex}"
+
+        with self.server.lock:
+            if reference in self.server.transactions:
+                return self._json(400, {"status": False, "message": "Duplicate Transaction Reference"})
+
+            self.server.transactions[reference] = {
+                "id": len(self.server.transactions) + 1,
+                "reference": reference,
+                "amount": self.body.get("amount"),
+                "currency": "NGN",
+                "status": "abandoned",
+                "paid_at": None,
+                "created_at": _now(),
+                "customer": {"email": self.body.get("email")},
+                "metadata": self.body.get("metadata"),
+                "callback_url": self.body.get("callback_url"),
+            }
+
+        self._json(200, {
+            "status": True,
+            "message": "Authorization URL created",
+            "data": {
+                "authorization_url": f"{self.server.base_url}/checkout/{reference}",
+                "access_code": uuid.uuid4().hex[:15],
+                "reference": reference,
+            },
+        })
+
+    def handle_checkout(self, reference):
+        """
+        Stand-in for the hosted checkout: settle, then send the citizen
+        back to the callback and fire the webhook.
+        """
+        with self.server.lock:
+            transaction = self.server.transactions.get(reference)
+            if transaction is None:
+                return self._json(404, {"status": False, "message": "Transaction not found"})
+
+            if random.random() < self.server.config.decline_rate:
+                transaction["status"] = "failed"
+            else:
+                transaction["status"] = "success"
+                transaction["paid_at"] = _now()
+            data = {k: v for k, v in transaction.items() if k != "callback_url"}
+
+        if data["status"] == "success":
+            self.server.emit_webhook("charge.success", data)
+
+        callback = transaction.get("callback_url")
+        if not callback:
+            return self._json(200, {"status": True, "data": data})
+
+        separator = "&" if "?" in callback else "?"
+        self._redirect(f"{callback}{separator}trxref={reference}&reference={reference}")
+
+    def handle_verify(self, reference):
+        transaction = self.server.transactions.get(reference)
+        if transaction is None:
+            return self._json(400, {"status": False, "message": "Transaction reference not found"})
+
+        data = {k: v for k, v in transaction.items() if k != "callback_url"}
+        self._json(200, {"status": True, "message": "Verification successful", "data": data})
+
+    def handle_list(self):
+        page = max(int(self.query.get("page", 1)), 1)
+        per_page = max(int(self.query.get("perPage", 50)), 1)
+        start = _parse(self.query.get("from"), datetime.min.replace(tzinfo=dt_timezone.utc))
+        end = _parse(self.query.get("to"), datetime.max.replace(tzinfo=dt_timezone.utc))
+
+        with self.server.lock:
+            rows = [
+                {k: v for k, v in t.items() if k != "callback_url"}
+                for t in self.server.transactions.values()
+                if start <= _parse(t["created_at"]) <= end
+            ]
+
+        page_count = max(-(-len(rows) // per_page), 1)
+        self._json(200, {
+            "status": True,
+            "data": rows[(page - 1) * per_page:page * per_page],
+            "meta": {"total": len(rows), "page": page, "perPage": per_page, "pageCount": page_count},
+        })
+
+    # =========================
+    # VERIFYME
+    # =========================
+    def handle_nin(self, nin=None):
+        nin = nin or str(self.body.get("nin") or "")
+
+        if not re.fullmatch(r"\d{11}", nin) or random.random() < self.server.config.nin_fail_rate:
+            return self._json(200, {"status": False, "message": "NIN not found"})
+
+        self._json(200, {
+            "status": True,
+            "data": {
+                "nin": nin,
+                "firstname": "Test",
+                "lastname": f"Citizen{nin[-4:]}",
+                "birthdate": "1990-01-01",
+                "gender": "M",
+            },
+        })
+
+
+@contextmanager
+def running_fake_gateways(host="127.0.0.1", port=0, **config):
+    """
+    Run the fake gateways in a background thread, e.g. as a pytest fixture:
+
+        @pytest.fixture
+        def fake_gateways(settings):
+            with running_fake_gateways(latency="uniform:5,20") as server:
+                for name, value in server.settings_overrides().items():
+                    setattr(settings, name, value)
+                yield server
+    """
+    server = FakeGatewayServer((host, port), FakeGatewayConfig(**config))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
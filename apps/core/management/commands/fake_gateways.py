@@ -0,0 +1,83 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.fake_gateways import FakeGatewayConfig, FakeGatewayServer
+
+
+class Command(BaseCommand):
+    help = "Run a local fake Paystack + VerifyMe server for load testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8001)
+        parser.add_argument(
+            "--latency",
+            default="0",
+            help='Latency spec in ms, e.g. "fixed:50", "uniform:20,200", "lognormal:100,0.5"',
+        )
+        parser.add_argument(
+            "--error-rate",
+            type=float,
+            default=0.0,
+            help="Fraction of API calls answered with HTTP 503",
+        )
+        parser.add_argument(
+            "--max-rps",
+            type=float,
+            default=None,
+            help="Throughput cap; requests over it get HTTP 429",
+        )
+        parser.add_argument(
+            "--decline-rate",
+            type=float,
+            default=0.0,
+            help="Fraction of checkouts that end as failed",
+        )
+        parser.add_argument(
+            "--nin-fail-rate",
+            type=float,
+            default=0.0,
+            help="Fraction of valid NINs reported as not found",
+        )
+        parser.add_argument(
+            "--webhook-url",
+            default=None,
+            help="Where to POST signed charge.success webhooks",
+        )
+        parser.add_argument("--webhook-delay", type=float, default=0.5)
+        parser.add_argument(
+            "--webhook-repeat",
+            type=int,
+            default=1,
+            help="Deliver each webhook this many times (retry storms)",
+        )
+        parser.add_argument("--seed", type=int, default=None)
+
+    def handle(self, *args, **options):
+        try:
+            config = FakeGatewayConfig(
+                latency=options["latency"],
+                error_rate=options["error_rate"],
+                max_rps=options["max_rps"],
+                decline_rate=options["decline_rate"],
+                nin_fail_rate=options["nin_fail_rate"],
+                webhook_url=options["webhook_url"],
+                webhook_delay=options["webhook_delay"],
+                webhook_repeat=options["webhook_repeat"],
+                seed=options["seed"],
+            )
+        except (ValueError, IndexError) as error:
+            raise CommandError(f"Invalid --latency: {error}")
+
+        server = FakeGatewayServer((options["host"], options["port"]), config)
+
+        self.stdout.write(self.style.SUCCESS(f"Fake gateways listening on {server.base_url}"))
+        self.stdout.write("Point the app at it with:")
+        for name, value in server.settings_overrides().items():
+            self.stdout.write(f"  export {name}={value}")
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
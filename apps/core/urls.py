@@ -6,4 +6,5 @@ app_name = "core"
 urlpatterns = [
     path("", views.home, name="home"),
     path("verify/<str:hash_value>/", views.verify_certificate, name="verify_certificate"),
+    path("metrics/", views.metrics, name="metrics"),
 ]
@@ -2,7 +2,6 @@
 import io
 import os
 import hashlib
-import requests
 import qrcode
 from datetime import datetime
 
@@ -16,6 +15,8 @@ from django.core.files.storage import default_storage
 from reportlab.lib.colors import green
 from io import BytesIO
 
+from apps.accounts.services.verifyme import VerifyMeError, get_client as get_verifyme_client
+
 
 def draw_image_safe(pdf, file_field, x, y, width, height):
     """
@@ -60,14 +61,11 @@ def verify_nin_with_verifyme(nin):
     if not api_key:
         return False, {"error": "Missing API key"}
 
-    url = f"https://api.verifyme.ng/v1/verify/nin/{nin}"
-    headers = {"Authorization": f"Bearer {api_key}"}
-
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
-        return resp.status_code == 200, resp.json()
-    except requests.RequestException as e:
+        verified, data = get_verifyme_client().verify_nin(nin)
+    except VerifyMeError as e:
         return False, {"error": str(e)}
+    return verified, data or {}
 
 
 # =====================================================
@@ -116,6 +114,8 @@ def generate_certificate_pdf(application):
     Generates a government-grade LGAC certificate.
     Returns (relative_pdf_path, verification_hash)
     """
+    if application.passport_verified is not True:
+        raise ValueError(f"Application {application.pk} has no verified passport photograph.")
 
     # -------------------------------------------------
     # CERTIFICATE NUMBER + HASH
@@ -1,6 +1,11 @@
-from django.shortcuts import render, get_object_or_404
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import Http404, JsonResponse
+from django.shortcuts import render
 
-from apps.applications.models import Application
+from apps.accounts import nin_cache, snapshot
+from apps.accounts.services import verifyme
+from apps.applications.archive import find_certificate
+from apps.payments import service as paystack
 
 
 # =====================================================
@@ -23,13 +28,12 @@ def verify_certificate(request, hash_value):
     • No authentication required
     • Read-only
     • Verifies only APPROVED certificates
+    • Covers archived applications too
     """
 
-    application = get_object_or_404(
-        Application,
-        certificate_hash=hash_value,
-        status=Application.STATUS_APPROVED,
-    )
+    application = find_certificate(hash_value)
+    if application is None:
+        raise Http404("Certificate not found.")
 
     return render(
         request,
@@ -38,3 +42,19 @@ def verify_certificate(request, hash_value):
             "application": application,
         },
     )
+
+
+# =====================================================
+# OUTBOUND CALL METRICS (STAFF)
+# =====================================================
+@staff_member_required
+def metrics(request):
+    """
+    Gateway and cache counters for the process serving this request.
+    """
+    return JsonResponse({
+        "paystack": paystack.metrics_snapshot(),
+        "verifyme": verifyme.metrics_snapshot(),
+        "nin_verification": nin_cache.metrics_snapshot(),
+        "user_snapshot": snapshot.metrics_snapshot(),
+    })
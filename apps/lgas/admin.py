@@ -1,6 +1,10 @@
 from django.contrib import admin, messages
+from django.db.models import Q, Sum
+from django.utils import timezone
 from django.utils.html import format_html
 
+from apps.applications.models import Application
+from .cache import invalidate_active_lgas
 from .models import LGA
 
 
@@ -15,6 +19,8 @@ class LGAAdmin(admin.ModelAdmin):
         "code",
         "is_active",
         "certificate_ready",
+        "awaiting_review",
+        "approved_this_month",
         "created_at",
     )
 
@@ -59,6 +65,38 @@ class LGAAdmin(admin.ModelAdmin):
     # =========================
     actions = ("activate_lgas", "deactivate_lgas")
 
+    # =========================
+    # COUNTS (FROM STATUS COUNTERS)
+    # =========================
+    def get_queryset(self, request):
+        month_start = timezone.localdate().replace(day=1)
+        return super().get_queryset(request).annotate(
+            awaiting_review_count=Sum(
+                "status_counters__count",
+                filter=Q(status_counters__status__in=[
+                    Application.STATUS_PAID,
+                    Application.STATUS_IN_REVIEW,
+                ]),
+                default=0,
+            ),
+            approved_this_month_count=Sum(
+                "status_counters__count",
+                filter=Q(
+                    status_counters__status=Application.STATUS_APPROVED,
+                    status_counters__day__gte=month_start,
+                ),
+                default=0,
+            ),
+        )
+
+    @admin.display(description="Awaiting Review", ordering="awaiting_review_count")
+    def awaiting_review(self, obj: LGA) -> int:
+        return obj.awaiting_review_count
+
+    @admin.display(description="Approved This Month", ordering="approved_this_month_count")
+    def approved_this_month(self, obj: LGA) -> int:
+        return obj.approved_this_month_count
+
     # =========================
     # COMPUTED COLUMNS
     # =========================
@@ -109,6 +147,7 @@ class LGAAdmin(admin.ModelAdmin):
 
     def deactivate_lgas(self, request, queryset):
         queryset.update(is_active=False)
+        invalidate_active_lgas()
         self.message_user(
             request,
             "Selected Local Governments deactivated.",
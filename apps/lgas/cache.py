@@ -0,0 +1,64 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+# =====================================================
+# ACTIVE LGA CHOICES (PROCESS-LOCAL + SHARED CACHE)
+# =====================================================
+ACTIVE_LGAS_CACHE_KEY = "lgas:active"
+ACTIVE_LGAS_CACHE_TIMEOUT = 60 * 60  # shared cache, seconds
+ACTIVE_LGAS_LOCAL_TTL = 30           # per process, seconds
+
+_local = {"expires": 0.0, "lgas": ()}
+
+
+def active_lgas():
+    """
+    Active LGAs as a tuple of (id, name, code), ordered by name.
+
+    Served from process memory, then the shared cache, then the database.
+    Other processes see an invalidation within ACTIVE_LGAS_LOCAL_TTL.
+    """
+    now = time.monotonic()
+    if _local["expires"] > now:
+        return _local["lgas"]
+
+    lgas = cache.get(ACTIVE_LGAS_CACHE_KEY)
+    if lgas is None:
+        from .models import LGA
+
+        lgas = tuple(
+            LGA.objects
+            .filter(is_active=True)
+            .order_by("name")
+            .values_list("id", "name", "code")
+        )
+        cache.set(ACTIVE_LGAS_CACHE_KEY, lgas, ACTIVE_LGAS_CACHE_TIMEOUT)
+
+    _local.update(expires=now + ACTIVE_LGAS_LOCAL_TTL, lgas=lgas)
+    return lgas
+
+
+def active_lga(pk):
+    """
+    Cached (id, name, code) for an active LGA, or None.
+    """
+    for lga in active_lgas():
+        if lga[0] == pk:
+            return lga
+    return None
+
+
+def _drop_cached_lgas():
+    _local["expires"] = 0.0
+    cache.delete(ACTIVE_LGAS_CACHE_KEY)
+
+
+def invalidate_active_lgas():
+    """
+    Drop cached LGAs once the surrounding transaction commits.
+    """
+    _local["expires"] = 0.0
+    transaction.on_commit(_drop_cached_lgas)
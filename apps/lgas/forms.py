@@ -0,0 +1,60 @@
+from django import forms
+
+from .cache import active_lga, active_lgas
+from .models import LGA
+
+
+class ActiveLGAChoiceField(forms.TypedChoiceField):
+    """
+    LGA selector built from the cached active-LGA list.
+
+    Rendering and checking a submitted id run no queries; the cleaned
+    value is the LGA id. Model forms take it through ActiveLGAFormMixin.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("label", "Local Government Area")
+        super().__init__(
+            choices=self._active_choices,
+            coerce=self._to_lga,
+            empty_value=None,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _active_choices():
+        return [("", "---------")] + [(pk, name) for pk, name, _ in active_lgas()]
+
+    @staticmethod
+    def _to_lga(value):
+        if active_lga(int(value)) is None:
+            raise forms.ValidationError("Select a valid Local Government Area.")
+        return int(value)
+
+    def prepare_value(self, value):
+        if isinstance(value, LGA):
+            return value.pk
+        return value
+
+
+class ActiveLGAFormMixin:
+    """
+    ModelForm mixin for ActiveLGAChoiceField fields: the cleaned id is
+    assigned to the instance's `<field>_id`, so the LGA itself stays
+    lazy and is only loaded if something reads it.
+    """
+
+    def _post_clean(self):
+        lga_ids = {
+            name: self.cleaned_data.pop(name)
+            for name, field in self.fields.items()
+            if isinstance(field, ActiveLGAChoiceField) and name in self.cleaned_data
+        }
+        for name, pk in lga_ids.items():
+            setattr(self.instance, self.instance._meta.get_field(name).attname, pk)
+
+        try:
+            super()._post_clean()
+        finally:
+            self.cleaned_data.update(lga_ids)
+
@@ -146,9 +146,27 @@ class LGA(models.Model):
         Auto-generate slug if missing.
         Slug is intentionally NOT unique to avoid legacy migration conflicts.
         """
+        from .cache import invalidate_active_lgas
+
         if not self.slug:
             self.slug = slugify(self.name)
         super().save(*args, **kwargs)
+        invalidate_active_lgas()
+
+        # Officers' cached user snapshots carry the LGA name
+        from apps.accounts import snapshot
+
+        snapshot.invalidate(*self.officers.values_list("pk", flat=True))
+
+    def delete(self, *args, **kwargs):
+        from apps.accounts import snapshot
+        from .cache import invalidate_active_lgas
+
+        officers = [*self.officers.values_list("pk", flat=True)]
+        result = super().delete(*args, **kwargs)
+        invalidate_active_lgas()
+        snapshot.invalidate(*officers)
+        return result
 
     # =========================
     # REPRESENTATION
@@ -0,0 +1,56 @@
+from django.contrib import admin
+from django.urls import path
+from django.utils import timezone
+
+from apps.core.streaming import csv_response
+
+from .ledger import stream_revenue_csv
+from .models import DailyRevenue
+
+
+@admin.register(DailyRevenue)
+class DailyRevenueAdmin(admin.ModelAdmin):
+    """
+    Read-only daily revenue per LGA and channel. Rows are maintained by
+    the revenue ledger; `manage.py check_revenue_ledger` audits them.
+    """
+
+    change_list_template = "admin/payments/dailyrevenue/change_list.html"
+
+    list_display = ("day", "lga", "channel", "payments", "revenue_naira")
+    list_filter = ("channel", "lga")
+    ordering = ("-day", "lga__name", "channel")
+    list_select_related = ("lga",)
+    date_hierarchy = "day"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    @admin.display(description="Revenue (₦)", ordering="amount")
+    def revenue_naira(self, obj):
+        return f"{obj.amount / 100:,.2f}"
+
+    # =========================
+    # CSV EXPORT
+    # =========================
+    def get_urls(self):
+        return [
+            path(
+                "export/",
+                self.admin_site.admin_view(self.export_view),
+                name="payments_dailyrevenue_export",
+            ),
+        ] + super().get_urls()
+
+    def export_view(self, request):
+        # Same filters, date drill-down and ordering as the changelist
+        queryset = self.get_changelist_instance(request).get_queryset(request)
+        filename = f"lgac_revenue_{timezone.localdate():%Y%m%d}.csv"
+
+        return csv_response(request, stream_revenue_csv(queryset), filename)
@@ -0,0 +1,209 @@
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Payment, PaymentPayload, PaystackEvent
+from .service import get_client
+
+logger = logging.getLogger(__name__)
+
+
+# =====================================================
+# WEBHOOK INBOX WORKER
+# =====================================================
+INBOX_BATCH_SIZE = 100
+
+# Queued by the checkout callback (not a Paystack event name)
+VERIFY_EVENT = "lgac.verify"
+
+# Paystack verify statuses that are not final yet
+VERIFY_IN_PROGRESS = ("ongoing", "pending", "processing", "queued")
+
+RETRY_BASE_DELAY = timedelta(seconds=15)
+
+# A claimed event is hidden from other workers this long; a worker that
+# dies mid-batch leaves its events to be retried after it
+CLAIM_LEASE = timedelta(minutes=2)
+
+# A queued verify still waiting after this long means no worker is
+# draining the inbox (or it is behind): the callback verifies inline
+VERIFY_INLINE_AFTER = timedelta(seconds=30)
+
+
+class RetryLater(Exception):
+    """
+    The event cannot be applied yet; retry it after a backoff.
+    """
+
+
+def pending_events(now=None):
+    now = now or timezone.now()
+    return PaystackEvent.objects.filter(
+        Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now),
+        processed_at__isnull=True,
+        attempts__lt=PaystackEvent.MAX_ATTEMPTS,
+    )
+
+
+def enqueue_verification(reference):
+    """
+    Queue a deferred Paystack verify for `reference` (deduplicated).
+
+    There is one verify row per reference (unique event + reference):
+    once it has been processed or has run out of attempts, it is reset
+    and re-armed (received_at restarted) rather than inserted again.
+    """
+    PaystackEvent.objects.bulk_create(
+        [PaystackEvent(event=VERIFY_EVENT, reference=reference, payload={})],
+        ignore_conflicts=True,
+    )
+    PaystackEvent.objects.filter(
+        Q(processed_at__isnull=False) | Q(attempts__gte=PaystackEvent.MAX_ATTEMPTS),
+        event=VERIFY_EVENT,
+        reference=reference,
+    ).update(
+        processed_at=None,
+        attempts=0,
+        next_attempt_at=None,
+        last_error="",
+        received_at=timezone.now(),
+    )
+
+
+def verification_is_stale(reference, now=None):
+    """
+    True if the queued verify for `reference` has waited longer than
+    VERIFY_INLINE_AFTER without being processed.
+    """
+    now = now or timezone.now()
+    return PaystackEvent.objects.filter(
+        event=VERIFY_EVENT,
+        reference=reference,
+        processed_at__isnull=True,
+        received_at__lte=now - VERIFY_INLINE_AFTER,
+    ).exists()
+
+
+def apply_charge_success(event):
+    """
+    Settle the payment for a `charge.success` event.
+    Unknown references and already-settled payments are no-ops.
+    """
+    Payment.apply_gateway_result(
+        event.reference,
+        True,
+        event.payload,
+        PaymentPayload.SOURCE_WEBHOOK,
+    )
+
+
+def verify_reference(reference):
+    """
+    Ask Paystack for the outcome of a checkout the citizen returned from.
+    Raises RetryLater while the transaction is still running.
+    """
+    if not Payment.objects.filter(
+        reference=reference,
+        status__in=[Payment.STATUS_PENDING, Payment.STATUS_FAILED],
+    ).exists():
+        return
+
+    data = get_client().verify_transaction(reference)
+    status = (data.get("data") or {}).get("status")
+    if status in VERIFY_IN_PROGRESS:
+        raise RetryLater(f"Paystack status {status!r}")
+
+    # A webhook may have settled it while Paystack was being asked
+    Payment.apply_gateway_result(
+        reference,
+        status == "success",
+        data,
+        PaymentPayload.SOURCE_VERIFY,
+    )
+
+
+def apply_verification(event):
+    """
+    Handler for a queued verify; still-running transactions are retried
+    later.
+    """
+    verify_reference(event.reference)
+
+
+HANDLERS = {
+    "charge.success": apply_charge_success,
+    VERIFY_EVENT: apply_verification,
+}
+
+
+def claim_batch(batch_size=INBOX_BATCH_SIZE):
+    """
+    Claim up to `batch_size` pending events in one short transaction.
+
+    • Events locked by another worker are skipped
+    • Claimed events count an attempt and are leased (next_attempt_at
+      pushed CLAIM_LEASE ahead), so no other worker picks them up while
+      their handlers run outside the transaction
+    """
+    with transaction.atomic():
+        events = list(
+            pending_events()
+            .select_for_update(skip_locked=True)
+            .order_by("id")[:batch_size]
+        )
+
+        lease = timezone.now() + CLAIM_LEASE
+        for event in events:
+            event.attempts += 1
+            event.next_attempt_at = lease
+
+        PaystackEvent.objects.bulk_update(events, ["attempts", "next_attempt_at"])
+
+    return events
+
+
+def _finish(event, **fields):
+    """
+    Record the outcome of a claimed event. A no-op if the event was
+    re-armed meanwhile (its lease is gone), so the new request runs.
+    """
+    PaystackEvent.objects.filter(
+        pk=event.pk,
+        next_attempt_at=event.next_attempt_at,
+    ).update(**fields)
+
+
+def process_batch(batch_size=INBOX_BATCH_SIZE):
+    """
+    Claim one batch of pending events, then apply them one by one.
+
+    • No transaction is held across handlers: a verify waits on Paystack
+      without locks, then settles through Payment.apply_gateway_result
+      (its own short, conditional transaction)
+    • A failure is recorded on the event and retried with exponential
+      backoff, up to MAX_ATTEMPTS
+    Returns the number of events claimed.
+    """
+    events = claim_batch(batch_size)
+
+    for event in events:
+        handler = HANDLERS.get(event.event)
+
+        try:
+            if handler is not None:
+                handler(event)
+        except Exception as error:
+            if not isinstance(error, RetryLater):
+                logger.exception("Paystack event %s failed", event.pk)
+            _finish(
+                event,
+                last_error=f"{type(error).__name__}: {error}",
+                next_attempt_at=timezone.now() + RETRY_BASE_DELAY * 2 ** (event.attempts - 1),
+            )
+        else:
+            _finish(event, processed_at=timezone.now(), last_error="")
+
+    return len(events)
@@ -0,0 +1,152 @@
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from apps.core.streaming import csv_line_writer
+
+from .models import DailyRevenue, RevenueLedgerEntry
+
+
+# =====================================================
+# REVENUE LEDGER
+# =====================================================
+UNKNOWN_CHANNEL = "unknown"
+
+
+def ledger_entry(payment, lga_id=None):
+    """
+    Unsaved ledger entry for a settled payment.
+    """
+    return RevenueLedgerEntry(
+        payment=payment,
+        reference=payment.reference,
+        lga_id=lga_id or payment.application.lga_id,
+        channel=payment.channel or UNKNOWN_CHANNEL,
+        amount=payment.paid_amount or payment.amount,
+        day=timezone.localdate(payment.paid_at or timezone.now()),
+    )
+
+
+def record_revenue(payment, lga_id=None):
+    """
+    Append the ledger entry for a payment that just became SUCCESS and
+    bump its daily bucket. Call inside the settling transaction.
+    Idempotent: a payment already in the ledger is skipped.
+    Returns True when an entry was written.
+    """
+    entry = ledger_entry(payment, lga_id)
+    try:
+        with transaction.atomic():
+            entry.save()
+    except IntegrityError:
+        return False
+
+    DailyRevenue.adjust(entry.lga_id, entry.day, entry.channel, entry.amount, 1)
+    return True
+
+
+def record_bulk_revenue(payments):
+    """
+    Set-based record_revenue() for many payments (reconciliation).
+    Payments must be locked by the caller. Returns the entries written.
+    """
+    payments = list(payments)
+    if not payments:
+        return 0
+
+    existing = set(
+        RevenueLedgerEntry.objects
+        .filter(reference__in=[payment.reference for payment in payments])
+        .values_list("reference", flat=True)
+    )
+    entries = [
+        ledger_entry(payment)
+        for payment in payments
+        if payment.reference not in existing
+    ]
+    RevenueLedgerEntry.objects.bulk_create(entries)
+
+    amounts, counts = Counter(), Counter()
+    for entry in entries:
+        bucket = (entry.lga_id, entry.day, entry.channel)
+        amounts[bucket] += entry.amount
+        counts[bucket] += 1
+
+    for (lga_id, day, channel), count in counts.items():
+        DailyRevenue.adjust(lga_id, day, channel, amounts[(lga_id, day, channel)], count)
+
+    return len(entries)
+
+
+def rebuild_daily_revenue(day):
+    """
+    Recompute one day's DailyRevenue buckets from the ledger, in place.
+
+    • The day's buckets are locked before the ledger is summed, so a
+      concurrent adjust() either committed first (and is counted) or
+      waits and lands on top of the corrected value
+    • Corrections are applied as deltas through adjust(), which also
+      copes with a bucket created meanwhile
+    Returns the number of buckets corrected.
+    """
+    with transaction.atomic():
+        actual = {
+            (lga_id, channel): (amount, payments)
+            for lga_id, channel, amount, payments in (
+                DailyRevenue.objects
+                .select_for_update()
+                .filter(day=day)
+                .values_list("lga_id", "channel", "amount", "payments")
+            )
+        }
+        expected = {
+            (lga_id, channel): (amount, payments)
+            for lga_id, channel, amount, payments in (
+                RevenueLedgerEntry.objects
+                .filter(day=day)
+                .values("lga_id", "channel")
+                .annotate(total=Sum("amount"), count=Count("id"))
+                .values_list("lga_id", "channel", "total", "count")
+            )
+        }
+
+        corrected = 0
+        for lga_id, channel in set(actual) | set(expected):
+            amount, payments = expected.get((lga_id, channel), (0, 0))
+            current_amount, current_payments = actual.get((lga_id, channel), (0, 0))
+            if (amount, payments) != (current_amount, current_payments):
+                DailyRevenue.adjust(
+                    lga_id,
+                    day,
+                    channel,
+                    amount - current_amount,
+                    payments - current_payments,
+                )
+                corrected += 1
+
+    return corrected
+
+
+# =====================================================
+# FINANCE EXPORT
+# =====================================================
+REVENUE_HEADER = ["Day", "LGA", "LGA Code", "Channel", "Payments", "Amount (NGN)"]
+
+
+def stream_revenue_csv(queryset):
+    """
+    Yields CSV lines for DailyRevenue rows, for StreamingHttpResponse.
+    """
+    writer = csv_line_writer()
+    yield writer.writerow(REVENUE_HEADER)
+    for row in queryset.select_related("lga").iterator(chunk_size=2000):
+        yield writer.writerow([
+            row.day.isoformat(),
+            row.lga.name,
+            row.lga.code or "",
+            row.channel,
+            row.payments,
+            f"{row.amount / 100:.2f}",
+        ])
@@ -0,0 +1,166 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.applications.models import ArchivedApplication
+from apps.payments.ledger import UNKNOWN_CHANNEL, rebuild_daily_revenue
+from apps.payments.models import DailyRevenue, Payment, RevenueLedgerEntry
+
+
+class Command(BaseCommand):
+    help = "Re-derive daily revenue from payments in batches and report drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Payments read per query",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Backfill missing ledger entries and recompute drifted days",
+        )
+
+    # =========================
+    # RE-DERIVATION
+    # =========================
+    def _batches(self, queryset, fields, batch_size):
+        """
+        Keyset pagination on pk so no single query holds the whole table.
+        Yields one list of rows per page.
+        """
+        last_pk = 0
+        while True:
+            rows = list(
+                queryset
+                .filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values("pk", *fields)[:batch_size]
+            )
+            if not rows:
+                return
+            yield rows
+            last_pk = rows[-1]["pk"]
+
+    def _settled(self, batch_size):
+        """
+        Pages of (reference, payment_id, lga_id, day, channel, amount),
+        one per settled payment, live and archived.
+        """
+        live = Payment.objects.filter(status=Payment.STATUS_SUCCESS)
+        fields = ("reference", "application__lga_id", "channel", "paid_amount", "amount", "paid_at")
+        for rows in self._batches(live, fields, batch_size):
+            yield [
+                (
+                    row["reference"],
+                    row["pk"],
+                    row["application__lga_id"],
+                    timezone.localdate(row["paid_at"]) if row["paid_at"] else None,
+                    row["channel"] or UNKNOWN_CHANNEL,
+                    row["paid_amount"] or row["amount"],
+                )
+                for row in rows
+            ]
+
+        archived = ArchivedApplication.objects.filter(paid_at__isnull=False)
+        fields = ("payment_reference", "lga_id", "paid_at", "payment_amount", "snapshot")
+        for rows in self._batches(archived, fields, batch_size):
+            yield [self._archived(row) for row in rows]
+
+    def _archived(self, row):
+        payment = row["snapshot"].get("payment") or {}
+        return (
+            row["payment_reference"],
+            None,
+            row["lga_id"],
+            timezone.localdate(row["paid_at"]),
+            payment.get("channel") or UNKNOWN_CHANNEL,
+            payment.get("paid_amount") or row["payment_amount"],
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        expected_amount, expected_count = Counter(), Counter()
+        missing = []
+        for page in self._settled(batch_size):
+            # Ledger lookups per page, not the whole reference column at once
+            recorded = set(
+                RevenueLedgerEntry.objects
+                .filter(reference__in=[reference for reference, *_ in page])
+                .values_list("reference", flat=True)
+            )
+
+            for reference, payment_id, lga_id, day, channel, amount in page:
+                if day is None:
+                    # SUCCESS without paid_at: nothing to bucket it under
+                    self.stdout.write(self.style.WARNING(f"{reference}: settled without paid_at"))
+                    continue
+                expected_amount[(lga_id, day, channel)] += amount
+                expected_count[(lga_id, day, channel)] += 1
+                if reference not in recorded:
+                    missing.append(RevenueLedgerEntry(
+                        payment_id=payment_id,
+                        reference=reference,
+                        lga_id=lga_id,
+                        channel=channel,
+                        amount=amount,
+                        day=day,
+                    ))
+
+        actual_amount, actual_count = Counter(), Counter()
+        for lga_id, day, channel, amount, payments in DailyRevenue.objects.values_list(
+            "lga_id", "day", "channel", "amount", "payments"
+        ):
+            actual_amount[(lga_id, day, channel)] = amount
+            actual_count[(lga_id, day, channel)] = payments
+
+        drift = sorted(
+            (
+                key
+                for key in set(expected_count) | set(actual_count)
+                if actual_amount[key] != expected_amount[key]
+                or actual_count[key] != expected_count[key]
+            ),
+            key=lambda key: (key[1], key[0], key[2]),
+        )
+
+        if not drift and not missing:
+            self.stdout.write(self.style.SUCCESS("Revenue ledger is in sync."))
+            return
+
+        for key in drift:
+            lga_id, day, channel = key
+            self.stdout.write(
+                f"LGA {lga_id} {day} {channel}: "
+                f"rollup={actual_amount[key]} ({actual_count[key]}) "
+                f"payments={expected_amount[key]} ({expected_count[key]})"
+            )
+        self.stdout.write(
+            self.style.WARNING(
+                f"{len(drift)} bucket(s) drifted, "
+                f"{len(missing)} settled payment(s) missing from the ledger."
+            )
+        )
+
+        if not options["fix"]:
+            return
+
+        # Entries a concurrent settlement wrote meanwhile win the conflict
+        RevenueLedgerEntry.objects.bulk_create(
+            missing, batch_size=batch_size, ignore_conflicts=True
+        )
+
+        # Each day is recounted from the ledger under a lock on its
+        # buckets, so settlements running now are neither lost nor doubled
+        days = sorted({day for _, day, _ in drift} | {entry.day for entry in missing})
+        corrected = sum(rebuild_daily_revenue(day) for day in days)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Revenue ledger backfilled; {corrected} bucket(s) corrected over {len(days)} day(s)."
+            )
+        )
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.payments.inbox import INBOX_BATCH_SIZE, process_batch
+
+
+class Command(BaseCommand):
+    help = "Apply pending Paystack webhook events from the inbox in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=INBOX_BATCH_SIZE,
+            help="Events claimed per batch",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, polling the inbox when it is empty",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=1.0,
+            help="Seconds to wait between polls of an empty inbox (with --loop)",
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+
+        while True:
+            count = process_batch(options["batch_size"])
+            total += count
+
+            if count:
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {total} event(s)."))
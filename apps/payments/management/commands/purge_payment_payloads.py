@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.payments.models import PaymentPayload, PaystackEvent
+
+
+class Command(BaseCommand):
+    help = "Delete raw gateway payloads and processed webhook events past retention"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=PaymentPayload.RETENTION.days,
+            help="Keep payloads received within this many days",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+
+        payloads, _ = PaymentPayload.objects.filter(received_at__lt=cutoff).delete()
+        events, _ = PaystackEvent.objects.filter(
+            processed_at__isnull=False,
+            processed_at__lt=cutoff,
+        ).delete()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Deleted {payloads} payload(s) and {events} processed event(s) "
+                f"older than {cutoff:%Y-%m-%d}."
+            )
+        )
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.payments.reconcile import RECONCILE_PAGE_SIZE, reconcile_payments
+from apps.payments.service import PaystackError
+
+
+class Command(BaseCommand):
+    help = "Settle PENDING payments from Paystack's transaction list (incremental)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            help="Window start (ISO datetime); default resumes from the checkpoint",
+        )
+        parser.add_argument(
+            "--until",
+            help="Window end (ISO datetime); default now",
+        )
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=RECONCILE_PAGE_SIZE,
+            help="Transactions requested per Paystack page",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would change without writing",
+        )
+
+    def _datetime(self, value, option):
+        if value is None:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise CommandError(f"{option} must be an ISO datetime")
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def handle(self, *args, **options):
+        try:
+            totals = reconcile_payments(
+                start=self._datetime(options["since"], "--since"),
+                end=self._datetime(options["until"], "--until"),
+                page_size=options["page_size"],
+                dry_run=options["dry_run"],
+            )
+        except PaystackError as error:
+            raise CommandError(str(error))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Scanned {totals['transactions']} transaction(s) on {totals['pages']} page(s): "
+                f"{totals['succeeded']} settled, {totals['failed']} failed."
+            )
+        )
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.9 on 2026-10-19 06:12
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+import django.utils.timezone
+
+
+def backfill_updated_at(apps, schema_editor):
+    Payment = apps.get_model("payments", "Payment")
+    Payment.objects.update(updated_at=Coalesce("paid_at", "created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0003_alter_payment_amount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.9 on 2026-10-19 04:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0004_payment_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='authorization_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='authorization_url',
+            field=models.URLField(blank=True, max_length=500),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.9 on 2026-10-19 04:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0005_payment_authorization'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaystackEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event', models.CharField(max_length=50)),
+                ('reference', models.CharField(blank=True, max_length=100)),
+                ('payload', models.JSONField()),
+                ('received_at', models.DateTimeField(auto_now_add=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['processed_at', 'id'], name='paystack_event_pending_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='paystackevent',
+            constraint=models.UniqueConstraint(fields=('event', 'reference'), name='unique_paystack_event_reference'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.9 on 2026-10-19 04:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0006_paystackevent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paystackevent',
+            name='next_attempt_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
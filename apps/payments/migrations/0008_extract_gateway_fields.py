@@ -0,0 +1,115 @@
+# Generated by Django 5.0.9 on 2026-10-19 04:48
+
+import json
+import zlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def payload_source(payload):
+    """
+    Which Paystack call a stored gateway_response came from, by its shape.
+    """
+    if not isinstance(payload, dict):
+        return "verify"
+    if "event" in payload:
+        return "webhook"
+    data = payload.get("data")
+    if isinstance(data, dict) and "authorization_url" in data:
+        return "initialize"
+    return "verify"
+
+
+def move_gateway_responses(apps, schema_editor):
+    # Extract the columns we use and move the raw JSON to cold storage
+    Payment = apps.get_model("payments", "Payment")
+    PaymentPayload = apps.get_model("payments", "PaymentPayload")
+
+    payments = Payment.objects.exclude(gateway_response__isnull=True)
+    for payment in payments.iterator(chunk_size=500):
+        payload = payment.gateway_response
+        data = payload.get("data") if isinstance(payload, dict) else None
+        if isinstance(data, dict):
+            authorization = data.get("authorization") or {}
+            customer = data.get("customer") or {}
+            payment.channel = data.get("channel") or ""
+            payment.gateway_transaction_id = data.get("id")
+            payment.paid_amount = data.get("amount")
+            payment.fees = data.get("fees")
+            payment.authorization_code = authorization.get("authorization_code") or ""
+            payment.customer_email = customer.get("email") or ""
+            payment.save(update_fields=[
+                "channel",
+                "gateway_transaction_id",
+                "paid_amount",
+                "fees",
+                "authorization_code",
+                "customer_email",
+            ])
+
+        row = PaymentPayload.objects.create(
+            payment=payment,
+            source=payload_source(payload),
+            data=zlib.compress(json.dumps(payload, default=str).encode()),
+        )
+        # Keep the retention clock on when the payload arrived, not on
+        # this migration (auto_now_add ignores a value passed to create)
+        PaymentPayload.objects.filter(pk=row.pk).update(
+            received_at=payment.paid_at or payment.updated_at,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0007_paystackevent_next_attempt_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='authorization_code',
+            field=models.CharField(blank=True, db_index=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='channel',
+            field=models.CharField(blank=True, db_index=True, max_length=30),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='customer_email',
+            field=models.EmailField(blank=True, db_index=True, max_length=254),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='fees',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='gateway_transaction_id',
+            field=models.BigIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='paid_amount',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='PaymentPayload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('initialize', 'Initialize'), ('verify', 'Verify'), ('webhook', 'Webhook'), ('reconcile', 'Reconcile')], max_length=20)),
+                ('data', models.BinaryField()),
+                ('received_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('payment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payloads', to='payments.payment')),
+            ],
+        ),
+        migrations.RunPython(move_gateway_responses, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='payment',
+            name='gateway_response',
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.0.9 on 2026-10-19 04:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lgas', '0007_alter_lga_chairman_signature_and_more'),
+        ('payments', '0008_extract_gateway_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRevenue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('channel', models.CharField(max_length=30)),
+                ('amount', models.BigIntegerField(default=0)),
+                ('payments', models.IntegerField(default=0)),
+                ('lga', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_revenue', to='lgas.lga')),
+            ],
+            options={
+                'verbose_name_plural': 'daily revenue',
+                'ordering': ('-day', 'lga__name', 'channel'),
+            },
+        ),
+        migrations.CreateModel(
+            name='RevenueLedgerEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reference', models.CharField(max_length=100, unique=True)),
+                ('channel', models.CharField(max_length=30)),
+                ('amount', models.BigIntegerField()),
+                ('day', models.DateField(db_index=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('lga', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='revenue_entries', to='lgas.lga')),
+                ('payment', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ledger_entries', to='payments.payment')),
+            ],
+            options={
+                'verbose_name_plural': 'revenue ledger entries',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailyrevenue',
+            constraint=models.UniqueConstraint(fields=('lga', 'day', 'channel'), name='unique_lga_day_channel_revenue'),
+        ),
+    ]
@@ -1,8 +1,38 @@
 # apps/payments/models.py
 
-from django.db import models
+import json
+import uuid
+import zlib
+from datetime import timedelta
+
+from django.db import models, transaction
+from django.db.models import F
 from django.utils import timezone
 
+from apps.lgas.models import LGA
+
+
+def extract_gateway_fields(payload):
+    """
+    The Paystack transaction fields we use, from a verify / webhook /
+    list payload ({"data": {...}}). Missing values come back as None.
+    """
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if not isinstance(data, dict):
+        return {}
+
+    authorization = data.get("authorization") or {}
+    customer = data.get("customer") or {}
+
+    return {
+        "channel": data.get("channel"),
+        "gateway_transaction_id": data.get("id"),
+        "paid_amount": data.get("amount"),
+        "fees": data.get("fees"),
+        "authorization_code": authorization.get("authorization_code"),
+        "customer_email": customer.get("email"),
+    }
+
 
 class Payment(models.Model):
 
@@ -16,6 +46,9 @@ class Payment(models.Model):
         (STATUS_FAILED, "Failed"),
     )
 
+    # How long a Paystack checkout link is reused before re-initializing
+    AUTHORIZATION_TTL = timedelta(minutes=30)
+
     application = models.OneToOneField(
         "applications.Application",
         on_delete=models.CASCADE,
@@ -30,14 +63,283 @@ class Payment(models.Model):
         default=STATUS_PENDING,
     )
 
-    gateway_response = models.JSONField(blank=True, null=True)
+    # =========================
+    # GATEWAY DETAILS (EXTRACTED FROM PAYSTACK)
+    # =========================
+    # Raw payloads live in PaymentPayload (compressed, time-limited)
+    channel = models.CharField(max_length=30, blank=True, db_index=True)
+    gateway_transaction_id = models.BigIntegerField(blank=True, null=True, db_index=True)
+    paid_amount = models.PositiveIntegerField(blank=True, null=True)  # kobo
+    fees = models.PositiveIntegerField(blank=True, null=True)  # kobo
+    authorization_code = models.CharField(max_length=100, blank=True, db_index=True)
+    customer_email = models.EmailField(blank=True, db_index=True)
+
+    # Paystack checkout link for the current reference
+    authorization_url = models.URLField(max_length=500, blank=True)
+    authorization_expires_at = models.DateTimeField(blank=True, null=True)
     paid_at = models.DateTimeField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
-    def mark_success(self):
-        self.status = self.STATUS_SUCCESS
-        self.paid_at = timezone.now()
-        self.save(update_fields=["status", "paid_at"])
+    # Row version – bumped on every save, used for API ETags
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "updated_at"}
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def new_reference():
+        return f"LGAC-{uuid.uuid4().hex}"
+
+    def has_live_authorization(self):
+        return (
+            self.status == self.STATUS_PENDING
+            and bool(self.authorization_url)
+            and self.authorization_expires_at is not None
+            and self.authorization_expires_at > timezone.now()
+        )
+
+    def record_gateway_response(self, payload, source):
+        """
+        Copy the fields we use into columns and keep the raw payload in
+        cold storage. Returns the changed column names for update_fields.
+        Values Paystack left out never blank an existing column.
+        """
+        changed = []
+        for name, value in extract_gateway_fields(payload).items():
+            if value not in (None, "") and getattr(self, name) != value:
+                setattr(self, name, value)
+                changed.append(name)
+
+        PaymentPayload.store(self, payload, source)
+        return changed
+
+    @classmethod
+    def apply_gateway_result(cls, reference, succeeded, payload, source, paid_at=None):
+        """
+        Settle a payment with Paystack's verdict, exactly once.
+
+        • Compare-and-set: UPDATE ... WHERE status=<claimable>, no row lock
+          taken up front; a concurrent caller that lost the race is a no-op
+        • Only SUCCESS is terminal: a success verdict also claims a FAILED
+          payment (the money was taken), a failure only claims PENDING
+        • On success the ledger entry and the application's move to PAID
+          commit in the same transaction
+        Returns True if this call settled the payment.
+        """
+        from apps.applications.models import Application
+
+        from .ledger import record_revenue
+
+        now = timezone.now()
+        changes = {
+            name: value
+            for name, value in extract_gateway_fields(payload).items()
+            if value not in (None, "")
+        }
+        if succeeded:
+            changes["paid_at"] = paid_at or now
+
+        with transaction.atomic():
+            claimable = (
+                [cls.STATUS_PENDING, cls.STATUS_FAILED]
+                if succeeded
+                else [cls.STATUS_PENDING]
+            )
+            claimed = cls.objects.filter(
+                reference=reference,
+                status__in=claimable,
+            ).update(
+                status=cls.STATUS_SUCCESS if succeeded else cls.STATUS_FAILED,
+                updated_at=now,
+                **changes,
+            )
+            if not claimed:
+                return False
+
+            payment = cls.objects.select_related("application").get(reference=reference)
+            PaymentPayload.store(payment, payload, source)
+
+            if succeeded:
+                record_revenue(payment)
+                # Targeted status UPDATE; skipped if the application moved on
+                Application.bulk_transition(
+                    Application.objects.filter(pk=payment.application_id),
+                    Application.STATUS_PAID,
+                    note=f"Payment {reference} confirmed",
+                )
+
+        return True
 
     def __str__(self):
         return f"{self.reference} ({self.status})"
+
+
+class PaymentPayload(models.Model):
+    """
+    Cold storage for raw Paystack payloads, zlib-compressed JSON.
+    Rows older than RETENTION are removed by `purge_payment_payloads`.
+    """
+
+    RETENTION = timedelta(days=180)
+
+    SOURCE_INITIALIZE = "initialize"
+    SOURCE_VERIFY = "verify"
+    SOURCE_WEBHOOK = "webhook"
+    SOURCE_RECONCILE = "reconcile"
+
+    SOURCE_CHOICES = (
+        (SOURCE_INITIALIZE, "Initialize"),
+        (SOURCE_VERIFY, "Verify"),
+        (SOURCE_WEBHOOK, "Webhook"),
+        (SOURCE_RECONCILE, "Reconcile"),
+    )
+
+    payment = models.ForeignKey(
+        Payment,
+        on_delete=models.CASCADE,
+        related_name="payloads",
+    )
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES)
+    data = models.BinaryField()
+    received_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    @classmethod
+    def build(cls, payment, payload, source):
+        return cls(
+            payment=payment,
+            source=source,
+            data=zlib.compress(json.dumps(payload, default=str).encode()),
+        )
+
+    @classmethod
+    def store(cls, payment, payload, source):
+        payload_row = cls.build(payment, payload, source)
+        payload_row.save()
+        return payload_row
+
+    def decoded(self):
+        return json.loads(zlib.decompress(bytes(self.data)))
+
+    def __str__(self):
+        return f"{self.payment_id} {self.source} @ {self.received_at:%Y-%m-%d %H:%M}"
+
+
+class RevenueLedgerEntry(models.Model):
+    """
+    Append-only revenue ledger: one row per settled payment.
+    Written in the transaction that marks the payment SUCCESS.
+    """
+
+    payment = models.ForeignKey(
+        Payment,
+        on_delete=models.SET_NULL,  # archived payments keep their entry
+        null=True,
+        blank=True,
+        related_name="ledger_entries",
+    )
+    reference = models.CharField(max_length=100, unique=True)
+    lga = models.ForeignKey(
+        LGA,
+        on_delete=models.PROTECT,
+        related_name="revenue_entries",
+    )
+    channel = models.CharField(max_length=30)
+    amount = models.BigIntegerField()  # kobo
+    day = models.DateField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name_plural = "revenue ledger entries"
+
+    def __str__(self):
+        return f"{self.reference} {self.amount}"
+
+
+class DailyRevenue(models.Model):
+    """
+    Daily revenue per LGA and channel, maintained incrementally from the
+    ledger. Finance reports and exports read this table only.
+    """
+
+    lga = models.ForeignKey(
+        LGA,
+        on_delete=models.CASCADE,
+        related_name="daily_revenue",
+    )
+    day = models.DateField()
+    channel = models.CharField(max_length=30)
+    amount = models.BigIntegerField(default=0)  # kobo
+    payments = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "daily revenue"
+        ordering = ("-day", "lga__name", "channel")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["lga", "day", "channel"],
+                name="unique_lga_day_channel_revenue",
+            ),
+        ]
+
+    @classmethod
+    def adjust(cls, lga_id, day, channel, amount, payments):
+        """
+        Atomically add to a single bucket, creating it if needed.
+        """
+        bucket = {"lga_id": lga_id, "day": day, "channel": channel}
+        delta = {"amount": F("amount") + amount, "payments": F("payments") + payments}
+
+        if cls.objects.filter(**bucket).update(**delta):
+            return
+
+        row, created = cls.objects.get_or_create(
+            **bucket,
+            defaults={"amount": amount, "payments": payments},
+        )
+        if not created:
+            cls.objects.filter(pk=row.pk).update(**delta)
+
+    def __str__(self):
+        return f"{self.lga_id} {self.day} {self.channel}: {self.amount}"
+
+
+class PaystackEvent(models.Model):
+    """
+    Inbox of verified Paystack webhook events.
+
+    The webhook only inserts here (duplicates are dropped by the unique
+    constraint) and returns 200; `process_paystack_events` applies them.
+    The checkout callback queues its own verification here as well.
+    """
+
+    MAX_ATTEMPTS = 5
+
+    event = models.CharField(max_length=50)
+    reference = models.CharField(max_length=100, blank=True)
+    payload = models.JSONField()
+
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(blank=True, null=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "reference"],
+                name="unique_paystack_event_reference",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["processed_at", "id"],
+                name="paystack_event_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.event} {self.reference}"
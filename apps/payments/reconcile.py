@@ -0,0 +1,154 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.applications.models import Application, Watermark
+from .ledger import record_bulk_revenue
+from .models import Payment, PaymentPayload, extract_gateway_fields
+from .service import get_client
+
+
+# =====================================================
+# PAYMENT RECONCILIATION
+# =====================================================
+RECONCILE_WATERMARK = "payment_reconcile"
+
+# First run (no checkpoint yet) looks back this far
+RECONCILE_INITIAL_WINDOW = timedelta(days=7)
+
+# Overlap with the previous window: Paystack lists by creation time and
+# settles a little later
+RECONCILE_LOOKBACK = timedelta(hours=1)
+
+RECONCILE_PAGE_SIZE = 100
+
+
+def _paid_at(transaction_data, default):
+    raw = transaction_data.get("paid_at") or transaction_data.get("paidAt")
+    return (parse_datetime(raw) if raw else None) or default
+
+
+def apply_page(transactions, dry_run=False):
+    """
+    Settle payments found in one page of Paystack transactions.
+    One IN query per page; updates are applied in bulk.
+    Same rule as Payment.apply_gateway_result: a success also settles a
+    FAILED payment, a failure only a PENDING one.
+    Returns (succeeded, failed) counts.
+    """
+    by_reference = {
+        tx["reference"]: tx
+        for tx in transactions
+        if tx.get("reference") and tx.get("status") in ("success", "failed")
+    }
+    if not by_reference:
+        return 0, 0
+
+    now = timezone.now()
+
+    with transaction.atomic():
+        unsettled = list(
+            Payment.objects
+            .select_for_update()
+            .select_related("application")
+            .filter(
+                reference__in=by_reference,
+                status__in=[Payment.STATUS_PENDING, Payment.STATUS_FAILED],
+            )
+        )
+
+        succeeded, failed, payloads = [], [], []
+        for payment in unsettled:
+            tx = by_reference[payment.reference]
+            if tx["status"] != "success" and payment.status == Payment.STATUS_FAILED:
+                continue
+            payload = {"status": True, "data": tx}
+            for name, value in extract_gateway_fields(payload).items():
+                if value not in (None, ""):
+                    setattr(payment, name, value)
+            payloads.append(PaymentPayload.build(payment, payload, PaymentPayload.SOURCE_RECONCILE))
+            payment.updated_at = now
+
+            if tx["status"] == "success":
+                payment.status = Payment.STATUS_SUCCESS
+                payment.paid_at = _paid_at(tx, now)
+                succeeded.append(payment)
+            else:
+                payment.status = Payment.STATUS_FAILED
+                failed.append(payment)
+
+        if dry_run:
+            transaction.set_rollback(True)
+            return len(succeeded), len(failed)
+
+        Payment.objects.bulk_update(
+            succeeded + failed,
+            [
+                "status",
+                "paid_at",
+                "updated_at",
+                "channel",
+                "gateway_transaction_id",
+                "paid_amount",
+                "fees",
+                "authorization_code",
+                "customer_email",
+            ],
+        )
+        PaymentPayload.objects.bulk_create(payloads)
+        record_bulk_revenue(succeeded)
+
+        if succeeded:
+            Application.bulk_transition(
+                Application.objects.filter(payment__in=succeeded),
+                Application.STATUS_PAID,
+                note="Payment reconciled with Paystack",
+            )
+
+    return len(succeeded), len(failed)
+
+
+def reconcile_payments(start=None, end=None, page_size=RECONCILE_PAGE_SIZE, dry_run=False, client=None):
+    """
+    Page through Paystack's transactions for [start, end] and settle
+    matching unsettled payments.
+
+    Without `start`, resumes from the stored checkpoint. The checkpoint
+    advances to `end` only after every page was applied.
+    Returns {"pages", "transactions", "succeeded", "failed"}.
+    """
+    client = client or get_client()
+    end = end or timezone.now()
+
+    resume = start is None
+    if resume:
+        checkpoint = Watermark.get(RECONCILE_WATERMARK)
+        start = (
+            checkpoint - RECONCILE_LOOKBACK
+            if checkpoint else end - RECONCILE_INITIAL_WINDOW
+        )
+
+    totals = {"pages": 0, "transactions": 0, "succeeded": 0, "failed": 0}
+
+    page = 1
+    while True:
+        body = client.list_transactions(start, end, page=page, per_page=page_size)
+        transactions = body.get("data") or []
+
+        succeeded, failed = apply_page(transactions, dry_run=dry_run)
+        totals["pages"] += 1
+        totals["transactions"] += len(transactions)
+        totals["succeeded"] += succeeded
+        totals["failed"] += failed
+
+        page_count = (body.get("meta") or {}).get("pageCount") or page
+        if not transactions or page >= page_count:
+            break
+        page += 1
+
+    if resume and not dry_run:
+        Watermark.advance(RECONCILE_WATERMARK, end)
+
+    return totals
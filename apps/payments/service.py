@@ -1,30 +1,332 @@
-## App: `apps/payments`
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
 
-### `apps/payments/service.py`
-
-import os
+import httpx
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+logger = logging.getLogger(__name__)
+
+
+# =====================================================
+# TRANSPORT SETTINGS
+# =====================================================
+CONNECT_TIMEOUT = 3.05  # seconds
+READ_TIMEOUT = 10
+
+# Idempotent calls only; initialize is retried only if it never connected
+MAX_RETRIES = 2
+BACKOFF_BASE = 0.25  # seconds
+BACKOFF_CAP = 2.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+POOL_MAXSIZE = 20
+
+
+class PaystackError(Exception):
+    """
+    Paystack could not be reached or returned an unusable response.
+    """
+
+
+# =====================================================
+# SHARED SESSION (ONE POOL PER PROCESS)
+# =====================================================
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Process-wide requests.Session so TLS connections to Paystack are
+    kept alive and reused across requests.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=0)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_client():
+    """
+    httpx.AsyncClient for the running event loop, so async views share
+    one keep-alive pool per ASGI worker.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=POOL_MAXSIZE,
+                max_keepalive_connections=POOL_MAXSIZE,
+            ),
+            timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        )
+    return client
+
+
+# =====================================================
+# CALL METRICS
+# =====================================================
+_metrics = {}
+_metrics_lock = threading.Lock()
+
+
+def _record(operation, elapsed, error=None, retried=False):
+    elapsed_ms = elapsed * 1000
+
+    with _metrics_lock:
+        stats = _metrics.setdefault(operation, {
+            "calls": 0,
+            "errors": 0,
+            "retries": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+        })
+        stats["calls"] += 1
+        stats["errors"] += error is not None
+        stats["retries"] += retried
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    if error is None:
+        logger.info("paystack %s ok %.0fms", operation, elapsed_ms)
+    else:
+        logger.warning("paystack %s failed %.0fms: %s", operation, elapsed_ms, error)
+
+
+def metrics_snapshot():
+    """
+    {operation: {calls, errors, retries, total_ms, max_ms}} for this process.
+    """
+    with _metrics_lock:
+        return {operation: dict(stats) for operation, stats in _metrics.items()}
+
 
-PAYSTACK_SECRET = settings.PAYSTACK_SECRET_KEY
-PAYSTACK_BASE = 'https://api.paystack.co'
+# =====================================================
+# CLIENT
+# =====================================================
+class PaystackClient:
+    """
+    Thin Paystack API client shared by the payment views and jobs.
 
+    • Pooled keep-alive connections (one session per process)
+    • `a`-prefixed coroutine variants for async views (httpx)
+    • Strict connect / read timeouts
+    • Bounded retries with full jitter for idempotent calls
+    • Per-call latency / error metrics
+    """
 
-def initialize_payment(email, amount_kobo, reference, callback_url):
-    url = f"{PAYSTACK_BASE}/transaction/initialize"
-    headers = {'Authorization': f'Bearer {PAYSTACK_SECRET}'}
-    data = {
-        'email': email,
-        'amount': amount_kobo,
-        'reference': reference,
-        'callback_url': callback_url,
-    }
-    resp = requests.post(url, json=data, headers=headers)
-    return resp.json()
+    def __init__(self, secret_key=None, base_url=None, session=None):
+        self.secret_key = secret_key or settings.PAYSTACK_SECRET_KEY
+        self.session = session or get_session()
+
+        if base_url:
+            self.base_url = base_url.rstrip("/")
+            self.init_url = f"{self.base_url}/transaction/initialize"
+            self.verify_url = f"{self.base_url}/transaction/verify/"
+        else:
+            self.base_url = settings.PAYSTACK_BASE_URL.rstrip("/")
+            self.init_url = settings.PAYSTACK_INIT_URL
+            self.verify_url = settings.PAYSTACK_VERIFY_URL
+
+    # =========================
+    # API CALLS
+    # =========================
+    def initialize_transaction(self, email, amount, reference, callback_url, metadata=None):
+        payload = {
+            "email": email,
+            "amount": amount,  # kobo
+            "reference": reference,
+            "callback_url": callback_url,
+        }
+        if metadata:
+            payload["metadata"] = metadata
+
+        return self._request(
+            "initialize",
+            "POST",
+            self.init_url,
+            idempotent=False,
+            json=payload,
+        )
+
+    def verify_transaction(self, reference):
+        return self._request(
+            "verify",
+            "GET",
+            f"{self.verify_url}{reference}",
+            idempotent=True,
+        )
+
+    async def ainitialize_transaction(self, email, amount, reference, callback_url, metadata=None):
+        payload = {
+            "email": email,
+            "amount": amount,  # kobo
+            "reference": reference,
+            "callback_url": callback_url,
+        }
+        if metadata:
+            payload["metadata"] = metadata
+
+        return await self._arequest(
+            "initialize",
+            "POST",
+            self.init_url,
+            idempotent=False,
+            json=payload,
+        )
+
+    async def averify_transaction(self, reference):
+        return await self._arequest(
+            "verify",
+            "GET",
+            f"{self.verify_url}{reference}",
+            idempotent=True,
+        )
+
+    def list_transactions(self, start, end, page=1, per_page=100):
+        """
+        One page of transactions created in [start, end].
+        """
+        return self._request(
+            "list",
+            "GET",
+            f"{self.base_url}/transaction",
+            idempotent=True,
+            params={
+                "from": start.isoformat(),
+                "to": end.isoformat(),
+                "page": page,
+                "perPage": per_page,
+            },
+        )
+
+    # =========================
+    # TRANSPORT
+    # =========================
+    def _backoff(self, attempt):
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+    def _never_sent(self, error):
+        """
+        True if the connection timed out or was refused, so the request
+        never reached Paystack.
+        """
+        if isinstance(error, (requests.ConnectTimeout, httpx.ConnectTimeout, httpx.ConnectError)):
+            return True
+        # requests: ConnectionError(MaxRetryError(reason=NewConnectionError))
+        if isinstance(error, requests.ConnectionError) and error.args:
+            return isinstance(getattr(error.args[0], "reason", None), NewConnectionError)
+        return False
+
+    def _should_retry(self, error, idempotent):
+        if self._never_sent(error):
+            return True
+        if not idempotent:
+            return False
+        if isinstance(error, (requests.ConnectionError, requests.Timeout, httpx.TransportError)):
+            return True
+        return getattr(error, "status_code", None) in RETRY_STATUSES
+
+    def _decode(self, response):
+        if response.status_code in RETRY_STATUSES:
+            error = PaystackError(f"HTTP {response.status_code}")
+            error.status_code = response.status_code
+            raise error
+        return response.json()
+
+    def _failed(self, operation, attempt, started, error, idempotent):
+        """
+        Record a failed attempt. Returns the delay before the next one,
+        or raises PaystackError when the call should not be retried.
+        """
+        retry = attempt < MAX_RETRIES and self._should_retry(error, idempotent)
+        _record(operation, time.monotonic() - started, error=error, retried=retry)
+        if not retry:
+            raise PaystackError(f"Paystack {operation} failed: {error}") from error
+        return self._backoff(attempt)
+
+    def _request(self, operation, method, url, idempotent, **kwargs):
+        """
+        Perform one API call and return the decoded JSON body.
+        Raises PaystackError when every attempt failed.
+        """
+        headers = {"Authorization": f"Bearer {self.secret_key}"}
+
+        for attempt in range(MAX_RETRIES + 1):
+            started = time.monotonic()
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+                    **kwargs,
+                )
+                data = self._decode(response)
+            except (requests.RequestException, ValueError, PaystackError) as error:
+                time.sleep(self._failed(operation, attempt, started, error, idempotent))
+            else:
+                _record(operation, time.monotonic() - started)
+                return data
+
+    async def _arequest(self, operation, method, url, idempotent, **kwargs):
+        """
+        Coroutine twin of _request(); waits without blocking the loop.
+        """
+        headers = {"Authorization": f"Bearer {self.secret_key}"}
+        client = get_async_client()
+
+        for attempt in range(MAX_RETRIES + 1):
+            started = time.monotonic()
+            try:
+                response = await client.request(method, url, headers=headers, **kwargs)
+                data = self._decode(response)
+            except (httpx.HTTPError, ValueError, PaystackError) as error:
+                await asyncio.sleep(self._failed(operation, attempt, started, error, idempotent))
+            else:
+                _record(operation, time.monotonic() - started)
+                return data
+
+
+def get_client():
+    return PaystackClient()
+
+
+# =====================================================
+# MODULE-LEVEL HELPERS
+# =====================================================
+def initialize_payment(email, amount_kobo, reference, callback_url, metadata=None):
+    return get_client().initialize_transaction(
+        email, amount_kobo, reference, callback_url, metadata=metadata
+    )
 
 
 def verify_payment(reference):
-    url = f"{PAYSTACK_BASE}/transaction/verify/{reference}"
-    headers = {'Authorization': f'Bearer {PAYSTACK_SECRET}'}
-    resp = requests.get(url, headers=headers)
-    return resp.json()
\ No newline at end of file
+    return get_client().verify_transaction(reference)
+
+
+async def ainitialize_payment(email, amount_kobo, reference, callback_url, metadata=None):
+    return await get_client().ainitialize_transaction(
+        email, amount_kobo, reference, callback_url, metadata=metadata
+    )
+
+
+async def averify_payment(reference):
+    return await get_client().averify_transaction(reference)
@@ -1,33 +1,56 @@
-import uuid
+import asyncio
 import hmac
 import hashlib
 import json
-import requests
+import time
+from datetime import timedelta
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.shortcuts import get_object_or_404, redirect, render
-from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.urls import reverse
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
-from django.http import HttpResponse
+from django.http import Http404, HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 
-from apps.accounts.permissions import citizen_required
-from .models import Payment
+from apps.accounts.permissions import citizen_required, login_required
+from .inbox import (
+    RetryLater,
+    enqueue_verification,
+    verification_is_stale,
+    verify_reference,
+)
+from .models import Payment, PaymentPayload, PaystackEvent
+from .service import PaystackError, ainitialize_payment, averify_payment
+from apps.applications.archive import find_payment
 from apps.applications.models import Application
 
 
 # =====================================================
-# INITIATE PAYMENT (CITIZEN ONLY)
+# INITIATE PAYMENT (CITIZEN ONLY, ASYNC)
 # =====================================================
-@login_required
-@citizen_required
-def initiate_payment(request, application_id):
+PAYMENT_AMOUNT = 5000 * 100  # ₦5,000 → kobo
+
+# One Paystack initialize per payment at a time, across workers: the
+# payment row itself is claimed with a conditional UPDATE
+CHECKOUT_LEASE_TIMEOUT = 30  # seconds
+CHECKOUT_POLL_INTERVAL = 0.25
+
+
+def _open_checkout(request, user, application_id):
+    """
+    Guards, get-or-create and the cheap exits, in autocommit: no lock is
+    held here, the payment is claimed later by _claim_checkout().
+    Returns (response, None) when no Paystack call is needed, else
+    (None, payment).
+    """
     application = get_object_or_404(
         Application,
         id=application_id,
-        applicant=request.user,
+        applicant=user,
     )
 
     # -------------------------------------------------
@@ -41,93 +64,242 @@ def initiate_payment(request, application_id):
             request,
             "Payment cannot be initiated for this application."
         )
-        return redirect("applications:view", application.id)
-
-    # -------------------------------------------------
-    # PREVENT DOUBLE PAYMENT
-    # -------------------------------------------------
-    if hasattr(application, "payment") and (
-        application.payment.status == Payment.STATUS_SUCCESS
-    ):
-        messages.info(
-            request,
-            "This application has already been paid for."
-        )
-        return redirect("applications:view", application.id)
+        return redirect("applications:view", application.id), None
 
     # -------------------------------------------------
     # EMAIL GUARD (PAYSTACK REQUIRES EMAIL)
     # -------------------------------------------------
-    if not request.user.email:
+    if not user.email:
         messages.error(
             request,
             "A valid email address is required to make payment."
         )
-        return redirect("applications:view", application.id)
+        return redirect("applications:view", application.id), None
 
     # -------------------------------------------------
-    # CREATE / REFRESH PAYMENT
+    # GET / CREATE PAYMENT
     # -------------------------------------------------
-    amount = 5000 * 100  # ₦5,000 → kobo
-    reference = f"LGAC-{uuid.uuid4().hex}"
-
-    payment, _ = Payment.objects.update_or_create(
+    payment, _ = Payment.objects.get_or_create(
         application=application,
         defaults={
-            "reference": reference,
-            "amount": amount,
-            "status": Payment.STATUS_PENDING,
+            "reference": Payment.new_reference(),
+            "amount": PAYMENT_AMOUNT,
         },
     )
 
     # -------------------------------------------------
-    # PAYSTACK INITIALIZATION
+    # PREVENT DOUBLE PAYMENT
     # -------------------------------------------------
-    payload = {
-        "email": request.user.email,
-        "amount": amount,
-        "reference": reference,
-        "callback_url": request.build_absolute_uri(
-            reverse("payments:verify")
-        ),
-        "metadata": {
-            "application_id": application.id,
-        },
-    }
-
-    headers = {
-        "Authorization": f"Bearer {settings.PAYSTACK_SECRET_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    response = requests.post(
-        settings.PAYSTACK_INIT_URL,
-        json=payload,
-        headers=headers,
-        timeout=15,
-    )
-
-    data = response.json()
+    if payment.status == Payment.STATUS_SUCCESS:
+        messages.info(
+            request,
+            "This application has already been paid for."
+        )
+        return redirect("applications:view", application.id), None
 
     # -------------------------------------------------
-    # HARD FAILURE HANDLING
+    # REUSE A LIVE AUTHORIZATION (NO PAYSTACK CALL)
     # -------------------------------------------------
-    if not data.get("status"):
-        payment.status = Payment.STATUS_FAILED
-        payment.gateway_response = data
-        payment.save(update_fields=["status", "gateway_response"])
+    if payment.has_live_authorization():
+        return redirect(payment.authorization_url), None
+
+    return None, payment
+
+
+def _claim_checkout(payment):
+    """
+    Claim the payment for one Paystack initialize.
+
+    • Conditional UPDATE, so it holds across workers: it only matches the
+      reference this request saw (already verified if it had a checkout)
+      while there is no live link and no unexpired claim
+    • Rotates in a fresh reference – Paystack rejects re-initializing a
+      used one – and parks authorization_expires_at at the claim deadline
+      with no link until the checkout is stored
+    Returns the claimed reference, or None if another request has it.
+    """
+    now = timezone.now()
+    reference = Payment.new_reference()
+    claimed = (
+        Payment.objects
+        .filter(
+            pk=payment.pk,
+            reference=payment.reference,
+            status__in=[Payment.STATUS_PENDING, Payment.STATUS_FAILED],
+        )
+        .filter(
+            Q(authorization_expires_at__isnull=True)
+            | Q(authorization_expires_at__lte=now)
+        )
+        .update(
+            reference=reference,
+            status=Payment.STATUS_PENDING,
+            authorization_url="",
+            authorization_expires_at=now + timedelta(seconds=CHECKOUT_LEASE_TIMEOUT),
+            updated_at=now,
+        )
+    )
+    return reference if claimed else None
+
+
+def _release_checkout(payment, reference):
+    """
+    Paystack could not be reached: drop our claim so the next click can
+    try again straight away.
+    """
+    Payment.objects.filter(
+        pk=payment.pk,
+        reference=reference,
+        authorization_url="",
+    ).update(authorization_expires_at=None, updated_at=timezone.now())
+
+
+def _store_checkout(request, payment, reference, data):
+    """
+    Save the initialized checkout under a row lock, unless a webhook
+    settled the payment while Paystack was being called.
+    Returns None if our claim lapsed and another request took over.
+    """
+    with transaction.atomic():
+        current = Payment.objects.select_for_update().get(pk=payment.pk)
+        if current.status == Payment.STATUS_SUCCESS:
+            messages.success(request, "Payment successful.")
+            return redirect("applications:view", current.application_id)
+
+        if current.reference != reference:
+            return None
+
+        # -------------------------------------------------
+        # HARD FAILURE HANDLING
+        # -------------------------------------------------
+        if not data.get("status") and current.has_live_authorization():
+            # Never downgrade a checkout the citizen can still pay
+            return redirect(current.authorization_url)
+
+        current.amount = PAYMENT_AMOUNT
+        changed = current.record_gateway_response(data, PaymentPayload.SOURCE_INITIALIZE)
+
+        if not data.get("status"):
+            current.status = Payment.STATUS_FAILED
+            current.authorization_url = ""
+            current.authorization_expires_at = None
+        else:
+            current.status = Payment.STATUS_PENDING
+            current.authorization_url = data["data"]["authorization_url"]
+            current.authorization_expires_at = timezone.now() + Payment.AUTHORIZATION_TTL
+
+        current.save(update_fields=[
+            "amount",
+            "status",
+            "authorization_url",
+            "authorization_expires_at",
+            *changed,
+        ])
 
+    if not data.get("status"):
         messages.error(
             request,
             f"Payment initialization failed: "
             f"{data.get('message', 'Unknown error')}"
         )
-        return redirect("applications:view", application.id)
+        return redirect("applications:view", current.application_id)
 
     # -------------------------------------------------
     # REDIRECT TO PAYSTACK CHECKOUT
     # -------------------------------------------------
-    return redirect(data["data"]["authorization_url"])
+    return redirect(current.authorization_url)
+
+
+async def _await_checkout(request, payment):
+    """
+    Another request holds the claim: wait for the link it stores.
+    """
+    deadline = time.monotonic() + CHECKOUT_LEASE_TIMEOUT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(CHECKOUT_POLL_INTERVAL)
+        current = await Payment.objects.aget(pk=payment.pk)
+        if current.status == Payment.STATUS_SUCCESS:
+            messages.success(request, "Payment successful.")
+            return redirect("applications:view", current.application_id)
+        if current.has_live_authorization():
+            return redirect(current.authorization_url)
+
+        claimed = (
+            not current.authorization_url
+            and current.authorization_expires_at is not None
+            and current.authorization_expires_at > timezone.now()
+        )
+        if not claimed:
+            # The other request failed or gave up
+            break
+
+    messages.error(
+        request,
+        "Payment service is temporarily unavailable. Please try again."
+    )
+    return redirect("applications:view", payment.application_id)
+
+
+@login_required
+@citizen_required
+async def initiate_payment(request, application_id):
+    """
+    Start (or resume) a Paystack checkout.
+
+    Async: the Paystack round trips are awaited on a shared httpx pool,
+    so a slow gateway does not pin a worker. Database work runs in short
+    sync_to_async blocks; a conditional UPDATE claims the payment, so a
+    double-click landing on two workers still initializes one reference.
+    """
+    user = await request.auser()
+    response, payment = await sync_to_async(_open_checkout)(request, user, application_id)
+    if response is not None:
+        return response
+
+    try:
+        # -------------------------------------------------
+        # EXPIRED AUTHORIZATION: SETTLE BEFORE ROTATING
+        # -------------------------------------------------
+        if payment.authorization_url:
+            # It may have been paid in an old tab – never orphan it
+            data = await averify_payment(payment.reference)
+            if data.get("data", {}).get("status") == "success":
+                await sync_to_async(Payment.apply_gateway_result)(
+                    payment.reference,
+                    True,
+                    data,
+                    PaymentPayload.SOURCE_VERIFY,
+                )
+                messages.success(request, "Payment successful.")
+                return redirect("applications:view", payment.application_id)
+
+        reference = await sync_to_async(_claim_checkout)(payment)
+        if reference is None:
+            return await _await_checkout(request, payment)
+
+        # -------------------------------------------------
+        # PAYSTACK INITIALIZATION
+        # -------------------------------------------------
+        try:
+            data = await ainitialize_payment(
+                user.email,
+                PAYMENT_AMOUNT,
+                reference,
+                request.build_absolute_uri(reverse("payments:verify")),
+                metadata={"application_id": payment.application_id},
+            )
+        except PaystackError:
+            await sync_to_async(_release_checkout)(payment, reference)
+            raise
+
+        response = await sync_to_async(_store_checkout)(request, payment, reference, data)
+        return response or await _await_checkout(request, payment)
+    except PaystackError:
+        messages.error(
+            request,
+            "Payment service is temporarily unavailable. Please try again."
+        )
+        return redirect("applications:view", payment.application_id)
 
 
 # =====================================================
@@ -136,50 +308,79 @@ def initiate_payment(request, application_id):
 @login_required
 @citizen_required
 def verify_payment(request):
+    """
+    Checkout callback – never waits on Paystack.
+
+    • Queues a verification for `process_paystack_events`
+    • If that verification has been waiting longer than
+      VERIFY_INLINE_AFTER (worker down or behind), asks Paystack inline
+    • Shows a "confirming payment" page that polls `payment_status`, with
+      a "check again" link back here once polling gives up
+    """
     reference = request.GET.get("reference")
 
     if not reference:
         messages.error(request, "Missing payment reference.")
         return redirect("applications:dashboard")
 
-    payment = get_object_or_404(Payment, reference=reference)
+    payment = get_object_or_404(
+        Payment,
+        reference=reference,
+        application__applicant=request.user,
+    )
 
-    headers = {
-        "Authorization": f"Bearer {settings.PAYSTACK_SECRET_KEY}",
-    }
+    if payment.status == Payment.STATUS_SUCCESS:
+        messages.success(request, "Payment successful.")
+        return redirect("applications:dashboard")
 
-    response = requests.get(
-        f"{settings.PAYSTACK_VERIFY_URL}{reference}",
-        headers=headers,
-        timeout=10,
-    )
+    if payment.status == Payment.STATUS_PENDING:
+        enqueue_verification(reference)
 
-    data = response.json()
-    payment.gateway_response = data
+        if verification_is_stale(reference):
+            try:
+                verify_reference(reference)
+            except (RetryLater, PaystackError):
+                # Still running at Paystack, or unreachable: keep polling
+                pass
 
-    # -------------------------------------------------
-    # VERIFY RESULT
-    # -------------------------------------------------
-    if data.get("data", {}).get("status") == "success":
-        payment.status = Payment.STATUS_SUCCESS
-        payment.paid_at = timezone.now()
+            payment.refresh_from_db()
+            if payment.status == Payment.STATUS_SUCCESS:
+                messages.success(request, "Payment successful.")
+                return redirect("applications:dashboard")
 
-        application = payment.application
-        application.status = Application.STATUS_PAID
-        application.save(update_fields=["status"])
+    return render(
+        request,
+        "payments/confirming.html",
+        {"payment": payment},
+    )
 
-        messages.success(request, "Payment successful.")
-    else:
-        payment.status = Payment.STATUS_FAILED
-        messages.error(
-            request,
-            "Payment failed or was cancelled."
-        )
 
-    payment.save(
-        update_fields=["status", "paid_at", "gateway_response"]
+# =====================================================
+# PAYMENT STATUS (POLLED — CITIZEN)
+# =====================================================
+@login_required
+@citizen_required
+def payment_status(request, reference):
+    """
+    Cheap poll target for the confirming page: one indexed lookup.
+    """
+    row = (
+        Payment.objects
+        .filter(reference=reference, application__applicant=request.user)
+        .values("status", "application_id")
+        .first()
     )
-    return redirect("applications:dashboard")
+    if row is None:
+        return JsonResponse({"message": "Payment not found."}, status=404)
+
+    if row["status"] == Payment.STATUS_SUCCESS:
+        redirect_url = reverse("applications:dashboard")
+    elif row["status"] == Payment.STATUS_FAILED:
+        redirect_url = reverse("applications:view", args=[row["application_id"]])
+    else:
+        redirect_url = None
+
+    return JsonResponse({"status": row["status"], "redirect": redirect_url})
 
 
 # =====================================================
@@ -187,7 +388,13 @@ def verify_payment(request):
 # =====================================================
 @csrf_exempt
 def paystack_webhook(request):
-    signature = request.headers.get("x-paystack-signature")
+    """
+    Verify the signature, store the event in the inbox, acknowledge.
+
+    • One INSERT; redelivered events are dropped by the unique constraint
+    • Payment / application updates happen in `process_paystack_events`
+    """
+    signature = request.headers.get("x-paystack-signature") or ""
     body = request.body
 
     expected_signature = hmac.new(
@@ -196,33 +403,22 @@ def paystack_webhook(request):
         hashlib.sha512,
     ).hexdigest()
 
-    if signature != expected_signature:
+    if not hmac.compare_digest(signature, expected_signature):
         return HttpResponse(status=400)
 
-    payload = json.loads(body)
-
-    if payload.get("event") == "charge.success":
-        data = payload["data"]
-        reference = data["reference"]
-
-        try:
-            payment = Payment.objects.select_for_update().get(
-                reference=reference
-            )
-        except Payment.DoesNotExist:
-            return HttpResponse(status=200)
-
-        if payment.status == Payment.STATUS_SUCCESS:
-            return HttpResponse(status=200)  # idempotent
+    try:
+        payload = json.loads(body)
+        event = str(payload["event"])
+    except (ValueError, KeyError, TypeError):
+        return HttpResponse(status=400)
 
-        payment.status = Payment.STATUS_SUCCESS
-        payment.paid_at = timezone.now()
-        payment.gateway_response = payload
-        payment.save()
+    data = payload.get("data") or {}
+    reference = str(data.get("reference") or "") if isinstance(data, dict) else ""
 
-        application = payment.application
-        application.status = Application.STATUS_PAID
-        application.save(update_fields=["status"])
+    PaystackEvent.objects.bulk_create(
+        [PaystackEvent(event=event, reference=reference, payload=payload)],
+        ignore_conflicts=True,
+    )
 
     return HttpResponse(status=200)
 
@@ -233,12 +429,10 @@ def paystack_webhook(request):
 @login_required
 @citizen_required
 def payment_receipt(request, payment_id):
-    payment = get_object_or_404(
-        Payment,
-        id=payment_id,
-        status=Payment.STATUS_SUCCESS,
-        application__applicant=request.user,
-    )
+    # Receipts of archived applications come from the archive snapshot
+    payment = find_payment(payment_id, request.user, status=Payment.STATUS_SUCCESS)
+    if payment is None:
+        raise Http404("Receipt not found")
 
     return render(
         request,
@@ -78,6 +78,15 @@ SECURE_CONTENT_TYPE_NOSNIFF = True
 
 IDLE_TIMEOUT = 300  # 5 minutes
 
+# Idle tracking rewrites the session at most this often (seconds); an
+# idle user may be logged out up to this much before IDLE_TIMEOUT
+IDLE_ACTIVITY_GRANULARITY = int(os.getenv("IDLE_ACTIVITY_GRANULARITY", 60))
+
+# Cached user snapshot behind request.user (seconds). Saves invalidate it
+# through the shared cache, so it is only used when CACHE_BACKEND is
+# shared (Redis, memcached, ...); with locmem every request loads the user.
+USER_SNAPSHOT_TTL = int(os.getenv("USER_SNAPSHOT_TTL", 60))
+
 
 # =====================================================
 # APPLICATIONS
@@ -113,7 +122,7 @@ MIDDLEWARE = [
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.accounts.middleware.CachedAuthenticationMiddleware",
     "apps.accounts.middleware.IdleTimeoutMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -124,9 +133,14 @@ MIDDLEWARE = [
 # =====================================================
 # AUTHENTICATION
 # =====================================================
+# Axes lockout check, then one user query by email (or username for
+# the admin); EmailBackend also serves permissions and sessions.
 AUTHENTICATION_BACKENDS = [
     "axes.backends.AxesStandaloneBackend",
     "apps.accounts.auth_backends.EmailBackend",
+    # Sessions from before EmailBackend stored ModelBackend as their
+    # backend; keep it listed for one release so they stay logged in.
+    # Listed last, it only runs for a login EmailBackend did not match.
     "django.contrib.auth.backends.ModelBackend",
 ]
 
@@ -162,6 +176,47 @@ DATABASES = {
         default=os.environ.get("DATABASE_URL")
     )
 }
+# =====================================================
+# CACHE
+# =====================================================
+# Local memory by default; point CACHE_BACKEND / CACHE_LOCATION at a
+# shared backend (e.g. Redis or memcached) in production.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND",
+            "django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", "lgac-portal"),
+    },
+    # Sessions get their own alias so NIN / checkout keys never evict them
+    "sessions": {
+        "BACKEND": os.getenv(
+            "SESSION_CACHE_BACKEND",
+            os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        ),
+        "LOCATION": os.getenv(
+            "SESSION_CACHE_LOCATION",
+            os.getenv("CACHE_LOCATION", "lgac-sessions"),
+        ),
+        "KEY_PREFIX": "sessions",
+    },
+}
+
+# =====================================================
+# SESSIONS
+# =====================================================
+# Database sessions by default. With a shared session cache (Redis or
+# memcached) use:
+#   django.contrib.sessions.backends.cached_db  reads from the cache,
+#                                              writes through to the table
+#   django.contrib.sessions.backends.cache      no session table at all
+# A per-process locmem cache is only safe for single-process tests; the
+# file engine shares sessions between local workers.
+# Expired rows: `manage.py clear_expired_sessions` (batched).
+SESSION_ENGINE = os.getenv("SESSION_ENGINE", "django.contrib.sessions.backends.db")
+SESSION_CACHE_ALIAS = "sessions"
+
 # =====================================================
 # PASSWORD VALIDATION
 # =====================================================
@@ -203,6 +258,7 @@ AXES_FAILURE_LIMIT = 5
 AXES_LOCK_OUT_AT_FAILURE = True
 AXES_COOLOFF_TIME = 1  # hour
 AXES_RESET_ON_SUCCESS = True
+AXES_USERNAME_CALLABLE = "apps.accounts.auth_backends.axes_username"
 
 AXES_EXCLUDE_URLS = [
     r"^/accounts/verify-nin/$",
@@ -213,14 +269,25 @@ AXES_EXCLUDE_URLS = [
 # =====================================================
 VERIFYME_API_KEY = os.getenv("VERIFYME_API_KEY")
 
+# Overridable so load tests can point at `manage.py fake_gateways`
+VERIFYME_BASE_URL = os.getenv("VERIFYME_BASE_URL", "https://api.verifyme.ng")
+VERIFYME_NIN_URL = os.getenv("VERIFYME_NIN_URL", f"{VERIFYME_BASE_URL}/v1/verifications/nin")
+VERIFYME_TIMEOUT = int(os.getenv("VERIFYME_TIMEOUT", 15))
+
+# NIN verification outcomes cached by keyed hash (seconds)
+NIN_CACHE_TTL = int(os.getenv("NIN_CACHE_TTL", 24 * 60 * 60))
+NIN_NEGATIVE_CACHE_TTL = int(os.getenv("NIN_NEGATIVE_CACHE_TTL", 5 * 60))
+NIN_FAILURE_CACHE_TTL = int(os.getenv("NIN_FAILURE_CACHE_TTL", 15))
+
 # =====================================================
 # PAYSTACK
 # =====================================================
 PAYSTACK_PUBLIC_KEY = os.getenv("PAYSTACK_PUBLIC_KEY")
 PAYSTACK_SECRET_KEY = os.getenv("PAYSTACK_SECRET_KEY")
 
-PAYSTACK_INIT_URL = "https://api.paystack.co/transaction/initialize"
-PAYSTACK_VERIFY_URL = "https://api.paystack.co/transaction/verify/"
+PAYSTACK_BASE_URL = os.getenv("PAYSTACK_BASE_URL", "https://api.paystack.co")
+PAYSTACK_INIT_URL = os.getenv("PAYSTACK_INIT_URL", f"{PAYSTACK_BASE_URL}/transaction/initialize")
+PAYSTACK_VERIFY_URL = os.getenv("PAYSTACK_VERIFY_URL", f"{PAYSTACK_BASE_URL}/transaction/verify/")
 
 # =====================================================
 # EMAIL
@@ -245,6 +312,10 @@ LOGGING = {
         "handlers": ["console"],
         "level": "INFO",
     },
+    "loggers": {
+        # One line per request; our clients already log failures
+        "httpx": {"level": "WARNING"},
+    },
 }
 
 
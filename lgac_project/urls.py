@@ -13,6 +13,9 @@ urlpatterns = [
     path("payments/", include("apps.payments.urls")),
     path("lga/", include("apps.lga.urls")),
 
+    # 📱 JSON read API (mobile app / USSD gateway)
+    path("api/v1/", include("apps.applications.api_urls")),
+
     # 🔐 Certificate verification (public)
     path(
         "verify/<str:hash_value>/",
@@ -0,0 +1,112 @@
+// Autosaves the application form into a DRAFT as the citizen types.
+// Changed fields are batched (debounced) and sent as one JSON PATCH;
+// only one request is in flight at a time, so saves arrive in order.
+(function () {
+    const script = document.currentScript;
+    const draftUrl = script.dataset.draftUrl;
+
+    const FIELDS = [
+        "lga",
+        "place_of_birth",
+        "date_of_birth",
+        "home_town",
+        "family_compound",
+        "father_name",
+        "mother_name",
+        "purpose",
+        "passport_key",
+    ];
+    const DEBOUNCE_MS = 1500;
+    const RETRY_MS = 10000;
+
+    const statusText = document.getElementById("draftStatus");
+    const csrfInput = document.querySelector("[name=csrfmiddlewaretoken]");
+    const lgaInput = document.getElementById("id_lga");
+
+    let pending = {};
+    let timer = null;
+    let inFlight = false;
+
+    function setStatus(message, cls) {
+        if (statusText) {
+            statusText.textContent = message;
+            statusText.className = "form-text " + cls;
+        }
+    }
+
+    function schedule(delay) {
+        clearTimeout(timer);
+        timer = setTimeout(flush, delay);
+    }
+
+    function flush() {
+        // A draft can only start once an LGA is chosen
+        if (inFlight || !Object.keys(pending).length || !lgaInput.value) {
+            return;
+        }
+
+        const body = pending;
+        pending = {};
+        inFlight = true;
+        setStatus("Saving draft...", "text-muted");
+
+        fetch(draftUrl, {
+            method: "PATCH",
+            headers: {
+                "Content-Type": "application/json",
+                "X-CSRFToken": csrfInput.value,
+            },
+            body: JSON.stringify(body),
+        })
+            .then(response => {
+                if (response.status === 400) {
+                    // Invalid values are reported on final submit
+                    setStatus("Draft not saved: please check your entries.", "text-warning");
+                    return;
+                }
+                if (!response.ok) {
+                    throw new Error("autosave failed");
+                }
+                setStatus("Draft saved.", "text-success");
+            })
+            .catch(error => {
+                console.error(error);
+                // Put the fields back unless newer edits replaced them
+                pending = Object.assign(body, pending);
+                setStatus("Offline – your draft will be saved when the connection returns.", "text-warning");
+                schedule(RETRY_MS);
+            })
+            .finally(() => {
+                inFlight = false;
+                if (Object.keys(pending).length) {
+                    schedule(DEBOUNCE_MS);
+                }
+            });
+    }
+
+    FIELDS.forEach(name => {
+        const input = document.getElementById("id_" + name);
+        if (!input) {
+            return;
+        }
+
+        ["input", "change"].forEach(event => {
+            input.addEventListener(event, function () {
+                pending[name] = input.value;
+                schedule(DEBOUNCE_MS);
+            });
+        });
+    });
+
+    if (lgaInput) {
+        // Fields typed before the LGA was chosen are sent with it
+        lgaInput.addEventListener("change", function () {
+            FIELDS.forEach(name => {
+                const input = document.getElementById("id_" + name);
+                if (input && input.value) {
+                    pending[name] = input.value;
+                }
+            });
+        });
+    }
+})();
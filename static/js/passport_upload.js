@@ -0,0 +1,95 @@
+// Uploads the passport photo straight to object storage (presigned POST)
+// and submits only the resulting key with the application form.
+// Falls back to a normal form upload if direct upload is unavailable.
+(function () {
+    const script = document.currentScript;
+    const uploadUrl = script.dataset.uploadUrl;
+
+    const fileInput = document.getElementById("id_passport_photo");
+    const keyInput = document.getElementById("id_passport_key");
+    const statusText = document.getElementById("passportStatus");
+    const submitBtn = document.getElementById("submitBtn");
+    const csrfInput = document.querySelector("[name=csrfmiddlewaretoken]");
+
+    const MAX_BYTES = 2 * 1024 * 1024;
+    const TYPES = ["image/jpeg", "image/png"];
+
+    if (!fileInput || !keyInput) {
+        return;
+    }
+
+    if (keyInput.value) {
+        fileInput.required = false;
+        statusText.textContent = "Photo already uploaded. Choose a file only to replace it.";
+        statusText.className = "form-text text-success";
+    }
+
+    function setStatus(message, cls) {
+        statusText.textContent = message;
+        statusText.className = "form-text " + cls;
+    }
+
+    function fallBack() {
+        // Leave the file in the input; it will be sent with the form
+        keyInput.value = "";
+        submitBtn.disabled = false;
+        setStatus("JPEG/PNG only. Maximum size 2MB.", "text-muted");
+    }
+
+    fileInput.addEventListener("change", function () {
+        const file = fileInput.files[0];
+        if (!file) {
+            return;
+        }
+
+        if (!TYPES.includes(file.type)) {
+            setStatus("Passport photo must be JPEG or PNG.", "text-danger");
+            return;
+        }
+        if (file.size > MAX_BYTES) {
+            setStatus("Passport photo must not exceed 2MB.", "text-danger");
+            return;
+        }
+
+        submitBtn.disabled = true;
+        setStatus("Uploading photo...", "text-warning");
+
+        const request = new FormData();
+        request.append("content_type", file.type);
+
+        fetch(uploadUrl, {
+            method: "POST",
+            headers: { "X-CSRFToken": csrfInput.value },
+            body: request,
+        })
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error("presign unavailable");
+                }
+                return response.json();
+            })
+            .then(upload => {
+                const body = new FormData();
+                Object.entries(upload.fields).forEach(([name, value]) => {
+                    body.append(name, value);
+                });
+                body.append("file", file);
+
+                return fetch(upload.url, { method: "POST", body: body })
+                    .then(response => {
+                        if (!response.ok) {
+                            throw new Error("bucket upload failed");
+                        }
+                        keyInput.value = upload.key;
+                        keyInput.dispatchEvent(new Event("change"));
+                        fileInput.value = "";
+                        submitBtn.disabled = false;
+                        setStatus("Photo uploaded.", "text-success");
+                    });
+            })
+            .catch(error => {
+                console.error(error);
+                fallBack();
+            });
+    });
+})();